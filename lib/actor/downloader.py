@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import xbmc
 import xbmcvfs
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from lib.kodi.client import log, request, extract_result, decode_image_url, get_item_details, ADDON
 from lib.kodi.utilities import extract_media_ids
@@ -12,6 +12,9 @@ from lib.download.artwork import DownloadArtwork
 from lib.actor.config import sanitize_actor_filename
 from lib.infrastructure.paths import vfs_join, vfs_ensure_dir_slash, build_actors_folder_path
 
+if TYPE_CHECKING:
+    from lib.data.api.person import CreditIndex
+
 
 def get_cast_with_ids(media_type: str, dbid: int) -> Tuple[List[Dict], Dict[str, Optional[str]]]:
     """Get cast list and media IDs for a movie or tvshow from Kodi JSON-RPC."""
@@ -61,9 +64,9 @@ def _get_tmdb_credits(media_type: str, tmdb_id: str) -> List[Dict]:
 def _match_actor_to_profile(
     actor_name: str,
     actor_role: str,
-    tmdb_credits: List[Dict]
+    tmdb_credits: CreditIndex
 ) -> Optional[str]:
-    """Match Kodi actor to TMDB cast member via 4-stage matching."""
+    """Match Kodi actor to TMDB cast member via 4-stage matching against a prebuilt index."""
     from lib.data.api.person import (
         exact_match,
         fuzzy_role_match,
@@ -141,10 +144,12 @@ def download_actor_images(
             return downloaded, skipped, failed
         log("Artwork", f"Created .actors folder: {actors_folder}", xbmc.LOGDEBUG)
 
-    tmdb_credits: List[Dict] = []
+    from lib.data.api.person import CreditIndex
+
+    tmdb_credits = CreditIndex([])
     tmdb_id = media_ids.get("tmdb")
     if tmdb_id:
-        tmdb_credits = _get_tmdb_credits(media_type, tmdb_id)
+        tmdb_credits = CreditIndex(_get_tmdb_credits(media_type, tmdb_id))
         if tmdb_credits:
             log("Artwork", f"Got {len(tmdb_credits)} cast members from TMDB", xbmc.LOGDEBUG)
 
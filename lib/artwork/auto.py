@@ -1,17 +1,23 @@
 """Auto-apply missing artwork from queue.
 
 Processes queue items and automatically applies artwork based on language policies.
+Runs as a pipeline: a worker pool fetches available artwork for upcoming queue entries,
+the calling thread makes every selection decision, and decided items are written to the
+library with one batched JSON-RPC call and committed to the queue in one transaction.
 """
 from __future__ import annotations
 
 import xbmc
 from lib.infrastructure.dialogs import show_ok, show_textviewer
 import xbmcgui
-from typing import Optional, List, Sequence
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Dict, Optional, List, Sequence, Tuple
 
 from lib.data import database as db
-from lib.data.database.queue import QueueEntry
-from lib.kodi.client import request, get_item_details, KODI_SET_DETAILS_METHODS
+from lib.data.database.queue import ArtItemEntry, QueueEntry
+from lib.infrastructure.workers import WorkerQueue
+from lib.kodi.client import batch_request, request, get_item_details, KODI_SET_DETAILS_METHODS
 from lib.kodi.settings import KodiSettings
 from lib.kodi.utilities import get_preferred_language_code, normalize_language_tag
 from lib.artwork.utilities import compare_art_quality, sort_artwork_by_popularity
@@ -23,6 +29,43 @@ from lib.infrastructure.dialogs import ProgressDialog
 from lib.kodi.client import log, ADDON
 
 DEFAULT_BATCH_SIZE = 100
+# Concurrent provider fetches; the API client rate-limits each provider across threads.
+FETCH_WORKER_COUNT = 4
+# Decided items written to the library and committed to the queue together.
+APPLY_BATCH_SIZE = 25
+
+
+@dataclass
+class _Decision:
+    """Outcome of the decision stage for one queue entry."""
+    queue_item: QueueEntry
+    art: Dict[str, str] = field(default_factory=dict)
+    art_updates: List[Tuple[int, str]] = field(default_factory=list)
+    skip_reason: int = 0
+    error: bool = False
+
+
+class _SourceFetchQueue(WorkerQueue):
+    """Fetches available artwork for queue entries ahead of the decision stage.
+
+    Each finished entry is put on `fetched` as `(queue_item, available_art, error)`.
+    """
+
+    def __init__(self, source_fetcher: ApiArtworkFetcher, fetched: Queue,
+                 num_workers: int, abort_flag=None):
+        super().__init__(num_workers=num_workers, abort_flag=abort_flag,
+                         result_retention='none')
+        self.source_fetcher = source_fetcher
+        self.fetched = fetched
+
+    def _process_item(self, item: QueueEntry, worker_id: int) -> Optional[Dict]:
+        try:
+            available = self.source_fetcher.fetch_all(item.media_type, item.dbid)
+        except Exception as e:
+            self.fetched.put((item, None, e))
+            return {'success': False, 'error': str(e)}
+        self.fetched.put((item, available, None))
+        return {'success': True}
 
 
 class ArtworkAuto:
@@ -36,6 +79,7 @@ class ArtworkAuto:
         enable_download: bool = False,
         abort_flag=None,
         task_context=None,
+        fetch_workers: int = FETCH_WORKER_COUNT,
     ):
         self.progress = ProgressDialog(
             use_background=use_background, heading=ADDON.getLocalizedString(32072))
@@ -48,6 +92,7 @@ class ArtworkAuto:
         self.enable_download = enable_download
         self._abort_flag = abort_flag
         self._task_context = task_context
+        self.fetch_workers = max(1, fetch_workers)
         self.stats = {
             'processed': 0,
             'auto_applied': 0,
@@ -124,27 +169,21 @@ class ArtworkAuto:
 
         self.progress.create(ADDON.getLocalizedString(32278))
 
+        fetched: Queue = Queue()
+        fetch_queue = _SourceFetchQueue(
+            self.source_fetcher, fetched, self.fetch_workers, abort_flag=self._abort_flag)
+        fetch_queue.start()
+
         try:
-            while True:
+            while not self.cancelled:
                 batch = db.get_next_batch(batch_size, media_types=self.media_filter)
                 if not batch:
                     break
-
-                for item in batch:
-                    if self._is_cancelled():
-                        self.cancelled = True
-                        break
-
-                    self._process_item(item)
-                    self._update_progress()
-                    if self._task_context is not None:
-                        self._task_context.mark_progress()
-
-                if self.cancelled:
-                    break
+                self._process_batch(batch, fetch_queue, fetched)
 
             self._update_progress(force=True)
         finally:
+            fetch_queue.stop(wait=not self.cancelled)
             self.progress.close()
             if self._downloader is not None:
                 self._downloader.close()
@@ -168,80 +207,168 @@ class ArtworkAuto:
         except Exception as e:
             log("Artwork", f"Slideshow pool reconcile failed: {str(e)}", xbmc.LOGWARNING)
 
-    def _process_item(self, queue_item: QueueEntry) -> None:
-        """Process single queue item."""
+    def _process_batch(self, batch: List[QueueEntry], fetch_queue: _SourceFetchQueue,
+                       fetched: Queue) -> None:
+        """Fetch sources for `batch` concurrently, deciding and committing as results arrive.
+
+        Every entry that gets decided also gets a final status, so the next `get_next_batch`
+        moves on. On cancellation, already decided entries are still committed.
+        """
+        art_items_by_queue = db.get_art_items_for_queue_batch([item.id for item in batch])
         try:
-            media_type = queue_item.media_type
-            dbid = queue_item.dbid
-            title = queue_item.title
+            self.source_fetcher.hydrate(batch)
+        except Exception as e:
+            log("Artwork", f"Artwork cache hydration failed: {str(e)}", xbmc.LOGWARNING)
+        for item in batch:
+            fetch_queue.add_item(item, dedupe_key=item.id)
 
-            art_items = db.get_art_items_for_queue(queue_item.id)
+        monitor = xbmc.Monitor()
+        decided: List[_Decision] = []
+        remaining = len(batch)
 
-            all_available_art = self.source_fetcher.fetch_all(media_type, dbid)
+        try:
+            while remaining:
+                if self._is_cancelled() or monitor.abortRequested():
+                    self.cancelled = True
+                    break
 
-            applied_any = False
-            no_art_available = False
-            blocked_by_policy = False
+                try:
+                    queue_item, available, error = fetched.get(timeout=0.1)
+                except Empty:
+                    continue
+                remaining -= 1
 
-            for art_item in art_items:
-                art_type = art_item.art_type
-                review_mode = art_item.review_mode or db.ARTITEM_REVIEW_MISSING
+                if error is not None:
+                    log("Artwork", f"Error processing item: {str(error)}", xbmc.LOGERROR)
+                    decided.append(_Decision(queue_item, error=True))
+                else:
+                    decided.append(self._decide(
+                        queue_item, art_items_by_queue.get(queue_item.id, []), available or {}))
 
-                # auto-process must never overwrite existing artwork
-                if review_mode != db.ARTITEM_REVIEW_MISSING:
-                    continue
+                if self._task_context is not None:
+                    self._task_context.mark_progress()
 
-                available = all_available_art.get(art_type, [])
+                if len(decided) >= APPLY_BATCH_SIZE:
+                    self._commit(decided)
+                    decided = []
+                    self._update_progress()
+        finally:
+            self._commit(decided)
+            self._update_progress()
 
-                if not available:
-                    no_art_available = True
-                    continue
+    def _decide(self, queue_item: QueueEntry, art_items: List[ArtItemEntry],
+                available_art: Dict[str, List[dict]]) -> _Decision:
+        """Pick artwork for each missing art type of one entry. Touches neither Kodi nor the DB."""
+        decision = _Decision(queue_item)
+        no_art_available = False
+        blocked_by_policy = False
 
-                filtered_candidates = self._filter_candidates_for_mode(art_type, available)
-                if self.mode == 'missing_only' and not filtered_candidates:
-                    blocked_by_policy = True
-                    continue
+        for art_item in art_items:
+            art_type = art_item.art_type
+            review_mode = art_item.review_mode or db.ARTITEM_REVIEW_MISSING
 
-                if self.mode == 'missing_only':
-                    best = self._select_best_candidate(art_type, filtered_candidates)
-                else:
-                    best = compare_art_quality(filtered_candidates)
+            # auto-process must never overwrite existing artwork
+            if review_mode != db.ARTITEM_REVIEW_MISSING:
+                continue
 
-                if best:
-                    self._apply_art(media_type, dbid, {art_type: best['url']}, title=title,
-                                    artwork_type=art_type, defer_pool_refresh=True)
-                    db.update_art_item(art_item.id, best['url'], auto_applied=True)
-                    applied_any = True
-                    self.stats['auto_applied'] += 1
-                    self.applied_items.append((title, art_type, best['url']))
+            available = available_art.get(art_type, [])
+
+            if not available:
+                no_art_available = True
+                continue
 
-            if applied_any:
-                db.update_queue_status(queue_item.id, 'completed')
+            filtered_candidates = self._filter_candidates_for_mode(art_type, available)
+            if self.mode == 'missing_only' and not filtered_candidates:
+                blocked_by_policy = True
+                continue
+
+            if self.mode == 'missing_only':
+                best = self._select_best_candidate(art_type, filtered_candidates)
             else:
-                db.update_queue_status(queue_item.id, 'skipped')
-                if no_art_available:
-                    self.skipped_items.append((title, ADDON.getLocalizedString(32009)))
-                elif blocked_by_policy:
-                    self.skipped_items.append((title, ADDON.getLocalizedString(32010)))
-                else:
-                    self.skipped_items.append((title, ADDON.getLocalizedString(32011)))
+                best = compare_art_quality(filtered_candidates)
 
-            self.stats['processed'] += 1
-            if not applied_any:
+            if best:
+                decision.art[art_type] = best['url']
+                decision.art_updates.append((art_item.id, best['url']))
+
+        if not decision.art:
+            if no_art_available:
+                decision.skip_reason = 32009
+            elif blocked_by_policy:
+                decision.skip_reason = 32010
+            else:
+                decision.skip_reason = 32011
+
+        return decision
+
+    def _commit(self, decisions: List[_Decision]) -> None:
+        """Apply decided artwork in one batched call, then record every outcome at once."""
+        if not decisions:
+            return
+
+        applies = [d for d in decisions
+                   if d.art and d.queue_item.media_type in KODI_SET_DETAILS_METHODS]
+        for d in decisions:
+            if d.art and d.queue_item.media_type not in KODI_SET_DETAILS_METHODS:
+                d.error = True
+
+        calls = []
+        for d in applies:
+            method, id_key = KODI_SET_DETAILS_METHODS[d.queue_item.media_type]
+            calls.append({'method': method, 'params': {id_key: d.queue_item.dbid, 'art': d.art}})
+
+        for d, resp in zip(applies, batch_request(calls) if calls else []):
+            if resp is None or 'error' in resp:
+                error = resp.get('error') if resp else None
+                log("Artwork",
+                    f"Error applying art to {d.queue_item.media_type} {d.queue_item.dbid}: "
+                    f"{error}", xbmc.LOGERROR)
+                d.error = True
+
+        art_updates: List[Tuple[int, str]] = []
+        statuses: List[Tuple[int, str]] = []
+
+        for d in decisions:
+            title = d.queue_item.title
+            if d.error:
+                statuses.append((d.queue_item.id, 'error'))
+                self.stats['errors'] += 1
+                continue
+
+            if d.art:
+                statuses.append((d.queue_item.id, 'completed'))
+                art_updates.extend(d.art_updates)
+                for art_type, url in d.art.items():
+                    self.stats['auto_applied'] += 1
+                    self.applied_items.append((title, art_type, url))
+            else:
+                statuses.append((d.queue_item.id, 'skipped'))
                 self.stats['skipped'] += 1
+                self.skipped_items.append((title, ADDON.getLocalizedString(d.skip_reason)))
+
+            self.stats['processed'] += 1
 
+        try:
+            db.commit_auto_apply_batch(art_updates, statuses)
         except Exception as e:
-            log("Artwork", f"Error processing item: {str(e)}", xbmc.LOGERROR)
-            self.stats['errors'] += 1
-            db.update_queue_status(queue_item.id, 'error')
+            # Unrecorded entries stay pending and would be fetched and applied again forever.
+            # Called from `_process_batch`'s finally, so don't raise over an in-flight error.
+            log("Artwork", f"Error recording auto-apply results: {str(e)}", xbmc.LOGERROR)
+            self.cancelled = True
+            return
 
-    def _apply_art(self, media_type: str, dbid: int, art_dict: dict, title: str = "",
-                   artwork_type: str = "", defer_pool_refresh: bool = False) -> bool:
-        """Apply artwork to library item and optionally download to filesystem.
+        if self.enable_download:
+            for d in applies:
+                if d.error:
+                    continue
+                for art_type, url in d.art.items():
+                    if url.startswith('http'):
+                        self._download_artwork(d.queue_item.media_type, d.queue_item.dbid,
+                                               art_type, url, d.queue_item.title)
 
-        `defer_pool_refresh` skips the per-item slideshow-pool update (the bulk auto-apply path
-        does one batched reconcile at the end instead).
-        """
+    def _apply_art(self, media_type: str, dbid: int, art_dict: dict, title: str = "",
+                   artwork_type: str = "") -> bool:
+        """Apply artwork to library item and optionally download to filesystem."""
         if media_type not in KODI_SET_DETAILS_METHODS:
             return False
 
@@ -261,8 +388,7 @@ class ArtworkAuto:
                 if url.startswith('http'):
                     self._download_artwork(media_type, dbid, artwork_type, url, title)
 
-            if (not defer_pool_refresh and 'fanart' in art_dict
-                    and media_type in ('movie', 'tvshow', 'artist')):
+            if 'fanart' in art_dict and media_type in ('movie', 'tvshow', 'artist'):
                 from lib.service.slideshow import refresh_pool_item
                 refresh_pool_item(media_type, dbid)
 
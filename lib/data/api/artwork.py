@@ -5,13 +5,17 @@ Handles caching, batch fetching, and dimension normalization.
 """
 from __future__ import annotations
 
+import threading
+
 import xbmc
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Sequence, Tuple
 
 from lib.data import database as db
 from lib.data.api.tmdb import ApiTmdb, transform_tmdb_images
 from lib.data.api.fanarttv import ApiFanarttv
-from lib.kodi.client import get_item_details, KODI_GET_DETAILS_METHODS
+from lib.kodi.client import (
+    batch_request, extract_result, get_item_details, KODI_GET_DETAILS_METHODS,
+)
 from lib.kodi.client import log
 from lib.kodi.utilities import MULTI_VALUE_SEP
 
@@ -36,6 +40,18 @@ class ApiArtworkFetcher:
     def __init__(self, tmdb_api: ApiTmdb, fanart_api: ApiFanarttv):
         self.tmdb_api = tmdb_api
         self.fanart_api = fanart_api
+        # (media_type, dbid) -> (external ids, cached artwork or None); filled by `hydrate`
+        self._hydrated: Dict[Tuple[str, int], Tuple[dict, Optional[Dict[str, List[dict]]]]] = {}
+        self._hydrated_lock = threading.Lock()
+
+    @staticmethod
+    def _external_id_properties(media_type: str) -> List[str]:
+        properties = ['uniqueid']
+        if media_type in ('movie', 'tvshow'):
+            properties.append('premiered')
+        elif media_type == 'episode':
+            properties.append('firstaired')
+        return properties
 
     def get_external_ids(self, media_type: str, dbid: int) -> dict:
         """Get external IDs and release date from Kodi library.
@@ -46,19 +62,16 @@ class ApiArtworkFetcher:
         if media_type not in KODI_GET_DETAILS_METHODS:
             return {}
 
-        properties = ['uniqueid']
-
-        if media_type in ('movie', 'tvshow'):
-            properties.append('premiered')
-        elif media_type == 'episode':
-            properties.append('firstaired')
-
         try:
-            details = get_item_details(media_type, dbid, properties)
+            details = get_item_details(media_type, dbid, self._external_id_properties(media_type))
         except Exception as e:
             log("API", f"Error getting external IDs for {media_type}:{dbid}: {e}", xbmc.LOGERROR)
             return {}
 
+        return self._parse_external_ids(details)
+
+    @staticmethod
+    def _parse_external_ids(details: Any) -> dict:
         if not isinstance(details, dict):
             return {}
 
@@ -83,6 +96,74 @@ class ApiArtworkFetcher:
 
         return result
 
+    def hydrate(self, items: Sequence[Any]) -> int:
+        """Preload external IDs and cached artwork for a batch of queue entries.
+
+        One `batch_request` resolves uniqueids and release dates for every movie and TV show in
+        `items` (anything with `media_type` and `dbid`), and one query per media type loads
+        their completion markers and cached artwork. `fetch_all` then serves those entries
+        without per-item JSON-RPC or database round-trips. Each entry is used once. Returns
+        the number of entries served fully from cache.
+        """
+        targets = list(dict.fromkeys(
+            (item.media_type, item.dbid) for item in items
+            if item.media_type in ('movie', 'tvshow')
+        ))
+        if not targets:
+            return 0
+
+        calls = []
+        for media_type, dbid in targets:
+            method, id_key, _ = KODI_GET_DETAILS_METHODS[media_type]
+            calls.append({'method': method, 'params': {
+                id_key: dbid, 'properties': self._external_id_properties(media_type)}})
+
+        ids_by_item: Dict[Tuple[str, int], dict] = {}
+        for (media_type, dbid), resp in zip(targets, batch_request(calls)):
+            details = extract_result(resp, KODI_GET_DETAILS_METHODS[media_type][2])
+            if isinstance(details, dict):
+                ids_by_item[(media_type, dbid)] = self._parse_external_ids(details)
+
+        from lib.artwork.config import CACHE_ART_TYPES
+        art_types = list(CACHE_ART_TYPES) + ['_full_fetch_complete']
+
+        hydrated: Dict[Tuple[str, int], Tuple[dict, Optional[Dict[str, List[dict]]]]] = {}
+        for media_type in ('movie', 'tvshow'):
+            typed = {key: ids for key, ids in ids_by_item.items() if key[0] == media_type}
+            media_ids = []
+            for ids in typed.values():
+                if ids.get('tmdb_id'):
+                    media_ids.append(str(ids['tmdb_id']))
+                if ids.get('tvdb_id'):
+                    media_ids.append(str(ids['tvdb_id']))
+            rows = (db.get_cached_artwork_for_ids(media_type, media_ids, art_types)
+                    if media_ids else {})
+
+            for key, ids in typed.items():
+                tmdb_id = ids.get('tmdb_id')
+                tvdb_id = ids.get('tvdb_id')
+                cached_art = None
+                if tmdb_id and '_full_fetch_complete' in rows.get(('system', str(tmdb_id)), {}):
+                    cache_id = (str(tvdb_id) if tvdb_id and media_type == 'tvshow'
+                                else str(tmdb_id))
+                    cached_art = {}
+                    for source_key in (('tmdb', str(tmdb_id)), ('fanarttv', cache_id)):
+                        for art_type, artworks in rows.get(source_key, {}).items():
+                            if art_type in CACHE_ART_TYPES:
+                                cached_art.setdefault(art_type, []).extend(artworks)
+                hydrated[key] = (ids, cached_art)
+
+        with self._hydrated_lock:
+            self._hydrated.update(hydrated)
+
+        return sum(1 for _, art in hydrated.values() if art is not None)
+
+    def _take_hydrated(
+        self, media_type: str, dbid: int,
+    ) -> Optional[Tuple[dict, Optional[Dict[str, List[dict]]]]]:
+        with self._hydrated_lock:
+            return self._hydrated.pop((media_type, dbid), None)
+
     def fetch_all(
         self, media_type: str, dbid: int, season_number: Optional[int] = None,
         episode_number: Optional[int] = None, bypass_cache: bool = False,
@@ -108,7 +189,8 @@ class ApiArtworkFetcher:
         elif media_type not in ('movie', 'tvshow'):
             return {}
 
-        ids = self.get_external_ids(media_type, dbid)
+        hydrated = self._take_hydrated(media_type, dbid)
+        ids = hydrated[0] if hydrated else self.get_external_ids(media_type, dbid)
         tmdb_id = ids.get('tmdb_id')
         tvdb_id = ids.get('tvdb_id')
         release_date = ids.get('release_date')
@@ -119,7 +201,10 @@ class ApiArtworkFetcher:
         ttl_hours = db.get_cache_ttl_hours(release_date)
         cache_marker_type = '_full_fetch_complete'
 
-        if not bypass_cache:
+        if hydrated and not bypass_cache:
+            if hydrated[1] is not None:
+                return self._finalise_artwork(media_type, hydrated[1])
+        elif not bypass_cache:
             cached_marker = db.get_cached_artwork(
                 media_type, str(tmdb_id), 'system', cache_marker_type
             )
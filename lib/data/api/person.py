@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import xbmc
 import xbmcgui
@@ -244,25 +244,27 @@ def match_actor_to_person_id(actor_name: str, actor_role: str, tmdb_id: int, dbt
 
         credits = complete_data['credits'].get('cast', [])
 
-    match = exact_match(credits, actor_name, actor_role)
+    index = CreditIndex(credits)
+
+    match = exact_match(index, actor_name, actor_role)
     if match:
         log("Person", f"Matched '{actor_name}' via exact match (person_id={match['id']})",
             xbmc.LOGDEBUG)
         return match['id']
 
-    match = fuzzy_role_match(credits, actor_name, actor_role)
+    match = fuzzy_role_match(index, actor_name, actor_role)
     if match:
         log("Person", f"Matched '{actor_name}' via fuzzy role (person_id={match['id']})",
             xbmc.LOGDEBUG)
         return match['id']
 
-    match = name_only_match(credits, actor_name)
+    match = name_only_match(index, actor_name)
     if match:
         log("Person", f"Matched '{actor_name}' via name only (person_id={match['id']})",
             xbmc.LOGDEBUG)
         return match['id']
 
-    match = fuzzy_name_match(credits, actor_name)
+    match = fuzzy_name_match(index, actor_name)
     if match:
         log("Person", f"Matched '{actor_name}' via fuzzy name (person_id={match['id']})",
             xbmc.LOGDEBUG)
@@ -310,52 +312,85 @@ def normalize_name(name: str) -> str:
     return normalized.strip()
 
 
-def exact_match(credits: list, name: str, role: str) -> Optional[dict]:
+def _token_key(lowered_name: str) -> Tuple[str, ...]:
+    """Order-independent token signature, shared by 'First Last' and 'Last First'."""
+    return tuple(sorted(lowered_name.split()))
+
+
+class CreditIndex:
+    """Lookup tables over one TMDB cast list, built once and shared by every matching pass.
+
+    Each credit's name is normalized once. Matching passes then look up a small candidate
+    list instead of re-normalizing and scanning the whole cast for every library actor.
+    Candidate lists keep credit order, so results are the same as a linear scan.
+    """
+
+    def __init__(self, credits: list):
+        self.credits = credits
+        self._by_name: Dict[str, List[dict]] = {}
+        self._by_name_role: Dict[Tuple[str, str], dict] = {}
+        self._by_tokens: Dict[Tuple[str, ...], List[Tuple[str, dict]]] = {}
+
+        for actor in credits:
+            raw_name = actor.get('name', '')
+            normalized = normalize_name(raw_name)
+            self._by_name.setdefault(normalized, []).append(actor)
+            self._by_name_role.setdefault((normalized, actor.get('character')), actor)
+
+            lowered = raw_name.lower().strip()
+            self._by_tokens.setdefault(_token_key(lowered), []).append((lowered, actor))
+
+    def __len__(self) -> int:
+        return len(self.credits)
+
+    def by_name(self, normalized_name: str) -> List[dict]:
+        """Credits whose normalized name equals `normalized_name`, in credit order."""
+        return self._by_name.get(normalized_name, [])
+
+    def by_name_role(self, normalized_name: str, role: str) -> Optional[dict]:
+        """First credit with this normalized name and exactly this character."""
+        return self._by_name_role.get((normalized_name, role))
+
+    def by_tokens(self, lowered_name: str) -> List[Tuple[str, dict]]:
+        """`(lowered_name, credit)` entries sharing the name's token signature."""
+        return self._by_tokens.get(_token_key(lowered_name), [])
+
+
+def _as_index(credits: Union[list, CreditIndex]) -> CreditIndex:
+    return credits if isinstance(credits, CreditIndex) else CreditIndex(credits)
+
+
+def exact_match(credits: Union[list, CreditIndex], name: str, role: str) -> Optional[dict]:
     """Match exact name and exact role."""
-    normalized_name = normalize_name(name)
-    for actor in credits:
-        actor_name = actor.get('name', '')
-        normalized_actor = normalize_name(actor_name)
-        if normalized_actor == normalized_name and actor.get('character') == role:
-            return actor
-    return None
+    return _as_index(credits).by_name_role(normalize_name(name), role)
 
 
-def fuzzy_role_match(credits: list, name: str, role: str) -> Optional[dict]:
+def fuzzy_role_match(credits: Union[list, CreditIndex], name: str,
+                     role: str) -> Optional[dict]:
     """Match exact name with fuzzy role (substring)."""
     if not role:
         return None
 
-    normalized_name = normalize_name(name)
     role_lower = role.lower()
-    for actor in credits:
-        actor_name = actor.get('name', '')
-        normalized_actor = normalize_name(actor_name)
-        if normalized_actor == normalized_name:
-            character = actor.get('character', '').lower()
-            if role_lower in character or character in role_lower:
-                return actor
+    for actor in _as_index(credits).by_name(normalize_name(name)):
+        character = actor.get('character', '').lower()
+        if role_lower in character or character in role_lower:
+            return actor
     return None
 
 
-def name_only_match(credits: list, name: str) -> Optional[dict]:
+def name_only_match(credits: Union[list, CreditIndex], name: str) -> Optional[dict]:
     """Match name only, ignore role."""
-    normalized_name = normalize_name(name)
-    for actor in credits:
-        actor_name = actor.get('name', '')
-        normalized_actor = normalize_name(actor_name)
-        if normalized_actor == normalized_name:
-            return actor
-    return None
+    candidates = _as_index(credits).by_name(normalize_name(name))
+    return candidates[0] if candidates else None
 
 
-def fuzzy_name_match(credits: list, name: str) -> Optional[dict]:
+def fuzzy_name_match(credits: Union[list, CreditIndex], name: str) -> Optional[dict]:
     """Match with name variations (handle 'First Last' vs 'Last, First')."""
     name_lower = name.lower().strip()
     name_reversed = ' '.join(reversed(name.split())).lower()
 
-    for actor in credits:
-        actor_name = actor.get('name', '').lower().strip()
+    for actor_name, actor in _as_index(credits).by_tokens(name_lower):
         if actor_name == name_lower or actor_name == name_reversed:
             return actor
     return None
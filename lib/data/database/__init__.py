@@ -7,18 +7,29 @@ Unified database containing:
 - IMDb dataset storage and lookups
 - Ratings provider caching and API usage tracking
 - Slideshow pool management
+- Artwork color palettes
+- Actor role index
+- Movie stinger index
+- Artwork download manifest
+- Texture cache disk-usage snapshot
 - ID correction cache
 
 Modules:
 - _infrastructure: Database connections and schema
 - cache: API response caching and TTL management
+- cache_gc: Incremental cache garbage collection and size budget
 - correction: TMDB/IMDB ID correction cache
+- download_manifest: Record of downloaded artwork files for incremental downloads
 - gif: GIF scan cache
 - imdb: IMDb dataset operations (ratings, episodes, metadata)
 - music: Music metadata cache (AudioDB/Last.fm, separate DB)
+- palette: Artwork color palette cache
+- person_index: Actor -> library role index for person widgets
 - queue: Queue CRUD operations for artwork workflow
 - rating: Ratings API usage tracking and provider caching
 - slideshow: Slideshow pool operations
+- stinger: Precomputed movie stinger index
+- texture_usage: Per-folder snapshot of Kodi's thumbnail cache disk usage
 - workflow: Session and operation history tracking
 """
 from lib.data.database._infrastructure import (
@@ -34,6 +45,8 @@ from lib.data.database.cache import (
     get_fanarttv_cache_ttl_hours,
     get_cached_artwork,
     get_cached_artwork_batch,
+    get_cached_artwork_for_ids,
+    get_cached_artwork_bulk,
     cache_artwork,
     get_cached_metadata,
     cache_metadata,
@@ -63,6 +76,7 @@ from lib.data.database.queue import (
     update_queue_status,
     update_art_item,
     update_art_item_status,
+    commit_auto_apply_batch,
     get_queue_stats,
     count_queue_items,
     count_pending_missing_art,
@@ -83,13 +97,19 @@ from lib.data.database.workflow import (
 )
 
 # New modules exported as namespaces (callers use e.g. `from lib.data.database import imdb`)
+from lib.data.database import cache_gc  # noqa: F401
 from lib.data.database import correction  # noqa: F401
+from lib.data.database import download_manifest  # noqa: F401
 from lib.data.database import gif  # noqa: F401
 from lib.data.database import imdb  # noqa: F401
 from lib.data.database import music  # noqa: F401
+from lib.data.database import palette  # noqa: F401
+from lib.data.database import person_index  # noqa: F401
 from lib.data.database import rating  # noqa: F401
 from lib.data.database import runtime  # noqa: F401
 from lib.data.database import slideshow  # noqa: F401
+from lib.data.database import stinger  # noqa: F401
+from lib.data.database import texture_usage  # noqa: F401
 
 __all__ = [
     'DB_PATH',
@@ -101,6 +121,8 @@ __all__ = [
     'get_fanarttv_cache_ttl_hours',
     'get_cached_artwork',
     'get_cached_artwork_batch',
+    'get_cached_artwork_for_ids',
+    'get_cached_artwork_bulk',
     'cache_artwork',
     'get_cached_metadata',
     'cache_metadata',
@@ -127,6 +149,7 @@ __all__ = [
     'update_queue_status',
     'update_art_item',
     'update_art_item_status',
+    'commit_auto_apply_batch',
     'get_queue_stats',
     'count_queue_items',
     'count_pending_missing_art',
@@ -141,11 +164,17 @@ __all__ = [
     'get_last_manual_review_session',
     'save_operation_stats',
     'get_last_operation_stats',
+    'cache_gc',
     'correction',
+    'download_manifest',
     'gif',
     'imdb',
     'music',
+    'palette',
+    'person_index',
     'rating',
     'runtime',
     'slideshow',
+    'stinger',
+    'texture_usage',
 ]
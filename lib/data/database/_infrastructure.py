@@ -5,7 +5,9 @@ Core infrastructure shared across all database modules.
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import time
 import uuid
 import zlib
 import xbmc
@@ -14,7 +16,7 @@ from contextlib import contextmanager
 from typing import Any, Generator
 from lib.kodi.client import log
 
-DB_VERSION = 4
+DB_VERSION = 5
 
 
 def compress_data(data: Any) -> bytes:
@@ -209,8 +211,8 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
             art_type TEXT NOT NULL,
             data TEXT NOT NULL,
             release_date TEXT,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            expires_at TEXT NOT NULL,
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+            expires_at INTEGER NOT NULL,
             UNIQUE(media_type, media_id, source, art_type)
         )
     ''')
@@ -222,8 +224,8 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
             tmdb_id TEXT NOT NULL,
             data BLOB NOT NULL,
             release_date TEXT,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            expires_at TEXT NOT NULL,
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+            expires_at INTEGER NOT NULL,
             UNIQUE(media_type, tmdb_id)
         )
     ''')
@@ -242,8 +244,8 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
             tmdb_id TEXT NOT NULL,
             season_number INTEGER NOT NULL,
             data BLOB NOT NULL,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            expires_at TEXT NOT NULL,
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+            expires_at INTEGER NOT NULL,
             PRIMARY KEY (tmdb_id, season_number)
         )
     ''')
@@ -252,8 +254,8 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
         CREATE TABLE IF NOT EXISTS tmdb_genre_cache (
             tmdb_type TEXT PRIMARY KEY,
             data BLOB NOT NULL,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            expires_at TEXT NOT NULL
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+            expires_at INTEGER NOT NULL
         )
     ''')
 
@@ -304,6 +306,9 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
         'ON session_art_types(session_id, art_type)'
     )
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_cache_expires ON artwork_cache(expires_at)')
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_metadata_cache_expires ON metadata_cache(expires_at)'
+    )
     cursor.execute(
         'CREATE INDEX IF NOT EXISTS idx_season_metadata_cache_expires '
         'ON season_metadata_cache(expires_at)'
@@ -322,7 +327,7 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
             media_id TEXT NOT NULL,
             data BLOB NOT NULL,
             release_date TEXT,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
             PRIMARY KEY (provider, media_id)
         )
     ''')
@@ -332,7 +337,7 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
             imdb_id TEXT PRIMARY KEY,
             tmdb_id INTEGER NOT NULL,
             media_type TEXT NOT NULL,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now'))
         )
     ''')
 
@@ -458,19 +463,21 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
         CREATE TABLE IF NOT EXISTS online_properties_cache (
             item_key TEXT PRIMARY KEY,
             data BLOB NOT NULL,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            expires_at TEXT NOT NULL
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now')),
+            expires_at INTEGER NOT NULL
         )
     ''')
+    # Covers the fresh-key scan (`SELECT item_key ... WHERE expires_at > ?`) without row reads
     cursor.execute(
-        'CREATE INDEX IF NOT EXISTS idx_online_cache_expires ON online_properties_cache(expires_at)'
+        'CREATE INDEX IF NOT EXISTS idx_online_cache_expires '
+        'ON online_properties_cache(expires_at, item_key)'
     )
 
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS mb_id_mappings (
             old_id TEXT PRIMARY KEY,
             canonical_id TEXT NOT NULL,
-            cached_at TEXT DEFAULT CURRENT_TIMESTAMP
+            cached_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now'))
         )
     ''')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_mb_id_canonical ON mb_id_mappings(canonical_id)')
@@ -522,6 +529,78 @@ def _create_base_schema(cursor: sqlite3.Cursor) -> None:
         )
     ''')
 
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS artwork_palette (
+            url_hash TEXT PRIMARY KEY,
+            dominant INTEGER NOT NULL,
+            average INTEGER NOT NULL,
+            contrast INTEGER NOT NULL,
+            computed_at INTEGER NOT NULL
+        ) WITHOUT ROWID
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS person_index (
+            name_key TEXT NOT NULL,
+            name TEXT NOT NULL,
+            media_type TEXT NOT NULL,
+            dbid INTEGER NOT NULL,
+            role TEXT,
+            cast_order INTEGER,
+            PRIMARY KEY (name_key, media_type, dbid)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute(
+        'CREATE INDEX IF NOT EXISTS idx_person_index_item ON person_index(media_type, dbid)'
+    )
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS person_index_meta (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            built_at INTEGER NOT NULL
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS stinger_index (
+            media_type TEXT NOT NULL,
+            dbid INTEGER NOT NULL,
+            has_during INTEGER NOT NULL,
+            has_after INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            checked_at INTEGER NOT NULL,
+            recheck_at INTEGER,
+            inputs TEXT,
+            PRIMARY KEY (media_type, dbid)
+        ) WITHOUT ROWID
+    ''')
+    # Tables created before `inputs` existed; their rows are backfilled by the next idle pass
+    stinger_columns = {row[1] for row in cursor.execute('PRAGMA table_info(stinger_index)')}
+    if 'inputs' not in stinger_columns:
+        cursor.execute('ALTER TABLE stinger_index ADD COLUMN inputs TEXT')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS download_manifest (
+            url TEXT NOT NULL,
+            local_path TEXT NOT NULL,
+            file_path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            content_hash TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            downloaded_at INTEGER NOT NULL,
+            PRIMARY KEY (url, local_path)
+        ) WITHOUT ROWID
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS texture_disk_usage (
+            directory TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            file_count INTEGER NOT NULL
+        ) WITHOUT ROWID
+    ''')
+
     # These lookup indexes duplicate the table's UNIQUE / PRIMARY KEY auto-index; drop the
     # redundant copies so existing DBs stop paying the extra write on every cache insert.
     cursor.execute('DROP INDEX IF EXISTS idx_cache_lookup')
@@ -540,14 +619,159 @@ def _cleanup_old_databases() -> None:
                 log("Database", f"Failed to delete old database: {e}", xbmc.LOGWARNING)
 
 
+# Cache tables whose timestamps were ISO-8601 text before v5. `expires_at` was written from
+# local `datetime.now()`, `cached_at` by SQLite's CURRENT_TIMESTAMP (UTC).
+_V5_EPOCH_TABLES = (
+    'artwork_cache', 'metadata_cache', 'season_metadata_cache', 'tmdb_genre_cache',
+    'online_properties_cache', 'provider_cache', 'id_corrections', 'mb_id_mappings',
+)
+_V5_EPOCH_COLUMNS = {
+    'expires_at': "COALESCE(CAST(strftime('%s', expires_at, 'utc') AS INTEGER), 0)",
+    'cached_at': "COALESCE(CAST(strftime('%s', cached_at) AS INTEGER), "
+                 "CAST(strftime('%s', 'now') AS INTEGER))",
+}
+
+
+def _convert_v4_tables(cursor: sqlite3.Cursor) -> None:
+    """Rebuild the v4 cache tables with epoch-integer timestamps, keeping every row."""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing = {row[0] for row in cursor.fetchall()}
+    tables = [table for table in _V5_EPOCH_TABLES if table in existing]
+
+    for table in tables:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+            "AND sql IS NOT NULL", (table,)
+        )
+        for row in cursor.fetchall():
+            cursor.execute(f'DROP INDEX {row[0]}')
+        cursor.execute(f'ALTER TABLE {table} RENAME TO {table}_v4')
+
+    _create_base_schema(cursor)
+
+    for table in tables:
+        columns = [row[1] for row in cursor.execute(f'PRAGMA table_info({table}_v4)')]
+        select = [_V5_EPOCH_COLUMNS.get(column, column) for column in columns]
+        cursor.execute(
+            f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) '
+            f'SELECT {", ".join(select)} FROM {table}_v4'
+        )
+        cursor.execute(f'DROP TABLE {table}_v4')
+
+
+# A migration that runs this long is assumed to have died with its process; its lock is taken
+# over. Waiting processes give up at the same point and start with a fresh database.
+_MIGRATION_LOCK_TIMEOUT_S = 300
+
+
+def _acquire_migration_lock(lock_path: str) -> bool:
+    """Create `lock_path` exclusively; False if another process holds it or on error."""
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        return True
+    except FileExistsError:
+        pass
+    except OSError as e:
+        log("Database", f"Migration lock unavailable: {e}", xbmc.LOGWARNING)
+        return False
+    try:
+        stale = time.time() - os.path.getmtime(lock_path) > _MIGRATION_LOCK_TIMEOUT_S
+        if stale:
+            os.remove(lock_path)
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+    except OSError:
+        pass
+    return False
+
+
+def _wait_for_migration(lock_path: str) -> None:
+    """Block while another process migrates, until DB_PATH appears or the lock goes away."""
+    monitor = xbmc.Monitor()
+    deadline = time.monotonic() + _MIGRATION_LOCK_TIMEOUT_S
+    while os.path.exists(lock_path) and not xbmcvfs.exists(DB_PATH):
+        if time.monotonic() > deadline or monitor.waitForAbort(0.2):
+            return
+
+
+def _publish_migrated(staging: str) -> bool:
+    """Move `staging` to DB_PATH unless DB_PATH exists; never replaces a database in use."""
+    try:
+        os.link(staging, DB_PATH)
+        return True
+    except FileExistsError:
+        return False
+    except (AttributeError, NotImplementedError, PermissionError):
+        # No hard links on this filesystem; the migration lock keeps this check-and-move to
+        # migrating processes, and only a waiter that timed out could create DB_PATH meanwhile.
+        if xbmcvfs.exists(DB_PATH):
+            return False
+        os.replace(staging, DB_PATH)
+        return True
+
+
+def _migrate_previous_database() -> None:
+    """Carry the v4 database into DB_PATH instead of starting empty.
+
+    One process at a time builds it in its own side file under a lock file and links it into
+    place, so a failure (or another process creating DB_PATH first) leaves the old behavior:
+    a fresh database. Processes finding the lock taken wait for that migration.
+    """
+    previous = xbmcvfs.translatePath(f'{_DB_BASE}_v{DB_VERSION - 1}.db')
+    if not xbmcvfs.exists(previous) or xbmcvfs.exists(DB_PATH):
+        return
+
+    lock_path = f'{DB_PATH}.migrating.lock'
+    if not _acquire_migration_lock(lock_path):
+        _wait_for_migration(lock_path)
+        return
+
+    staging = f'{DB_PATH}.{uuid.uuid4().hex}.migrating'
+    started = time.monotonic()
+    try:
+        if xbmcvfs.exists(DB_PATH):
+            return
+        source = sqlite3.connect(previous)
+        target = sqlite3.connect(staging)
+        try:
+            source.backup(target)
+            _convert_v4_tables(target.cursor())
+            target.commit()
+            # The side file has no other readers yet, so compact it now rather than leave the
+            # dropped v4 tables' pages to the cache GC.
+            target.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            target.execute('VACUUM')
+        finally:
+            source.close()
+            target.close()
+        if _publish_migrated(staging):
+            log("Database", f"Migrated v{DB_VERSION - 1} database in "
+                f"{time.monotonic() - started:.1f}s", xbmc.LOGINFO)
+    except Exception as e:
+        log("Database", f"Migration from v{DB_VERSION - 1} failed, starting fresh: {e}",
+            xbmc.LOGWARNING)
+    finally:
+        for path in (staging, lock_path):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                log("Database", f"Failed to remove {path}: {e}", xbmc.LOGWARNING)
+
+
 def init_database() -> None:
-    """Create all tables at DB_PATH; deletes any older-version DB files first."""
+    """Create all tables at DB_PATH; migrates the previous version, then deletes older files."""
+    _ensure_addon_data_folder()
+    _migrate_previous_database()
     _cleanup_old_databases()
 
     conn = get_connection(DB_PATH)
     cursor = conn.cursor()
 
     try:
+        # Only takes effect before the first table exists; older files are converted by the
+        # cache GC once they have enough free pages to be worth a VACUUM.
+        cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
         # WAL is persistent at the DB level; apply once during init.
         cursor.execute('PRAGMA journal_mode = WAL')
         _create_base_schema(cursor)
@@ -7,19 +7,25 @@ from __future__ import annotations
 import random
 import time
 import xbmc
-from datetime import datetime, timedelta
-from typing import Any, Optional, Dict, List, Tuple
+from datetime import datetime
+from typing import Any, Optional, Dict, List, Sequence, Tuple
 
 from lib.data.database._infrastructure import (
     get_db,
     DB_PATH,
     compress_data as _compress_data,
     decompress_data as _decompress_data,
+    chunked_in_query,
     sql_placeholders,
 )
 from lib.kodi.client import log
 
 
+def _expires_in(ttl_hours: float) -> int:
+    """Epoch seconds `ttl_hours` from now, as stored in the cache `expires_at` columns."""
+    return int(time.time() + ttl_hours * 3600)
+
+
 def _tv_show_ttl(hints: Dict[str, Any]) -> int:
     """Calculate TTL for TV shows based on schedule and status hints.
 
@@ -160,7 +166,7 @@ def get_cached_artwork(
             SELECT data FROM artwork_cache
             WHERE media_type = ? AND media_id = ? AND source = ? AND art_type = ?
               AND expires_at > ?
-        ''', (media_type, media_id, source, art_type, datetime.now().isoformat()))
+        ''', (media_type, media_id, source, art_type, int(time.time())))
 
         row = cursor.fetchone()
 
@@ -206,7 +212,7 @@ def get_cached_artwork_batch(
           AND expires_at > ?
     '''
 
-    query_params = [media_type] + params + art_types + [datetime.now().isoformat()]
+    query_params = [media_type] + params + art_types + [int(time.time())]
 
     with get_db(DB_PATH) as cursor:
         cursor.execute(query, query_params)
@@ -225,6 +231,95 @@ def get_cached_artwork_batch(
         return results
 
 
+def get_cached_artwork_for_ids(
+    media_type: str,
+    media_ids: Sequence[str],
+    art_types: Sequence[str],
+) -> Dict[Tuple[str, str], Dict[str, list]]:
+    """Batch artwork lookup across many items. Returns `(source, media_id) -> {art_type: list}`.
+
+    All sources are returned, including `system` completion markers if `art_types` asks for
+    them; callers pick the source/id pairs they need.
+    """
+    if not media_ids or not art_types:
+        return {}
+
+    wanted = set(art_types)
+    results: Dict[Tuple[str, str], Dict[str, list]] = {}
+
+    with get_db(DB_PATH) as cursor:
+        rows = chunked_in_query(cursor, '''
+            SELECT source, media_id, art_type, data
+            FROM artwork_cache
+            WHERE media_type = ? AND expires_at > ? AND media_id IN ({placeholders})
+        ''', [media_type, int(time.time())], list(dict.fromkeys(media_ids)))
+
+        for row in rows:
+            if row['art_type'] not in wanted:
+                continue
+            try:
+                data = _decompress_data(row['data'])
+            except Exception as e:
+                log("Cache", f"Failed to parse cached data: {str(e)}", xbmc.LOGERROR)
+                continue
+            results.setdefault((row['source'], row['media_id']), {})[row['art_type']] = data
+
+    return results
+
+
+class ArtworkLookup:
+    """Rows from one bulk artwork read, keyed `(media_id, source, art_type)`.
+
+    Blobs are decompressed on first `get`, so combinations the caller never asks for
+    cost nothing to decode.
+    """
+
+    def __init__(self, blobs: Dict[Tuple[str, str, str], bytes]):
+        self._blobs = blobs
+        self._decoded: Dict[Tuple[str, str, str], Optional[list]] = {}
+
+    def get(self, media_id: str, source: str, art_type: str) -> Optional[list]:
+        """Cached artwork list, or None if missing/expired."""
+        key = (media_id, source, art_type)
+        if key in self._decoded:
+            return self._decoded[key]
+        blob = self._blobs.get(key)
+        data = None
+        if blob is not None:
+            try:
+                data = _decompress_data(blob)
+            except Exception as e:
+                log("Cache", f"Failed to parse cached data: {str(e)}", xbmc.LOGERROR)
+        self._decoded[key] = data
+        return data
+
+
+def get_cached_artwork_bulk(
+    media_type: str,
+    media_ids: Sequence[str],
+    sources: Sequence[str],
+    art_types: Sequence[str],
+) -> ArtworkLookup:
+    """Every unexpired `(media_id, source, art_type)` combination in one statement per chunk."""
+    if not media_ids or not sources or not art_types:
+        return ArtworkLookup({})
+
+    sql = (
+        'SELECT media_id, source, art_type, data FROM artwork_cache '
+        'WHERE media_type = ? AND expires_at > ? '
+        f'AND source IN ({sql_placeholders(len(sources))}) '
+        f'AND art_type IN ({sql_placeholders(len(art_types))}) '
+        'AND media_id IN ({placeholders})'
+    )
+    params = [media_type, int(time.time())] + list(sources) + list(art_types)
+
+    with get_db(DB_PATH) as cursor:
+        rows = chunked_in_query(cursor, sql, params, list(dict.fromkeys(media_ids)))
+        return ArtworkLookup({
+            (row['media_id'], row['source'], row['art_type']): row['data'] for row in rows
+        })
+
+
 def cache_artwork(
     media_type: str, media_id: str, source: str, art_type: str, data: list,
     release_date: Optional[str] = None, ttl_hours: Optional[int] = None,
@@ -234,8 +329,6 @@ def cache_artwork(
         ttl_hours = get_cache_ttl_hours(release_date)
 
     with get_db(DB_PATH) as cursor:
-        expires_at = datetime.now() + timedelta(hours=ttl_hours)
-
         cursor.execute(
             '\n'
             '            INSERT OR REPLACE INTO artwork_cache '
@@ -244,7 +337,7 @@ def cache_artwork(
             '        ',
             (
                 media_type, media_id, source, art_type, _compress_data(data),
-                release_date, expires_at.isoformat(),
+                release_date, _expires_in(ttl_hours),
             ),
         )
 
@@ -256,7 +349,7 @@ def get_cached_metadata(media_type: str, tmdb_id: str) -> Optional[dict]:
             SELECT data FROM metadata_cache
             WHERE media_type = ? AND tmdb_id = ?
               AND expires_at > ?
-        ''', (media_type, tmdb_id, datetime.now().isoformat()))
+        ''', (media_type, tmdb_id, int(time.time())))
 
         row = cursor.fetchone()
         if not row:
@@ -279,7 +372,6 @@ def cache_metadata(
     """
     if ttl_hours is None:
         ttl_hours = get_cache_ttl_hours(release_date, hints)
-    expires_at = datetime.now() + timedelta(hours=ttl_hours)
     compressed = _compress_data(data)
 
     with get_db(DB_PATH) as cursor:
@@ -287,7 +379,7 @@ def cache_metadata(
             INSERT OR REPLACE INTO metadata_cache
             (media_type, tmdb_id, data, release_date, expires_at)
             VALUES (?, ?, ?, ?, ?)
-        ''', (media_type, tmdb_id, compressed, release_date, expires_at.isoformat()))
+        ''', (media_type, tmdb_id, compressed, release_date, _expires_in(ttl_hours)))
 
     if media_type in ('movie', 'tvshow') and isinstance(data.get('external_ids'), dict):
         from lib.data.database.mapping import save_id_mapping
@@ -306,7 +398,7 @@ def get_cached_season_metadata(tmdb_id: str, season_number: int) -> Optional[dic
             SELECT data FROM season_metadata_cache
             WHERE tmdb_id = ? AND season_number = ?
               AND expires_at > ?
-        ''', (tmdb_id, season_number, datetime.now().isoformat()))
+        ''', (tmdb_id, season_number, int(time.time())))
 
         row = cursor.fetchone()
         if not row:
@@ -328,7 +420,6 @@ def cache_season_metadata(tmdb_id: str, season_number: int, data: dict,
     """
     if ttl_hours is None:
         ttl_hours = _season_ttl_hours(data)
-    expires_at = datetime.now() + timedelta(hours=ttl_hours)
     compressed = _compress_data(data)
 
     with get_db(DB_PATH) as cursor:
@@ -336,7 +427,7 @@ def cache_season_metadata(tmdb_id: str, season_number: int, data: dict,
             INSERT OR REPLACE INTO season_metadata_cache
             (tmdb_id, season_number, data, expires_at)
             VALUES (?, ?, ?, ?)
-        ''', (tmdb_id, season_number, compressed, expires_at.isoformat()))
+        ''', (tmdb_id, season_number, compressed, _expires_in(ttl_hours)))
 
 
 def _season_ttl_hours(season_data: dict) -> int:
@@ -358,7 +449,7 @@ def get_cached_tmdb_genre_list(tmdb_type: str) -> Optional[Dict[int, str]]:
         cursor.execute('''
             SELECT data FROM tmdb_genre_cache
             WHERE tmdb_type = ? AND expires_at > ?
-        ''', (tmdb_type, datetime.now().isoformat()))
+        ''', (tmdb_type, int(time.time())))
 
         row = cursor.fetchone()
         if not row:
@@ -374,7 +465,6 @@ def get_cached_tmdb_genre_list(tmdb_type: str) -> Optional[Dict[int, str]]:
 
 def cache_tmdb_genre_list(tmdb_type: str, mapping: Dict[int, str], ttl_hours: int = 24) -> None:
     """Cache the TMDB genre id->name mapping for `movie` or `tv` (default 24h TTL)."""
-    expires_at = datetime.now() + timedelta(hours=ttl_hours)
     compressed = _compress_data({str(k): v for k, v in mapping.items()})
 
     with get_db(DB_PATH) as cursor:
@@ -382,7 +472,7 @@ def cache_tmdb_genre_list(tmdb_type: str, mapping: Dict[int, str], ttl_hours: in
             INSERT OR REPLACE INTO tmdb_genre_cache
             (tmdb_type, data, expires_at)
             VALUES (?, ?, ?)
-        ''', (tmdb_type, compressed, expires_at.isoformat()))
+        ''', (tmdb_type, compressed, _expires_in(ttl_hours)))
 
 
 def expire_metadata(media_type: str, tmdb_id: str, ttl_hours: int = 12) -> None:
@@ -390,7 +480,7 @@ def expire_metadata(media_type: str, tmdb_id: str, ttl_hours: int = 12) -> None:
 
     Only shortens. If the entry already expires sooner, it's left alone.
     """
-    new_expires = (datetime.now() + timedelta(hours=ttl_hours)).isoformat()
+    new_expires = _expires_in(ttl_hours)
     with get_db(DB_PATH) as cursor:
         cursor.execute('''
             UPDATE metadata_cache
@@ -400,57 +490,14 @@ def expire_metadata(media_type: str, tmdb_id: str, ttl_hours: int = 12) -> None:
 
 
 def clear_expired_cache() -> int:
-    """Remove expired artwork/metadata entries and 180d+ online props; returns count removed."""
-    now = datetime.now()
-    with get_db(DB_PATH) as cursor:
-        cursor.execute(
-            'DELETE FROM artwork_cache WHERE expires_at < ?',
-            (now.isoformat(),)
-        )
-        artwork_deleted = cursor.rowcount
-
-        cursor.execute(
-            'DELETE FROM metadata_cache WHERE expires_at < ?',
-            (now.isoformat(),)
-        )
-        metadata_deleted = cursor.rowcount
-
-        cursor.execute(
-            'DELETE FROM season_metadata_cache WHERE expires_at < ?',
-            (now.isoformat(),)
-        )
-        season_deleted = cursor.rowcount
-
-        cursor.execute(
-            'DELETE FROM tmdb_genre_cache WHERE expires_at < ?',
-            (now.isoformat(),)
-        )
-        genre_deleted = cursor.rowcount
-
-        # Stale online props served until refreshed, but purge very old entries
-        cutoff = (now - timedelta(days=180)).isoformat()
-        cursor.execute(
-            'DELETE FROM online_properties_cache WHERE expires_at < ?',
-            (cutoff,)
-        )
-        online_deleted = cursor.rowcount
-
-        # provider_cache has per-read TTL logic but no expires_at column;
-        # 30 days is past every computed TTL
-        provider_cutoff = (now - timedelta(days=30)).isoformat()
-        cursor.execute(
-            'DELETE FROM provider_cache WHERE cached_at < ?',
-            (provider_cutoff,)
-        )
-        provider_deleted = cursor.rowcount
+    """Remove expired cache entries in small chunks; returns count removed.
 
-        deleted = (artwork_deleted + metadata_deleted + season_deleted
-                   + genre_deleted + online_deleted + provider_deleted)
-
-    if deleted > 0:
-        log("Database", f"Cleared {deleted} expired cache entries")
-
-    return deleted
+    Runs a full `cache_gc.collect_garbage` pass without a size budget, so it also reclaims
+    free pages, and converts a legacy database to incremental auto-vacuum with one VACUUM
+    when enough of the file is free.
+    """
+    from lib.data.database.cache_gc import collect_garbage
+    return collect_garbage()['expired']
 
 
 def cache_person_data(person_id: int, data: dict, ttl_days: int = 30) -> None:
@@ -488,10 +535,9 @@ def get_cached_person_data(person_id: int) -> Optional[dict]:
 def get_cached_online_keys() -> set:
     """Get all non-expired item_keys from online_properties_cache."""
     with get_db(DB_PATH) as cursor:
-        now = datetime.now().isoformat()
         cursor.execute(
             'SELECT item_key FROM online_properties_cache WHERE expires_at > ?',
-            (now,)
+            (int(time.time()),)
         )
         return {row['item_key'] for row in cursor.fetchall()}
 
@@ -574,7 +620,6 @@ def invalidate_online_properties_by_keys(keys: List[str]) -> int:
 
 def cache_online_properties(item_key: str, props: Dict[str, str], ttl_hours: int = 1) -> None:
     """Cache a key -> value properties dict for an item (e.g. "movie:123:tt1234567:456")."""
-    expires_at = datetime.now() + timedelta(hours=ttl_hours)
     compressed = _compress_data(props)
 
     with get_db(DB_PATH) as cursor:
@@ -582,4 +627,4 @@ def cache_online_properties(item_key: str, props: Dict[str, str], ttl_hours: int
             INSERT OR REPLACE INTO online_properties_cache
             (item_key, data, expires_at)
             VALUES (?, ?, ?)
-        ''', (item_key, compressed, expires_at.isoformat()))
+        ''', (item_key, compressed, _expires_in(ttl_hours)))
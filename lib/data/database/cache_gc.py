@@ -0,0 +1,312 @@
+"""Incremental garbage collection for the API cache tables.
+
+Expired rows are deleted in small rowid-bounded chunks, each in its own short transaction with
+a pause in between, so foreground readers and writers never wait long on the write lock. When
+the cached blobs exceed the configured size budget, the least recently cached rows are picked
+in one read and deleted in the same small chunks. Freed pages are then returned to the
+filesystem with `incremental_vacuum`.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import xbmc
+
+from lib.data.database._infrastructure import (
+    DB_PATH, get_connection, get_db, sql_placeholders,
+)
+from lib.kodi.client import log
+
+# Rows per DELETE transaction; keeps each write-lock hold in the low milliseconds.
+GC_CHUNK_ROWS = 200
+# Free pages released per incremental_vacuum step.
+GC_VACUUM_PAGES = 256
+GC_PAUSE_S = 0.05
+# Convert a non-incremental database with a one-off VACUUM once this share of pages is free.
+GC_CONVERT_FREE_RATIO = 0.25
+
+
+def _now() -> int:
+    return int(time.time())
+
+
+def _days_ago(days: int) -> int:
+    return int(time.time()) - days * 86400
+
+
+# (table, WHERE clause for expired rows, cutoff factory)
+_EXPIRY_RULES: List[Tuple[str, str, Callable[[], Any]]] = [
+    ('artwork_cache', 'expires_at < ?', _now),
+    ('metadata_cache', 'expires_at < ?', _now),
+    ('season_metadata_cache', 'expires_at < ?', _now),
+    ('tmdb_genre_cache', 'expires_at < ?', _now),
+    # Stale online props are served until refreshed; only very old entries are purged
+    ('online_properties_cache', 'expires_at < ?', lambda: _days_ago(180)),
+    # provider_cache has per-read TTL logic but no expires_at column; 30 days is past every TTL
+    ('provider_cache', 'cached_at < ?', lambda: _days_ago(30)),
+    ('person_cache', 'expires_at < ?', _now),
+]
+
+# Tables whose `data` blobs count toward the size budget, evicted oldest `cached_at` first.
+BUDGET_TABLES = (
+    'artwork_cache', 'metadata_cache', 'season_metadata_cache', 'provider_cache',
+    'online_properties_cache', 'person_cache',
+)
+
+
+class _LockTimer:
+    """Accumulates how long each write transaction held the database lock."""
+
+    def __init__(self) -> None:
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.transactions = 0
+
+    def add(self, started: float) -> None:
+        held_ms = (time.monotonic() - started) * 1000
+        self.total_ms += held_ms
+        self.max_ms = max(self.max_ms, held_ms)
+        self.transactions += 1
+
+
+def _pause(abort_check: Optional[Callable[[], bool]]) -> bool:
+    """Yield between chunks. Returns True if the run should stop."""
+    if abort_check and abort_check():
+        return True
+    time.sleep(GC_PAUSE_S)
+    return bool(abort_check and abort_check())
+
+
+def _delete_chunked(table: str, where: str, params: list, timer: _LockTimer,
+                    abort_check: Optional[Callable[[], bool]]) -> Tuple[int, int]:
+    """Delete matching rows chunk by chunk. Returns `(rows, blob_bytes)` removed."""
+    rows_removed = 0
+    bytes_removed = 0
+
+    while True:
+        started = time.monotonic()
+        with get_db(DB_PATH) as cursor:
+            cursor.execute(f'''
+                SELECT rowid AS rid, length(data) AS size FROM {table}
+                WHERE {where} LIMIT ?
+            ''', params + [GC_CHUNK_ROWS])
+            rows = cursor.fetchall()
+            if rows:
+                cursor.executemany(f'DELETE FROM {table} WHERE rowid = ?',
+                                   [(row['rid'],) for row in rows])
+        timer.add(started)
+
+        rows_removed += len(rows)
+        bytes_removed += sum(row['size'] or 0 for row in rows)
+
+        if len(rows) < GC_CHUNK_ROWS or _pause(abort_check):
+            break
+
+    return rows_removed, bytes_removed
+
+
+def get_table_usage() -> Dict[str, Dict[str, int]]:
+    """Row count and total blob bytes per budgeted cache table."""
+    usage = {}
+    with get_db(DB_PATH) as cursor:
+        for table in BUDGET_TABLES:
+            cursor.execute(f'SELECT COUNT(*) AS n, COALESCE(SUM(length(data)), 0) AS bytes '
+                           f'FROM {table}')
+            row = cursor.fetchone()
+            usage[table] = {'rows': row['n'], 'bytes': row['bytes']}
+    return usage
+
+
+def _select_victims(table: str, limit_rows: int) -> List[int]:
+    """Rowids of the `limit_rows` least recently cached rows in `table`.
+
+    `cached_at` is unindexed, so this is read once per table rather than once per delete
+    chunk, and outside any write transaction. Completion markers (`source = 'system'`) are
+    never picked; `_delete_rows` drops them along with the art they vouch for.
+    """
+    where = "WHERE source != 'system'" if table == 'artwork_cache' else ''
+    with get_db(DB_PATH) as cursor:
+        cursor.execute(f'SELECT rowid AS rid FROM {table} {where} '
+                       f'ORDER BY cached_at ASC LIMIT ?', (limit_rows,))
+        return [row['rid'] for row in cursor.fetchall()]
+
+
+def _delete_rows(table: str, rowids: List[int], timer: _LockTimer,
+                 abort_check: Optional[Callable[[], bool]]) -> Tuple[int, int]:
+    """Delete `rowids` chunk by chunk. Returns `(rows, blob_bytes)` removed.
+
+    Evicting an `artwork_cache` row also deletes its title's `_full_fetch_complete` marker so
+    `fetch_all`/`hydrate` refetch rather than serve the partial set as complete. fanart.tv
+    tvshow art is keyed by tvdb id and the marker by tmdb id; `id_mappings` links the two.
+    """
+    rows_removed = 0
+    bytes_removed = 0
+
+    for start in range(0, len(rowids), GC_CHUNK_ROWS):
+        chunk = rowids[start:start + GC_CHUNK_ROWS]
+        placeholders = sql_placeholders(len(chunk))
+        columns = 'length(data) AS size'
+        if table == 'artwork_cache':
+            columns += ', media_type, media_id'
+
+        started = time.monotonic()
+        with get_db(DB_PATH) as cursor:
+            # Rows replaced since selection have new rowids and are left alone
+            cursor.execute(f'SELECT {columns} FROM {table} WHERE rowid IN ({placeholders})',
+                           chunk)
+            rows = cursor.fetchall()
+            cursor.execute(f'DELETE FROM {table} WHERE rowid IN ({placeholders})', chunk)
+            if table == 'artwork_cache':
+                cursor.executemany(
+                    "DELETE FROM artwork_cache WHERE source = 'system' AND media_type = ?1 "
+                    "AND media_id IN (SELECT ?2 UNION ALL "
+                    "SELECT tmdb_id FROM id_mappings WHERE media_type = ?1 AND tvdb_id = ?2)",
+                    sorted({(row['media_type'], row['media_id']) for row in rows}))
+        timer.add(started)
+
+        rows_removed += len(rows)
+        bytes_removed += sum(row['size'] or 0 for row in rows)
+
+        if start + GC_CHUNK_ROWS < len(rowids) and _pause(abort_check):
+            break
+
+    return rows_removed, bytes_removed
+
+
+def _evict_to_budget(budget_bytes: int, usage: Dict[str, Dict[str, int]], timer: _LockTimer,
+                     abort_check: Optional[Callable[[], bool]]) -> Tuple[int, int]:
+    """Evict oldest rows from each table in proportion to its share of the overage."""
+    total = sum(u['bytes'] for u in usage.values())
+    excess = total - budget_bytes
+    if excess <= 0:
+        return 0, 0
+
+    rows_evicted = 0
+    bytes_evicted = 0
+    for table, u in sorted(usage.items(), key=lambda kv: kv[1]['bytes'], reverse=True):
+        if not u['rows'] or not u['bytes']:
+            continue
+        share = excess * u['bytes'] / total
+        avg_row = u['bytes'] / u['rows']
+        # +1 so a table whose share is smaller than one row still gives something back
+        victims = _select_victims(table, int(share / avg_row) + 1)
+        rows, freed = _delete_rows(table, victims, timer, abort_check)
+        rows_evicted += rows
+        bytes_evicted += freed
+        u['rows'] -= rows
+        u['bytes'] -= freed
+        if abort_check and abort_check():
+            break
+
+    return rows_evicted, bytes_evicted
+
+
+def _reclaim_pages(timer: _LockTimer, abort_check: Optional[Callable[[], bool]]) -> None:
+    """Release free pages to the filesystem; converts legacy databases to incremental mode."""
+    with get_db(DB_PATH) as cursor:
+        auto_vacuum = cursor.execute('PRAGMA auto_vacuum').fetchone()[0]
+        free_pages = cursor.execute('PRAGMA freelist_count').fetchone()[0]
+        page_count = cursor.execute('PRAGMA page_count').fetchone()[0]
+
+    if not free_pages:
+        return
+
+    if auto_vacuum != 2:
+        # auto_vacuum only changes through a full VACUUM. Pay that once, and only when it
+        # frees a meaningful share of the file.
+        if page_count and free_pages / page_count >= GC_CONVERT_FREE_RATIO:
+            started = time.monotonic()
+            conn = get_connection(DB_PATH)
+            try:
+                # Give way at once to any other writer rather than queue behind it; the next
+                # pass tries again.
+                conn.execute('PRAGMA busy_timeout = 0')
+                conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                conn.execute('VACUUM')
+            except sqlite3.OperationalError as e:
+                log("Database", f"Cache GC: database busy, incremental conversion deferred: {e}",
+                    xbmc.LOGDEBUG)
+                return
+            finally:
+                conn.close()
+            timer.add(started)
+            log("Database", "Cache GC converted database to incremental auto-vacuum",
+                xbmc.LOGINFO)
+        return
+
+    while free_pages > 0:
+        started = time.monotonic()
+        with get_db(DB_PATH) as cursor:
+            # sqlite3's execute() steps this pragma once, freeing one page; executescript runs
+            # it to completion
+            cursor.executescript(f'PRAGMA incremental_vacuum({GC_VACUUM_PAGES})')
+            free_pages = cursor.execute('PRAGMA freelist_count').fetchone()[0]
+        timer.add(started)
+        if _pause(abort_check):
+            break
+
+    # Truncation of the main file only lands once the WAL is checkpointed
+    with get_db(DB_PATH) as cursor:
+        cursor.execute('PRAGMA wal_checkpoint(PASSIVE)').fetchall()
+
+
+def _file_size() -> int:
+    try:
+        return os.path.getsize(DB_PATH)
+    except OSError:
+        return 0
+
+
+def collect_garbage(budget_mb: int = 0,
+                    abort_check: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """Run one incremental GC pass: expire, enforce `budget_mb` (0 = unlimited), reclaim pages.
+
+    Returns `{expired, evicted, evicted_bytes, reclaimed_bytes, lock_total_ms, lock_max_ms,
+    transactions, tables}` where `tables` is the post-run `get_table_usage()`.
+    """
+    timer = _LockTimer()
+    size_before = _file_size()
+    expired = 0
+    evicted = 0
+    evicted_bytes = 0
+
+    for table, where, cutoff in _EXPIRY_RULES:
+        rows, _ = _delete_chunked(table, where, [cutoff()], timer, abort_check)
+        expired += rows
+        if abort_check and abort_check():
+            break
+
+    usage = get_table_usage()
+    if budget_mb > 0 and not (abort_check and abort_check()):
+        evicted, evicted_bytes = _evict_to_budget(
+            budget_mb * 1024 * 1024, usage, timer, abort_check)
+
+    if not (abort_check and abort_check()):
+        try:
+            _reclaim_pages(timer, abort_check)
+        except sqlite3.OperationalError as e:
+            log("Database", f"Cache GC: page reclaim skipped: {e}", xbmc.LOGDEBUG)
+
+    reclaimed = max(0, size_before - _file_size())
+    stats = {
+        'expired': expired,
+        'evicted': evicted,
+        'evicted_bytes': evicted_bytes,
+        'reclaimed_bytes': reclaimed,
+        'lock_total_ms': round(timer.total_ms, 1),
+        'lock_max_ms': round(timer.max_ms, 1),
+        'transactions': timer.transactions,
+        'tables': usage,
+    }
+
+    cache_bytes = sum(u['bytes'] for u in usage.values())
+    log("Database",
+        f"Cache GC: expired={expired}, evicted={evicted} ({evicted_bytes // 1024} KB), "
+        f"reclaimed={reclaimed // 1024} KB, cache={cache_bytes // 1024} KB, "
+        f"lock total={timer.total_ms:.0f}ms max={timer.max_ms:.1f}ms "
+        f"over {timer.transactions} transactions",
+        xbmc.LOGINFO)
+    return stats
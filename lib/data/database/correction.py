@@ -1,7 +1,7 @@
 """ID correction cache for invalid TMDB/IMDB mappings."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 from typing import Optional
 
 from lib.data.database._infrastructure import get_db
@@ -24,10 +24,9 @@ def get_corrected_tmdb_id(imdb_id: str) -> Optional[int]:
         row = cursor.fetchone()
         if not row:
             return None
-        cached_at = datetime.fromisoformat(row["cached_at"])
-        age = datetime.now() - cached_at
+        age = time.time() - row["cached_at"]
         ttl = _FAILED_TTL_DAYS if row["tmdb_id"] == NOT_FOUND_SENTINEL else _SUCCESS_TTL_DAYS
-        if age > timedelta(days=ttl):
+        if age > ttl * 86400:
             cursor.execute("DELETE FROM id_corrections WHERE imdb_id = ?", (imdb_id,))
             return None
         return row["tmdb_id"]
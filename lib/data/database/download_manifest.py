@@ -0,0 +1,50 @@
+"""Record of artwork files written by bulk downloads.
+
+One row per `(url, local_path)` job: the file written (with its extension), its size and
+content hash, and the response's HTTP validators. A later run prunes jobs whose file is still
+in place, and a URL already on disk under another path is copied instead of fetched again.
+"""
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+from lib.data.database._infrastructure import get_db, chunked_in_query
+
+
+def get_entries_for_urls(urls: Sequence[str]) -> Dict[str, List[dict]]:
+    """`{url: [entry, ...]}` for every recorded job of `urls`."""
+    entries: Dict[str, List[dict]] = {}
+    if not urls:
+        return entries
+    with get_db() as cursor:
+        rows = chunked_in_query(
+            cursor,
+            'SELECT url, local_path, file_path, size, content_hash, etag, last_modified '
+            'FROM download_manifest WHERE url IN ({placeholders})',
+            [], list(dict.fromkeys(urls)))
+        for row in rows:
+            entries.setdefault(row['url'], []).append(dict(row))
+    return entries
+
+
+def record_download(url: str, local_path: str, file_path: str, size: int, content_hash: str,
+                    etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+    """Upsert the file written for one job."""
+    with get_db() as cursor:
+        cursor.execute(
+            'INSERT OR REPLACE INTO download_manifest '
+            '(url, local_path, file_path, size, content_hash, etag, last_modified, '
+            'downloaded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (url, local_path, file_path, size, content_hash, etag, last_modified,
+             int(time.time()))
+        )
+
+
+def forget_entries(keys: Sequence[tuple]) -> None:
+    """Drop `(url, local_path)` rows whose file is gone."""
+    if not keys:
+        return
+    with get_db() as cursor:
+        cursor.executemany('DELETE FROM download_manifest WHERE url = ? AND local_path = ?',
+                           list(keys))
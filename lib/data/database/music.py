@@ -8,13 +8,14 @@ from __future__ import annotations
 
 import random
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Iterable, Optional, Set
 
 import xbmc
 import xbmcvfs
 
 from lib.data.database._infrastructure import (
     get_db,
+    chunked_in_query,
     compress_data as _compress,
     decompress_data as _decompress,
 )
@@ -57,6 +58,16 @@ CREATE TABLE IF NOT EXISTS music_tracks (
     PRIMARY KEY (source, lookup_key)
 );
 CREATE INDEX IF NOT EXISTS idx_music_tracks_expires ON music_tracks(expires_at);
+
+CREATE TABLE IF NOT EXISTS music_warmup (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    completed_at TEXT,
+    artists_total INTEGER NOT NULL DEFAULT 0,
+    artists_warm INTEGER NOT NULL DEFAULT 0,
+    albums_total INTEGER NOT NULL DEFAULT 0,
+    albums_warm INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL
+);
 """
 
 SOURCE_AUDIODB = 'audiodb'
@@ -104,6 +115,18 @@ def _track_key(artist: str, track: str) -> str:
     return f"{artist}\0{track}".lower().strip()
 
 
+def artist_lookup_key(*, mbid: str = '', name: str = '', lang: str = '') -> str:
+    """Cache key `get_cached_artist` uses for these arguments."""
+    key = _artist_key(mbid, name)
+    return f'{key}:{lang}' if key and lang else key
+
+
+def album_lookup_key(*, mbid: str = '', artist: str = '', album: str = '', lang: str = '') -> str:
+    """Cache key `get_cached_album` uses for these arguments."""
+    key = _album_key(mbid, artist, album)
+    return f'{key}:{lang}' if key and lang else key
+
+
 def _apply_jitter(hours: float) -> int:
     """Multiply `hours` by a random 0.8-1.2 factor to spread cache expiry."""
     return max(1, int(hours * random.uniform(0.8, 1.2)))
@@ -421,3 +444,54 @@ def get_best_artist_bio(*, mbid: str = '', name: str = '') -> str:
                 return content
 
     return ''
+
+
+def _fresh_keys(table: str, source: str, keys: Iterable[str]) -> Set[str]:
+    """Subset of `keys` with an unexpired `table` row for `source` (hits and cached misses)."""
+    wanted = [k for k in dict.fromkeys(keys) if k]
+    if not wanted:
+        return set()
+    with get_db(MUSIC_DB_PATH) as cursor:
+        rows = chunked_in_query(
+            cursor,
+            f'SELECT lookup_key FROM {table} WHERE source = ? AND expires_at > ? '
+            'AND lookup_key IN ({placeholders})',
+            [source, datetime.now().isoformat()], wanted)
+        return {row['lookup_key'] for row in rows}
+
+
+def get_fresh_artist_keys(source: str, keys: Iterable[str]) -> Set[str]:
+    """Artist lookup keys already cached for `source`; see `artist_lookup_key`."""
+    return _fresh_keys('music_artists', source, keys)
+
+
+def get_fresh_album_keys(source: str, keys: Iterable[str]) -> Set[str]:
+    """Album lookup keys already cached for `source`; see `album_lookup_key`."""
+    return _fresh_keys('music_albums', source, keys)
+
+
+def get_warmup_state() -> Optional[dict]:
+    """Last recorded library warm-up coverage, or None before the first run."""
+    with get_db(MUSIC_DB_PATH) as cursor:
+        cursor.execute('SELECT * FROM music_warmup WHERE id = 1')
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+
+def save_warmup_state(coverage: Dict[str, int], completed: bool) -> None:
+    """Record warm-up coverage. `completed_at` only moves when a run reached the end."""
+    now = datetime.now().isoformat()
+    with get_db(MUSIC_DB_PATH) as cursor:
+        cursor.execute('''
+            INSERT INTO music_warmup (id, completed_at, artists_total, artists_warm,
+                                      albums_total, albums_warm, updated_at)
+            VALUES (1, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                completed_at = COALESCE(excluded.completed_at, completed_at),
+                artists_total = excluded.artists_total,
+                artists_warm = excluded.artists_warm,
+                albums_total = excluded.albums_total,
+                albums_warm = excluded.albums_warm,
+                updated_at = excluded.updated_at
+        ''', (now if completed else None, coverage['artists_total'], coverage['artists_warm'],
+              coverage['albums_total'], coverage['albums_warm'], now))
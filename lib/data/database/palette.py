@@ -0,0 +1,53 @@
+"""Artwork color palette cache.
+
+One row per source image, keyed by the md5 of its URL. Colors are stored as 0xRRGGBB
+integers and formatted as Kodi `AARRGGBB` strings on read.
+"""
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Set
+
+from lib.data.database._infrastructure import get_db, chunked_in_query
+
+PALETTE_KEYS = ('dominant', 'average', 'contrast')
+
+
+def _to_kodi_color(value: int) -> str:
+    return f"FF{value & 0xFFFFFF:06X}"
+
+
+def get_palette(url_hash: str) -> Optional[Dict[str, str]]:
+    """Return `{dominant, average, contrast}` as `AARRGGBB` strings, or None if not cached."""
+    with get_db() as cursor:
+        cursor.execute(
+            'SELECT dominant, average, contrast FROM artwork_palette WHERE url_hash = ?',
+            (url_hash,)
+        )
+        row = cursor.fetchone()
+    if not row:
+        return None
+    return {key: _to_kodi_color(row[key]) for key in PALETTE_KEYS}
+
+
+def save_palette(url_hash: str, dominant: int, average: int, contrast: int) -> None:
+    """Upsert one palette row. Colors are 0xRRGGBB integers."""
+    with get_db() as cursor:
+        cursor.execute(
+            'INSERT OR REPLACE INTO artwork_palette '
+            '(url_hash, dominant, average, contrast, computed_at) VALUES (?, ?, ?, ?, ?)',
+            (url_hash, dominant, average, contrast, int(time.time()))
+        )
+
+
+def get_cached_hashes(url_hashes: List[str]) -> Set[str]:
+    """Return the subset of `url_hashes` that already have a palette row."""
+    if not url_hashes:
+        return set()
+    with get_db() as cursor:
+        return {
+            row[0] for row in chunked_in_query(
+                cursor,
+                'SELECT url_hash FROM artwork_palette WHERE url_hash IN ({placeholders})',
+                [], url_hashes)
+        }
@@ -0,0 +1,155 @@
+"""Persisted actor -> library role index for person widgets.
+
+One row per (actor, title): normalized name, display name, media type, dbid, role and billing
+order. Built by one paged library pass and kept current per title from library notifications,
+so person widgets read an actor's roles locally instead of pulling every title's cast array.
+"""
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Optional
+
+import xbmc
+
+from lib.data.database._infrastructure import get_db
+from lib.kodi.client import log
+
+INDEXED_MEDIA_TYPES = ('movie', 'tvshow')
+
+# Titles per GetMovies/GetTVShows page; each carries its whole cast array.
+_PAGE_SIZE = 500
+
+_SOURCES = {
+    'movie':  ('VideoLibrary.GetMovies',  'movies',  'movieid'),
+    'tvshow': ('VideoLibrary.GetTVShows', 'tvshows', 'tvshowid'),
+}
+
+_INSERT_SQL = '''
+    INSERT OR IGNORE INTO person_index (name_key, name, media_type, dbid, role, cast_order)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+
+def normalize_name(name: str) -> str:
+    """Index key for an actor name: whitespace-collapsed and case-folded."""
+    return ' '.join((name or '').split()).casefold()
+
+
+def _cast_rows(media_type: str, dbid: int, cast: list) -> List[tuple]:
+    rows = []
+    for position, member in enumerate(cast or []):
+        name = (member.get('name') or '').strip() if isinstance(member, dict) else ''
+        if not name:
+            continue
+        order = member.get('order')
+        rows.append((normalize_name(name), name, media_type, dbid, member.get('role') or '',
+                     order if isinstance(order, int) else position))
+    return rows
+
+
+def _fetch_cast_rows(media_type: str,
+                     abort_check: Optional[Callable[[], bool]] = None) -> Optional[List[tuple]]:
+    """Index rows for every title of `media_type`, or None if a page failed or was aborted."""
+    from lib.kodi.client import request
+
+    method, result_key, id_key = _SOURCES[media_type]
+    rows: List[tuple] = []
+    start = 0
+    while True:
+        if abort_check and abort_check():
+            return None
+        resp = request(method, {
+            'properties': ['cast'],
+            'limits': {'start': start, 'end': start + _PAGE_SIZE},
+        })
+        if not resp:
+            return None
+        result = resp.get('result') or {}
+        page = result.get(result_key) or []
+        for item in page:
+            dbid = item.get(id_key)
+            if dbid:
+                rows.extend(_cast_rows(media_type, dbid, item.get('cast')))
+        total = (result.get('limits') or {}).get('total')
+        start += _PAGE_SIZE
+        if len(page) < _PAGE_SIZE or (total is not None and start >= total):
+            return rows
+
+
+def is_built() -> bool:
+    """True once a full library pass has completed."""
+    with get_db() as cursor:
+        cursor.execute('SELECT 1 FROM person_index_meta WHERE id = 1')
+        return cursor.fetchone() is not None
+
+
+def rebuild_person_index(abort_check: Optional[Callable[[], bool]] = None) -> bool:
+    """Replace the index from one paged library pass. Returns False (index untouched) on failure."""
+    started = time.monotonic()
+    rows: List[tuple] = []
+    for media_type in INDEXED_MEDIA_TYPES:
+        fetched = _fetch_cast_rows(media_type, abort_check)
+        if fetched is None:
+            log("Database", f"Person index: {media_type} fetch failed or aborted, keeping index",
+                xbmc.LOGDEBUG)
+            return False
+        rows.extend(fetched)
+
+    with get_db() as cursor:
+        cursor.execute('DELETE FROM person_index')
+        cursor.executemany(_INSERT_SQL, rows)
+        cursor.execute('INSERT OR REPLACE INTO person_index_meta (id, built_at) VALUES (1, ?)',
+                       (int(time.time()),))
+
+    log("Database",
+        f"Person index: {len(rows)} roles indexed in {time.monotonic() - started:.1f}s",
+        xbmc.LOGDEBUG)
+    return True
+
+
+def ensure_person_index(abort_check: Optional[Callable[[], bool]] = None) -> None:
+    """Build the index if no full pass has completed yet."""
+    if not is_built():
+        rebuild_person_index(abort_check)
+
+
+def refresh_person_item(media_type: str, dbid: int) -> None:
+    """Re-index one title's cast (after a library update). No-op before the first full pass."""
+    if media_type not in INDEXED_MEDIA_TYPES or not is_built():
+        return
+
+    from lib.kodi.client import get_item_details
+    details = get_item_details(media_type, dbid, ['cast'])
+    if not isinstance(details, dict):
+        return
+
+    rows = _cast_rows(media_type, dbid, details.get('cast'))
+    # What INSERT OR IGNORE would keep: the first row per actor
+    fresh: Dict[str, tuple] = {}
+    for row in rows:
+        fresh.setdefault(row[0], row)
+
+    with get_db() as cursor:
+        cursor.execute(
+            'SELECT name_key, name, media_type, dbid, role, cast_order FROM person_index '
+            'WHERE media_type = ? AND dbid = ?', (media_type, dbid))
+        # Most updates (ratings, artwork, NFO edits) leave the cast alone; skip the rewrite
+        if {tuple(row) for row in cursor.fetchall()} == set(fresh.values()):
+            return
+        cursor.execute('DELETE FROM person_index WHERE media_type = ? AND dbid = ?',
+                       (media_type, dbid))
+        cursor.executemany(_INSERT_SQL, rows)
+
+
+def get_roles(name: str, media_type: str) -> Optional[Dict[int, str]]:
+    """`{dbid: role}` for every indexed `media_type` title featuring `name`.
+
+    None when the index hasn't been built, so callers fall back to reading cast arrays.
+    """
+    if not is_built():
+        return None
+    with get_db() as cursor:
+        cursor.execute(
+            'SELECT dbid, role FROM person_index WHERE name_key = ? AND media_type = ?',
+            (normalize_name(name), media_type))
+        return {row['dbid']: row['role'] or '' for row in cursor.fetchall()}
@@ -8,7 +8,7 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Optional, Sequence, Dict, List
+from typing import Any, Optional, Sequence, Dict, List, Tuple
 
 from lib.data.database._infrastructure import (
     get_db, DB_PATH, generate_guid, chunked_in_query,
@@ -319,6 +319,32 @@ def update_art_item(art_item_id: int, selected_url: str, auto_applied: bool = Fa
         ''', (selected_url, int(auto_applied), STATUS_COMPLETED, now, art_item_id))  # noqa: E501
 
 
+def commit_auto_apply_batch(art_updates: List[Tuple[int, str]],
+                            statuses: List[Tuple[int, str]]) -> None:
+    """Record auto-apply outcomes for several queue items in one transaction.
+
+    `art_updates` are `(art_item_id, selected_url)` pairs marked completed and auto-applied;
+    `statuses` are `(queue_id, status)` pairs.
+    """
+    if not art_updates and not statuses:
+        return
+
+    with get_db(DB_PATH) as cursor:
+        now = datetime.now().isoformat()
+        if art_updates:
+            cursor.executemany('''
+                UPDATE art_items
+                SET selected_url = ?, auto_applied = 1, status = ?, requires_manual = 0, date_processed = ?
+                WHERE id = ?
+            ''', [(url, STATUS_COMPLETED, now, art_item_id) for art_item_id, url in art_updates])  # noqa: E501
+        if statuses:
+            cursor.executemany('''
+                UPDATE art_queue
+                SET status = ?, date_processed = ?
+                WHERE id = ?
+            ''', [(status, now, queue_id) for queue_id, status in statuses])
+
+
 def update_art_item_status(art_item_id: int, status: str) -> None:
     """Update art item status without changing selected URL."""
     with get_db(DB_PATH) as cursor:
@@ -1,7 +1,7 @@
 """Provider response caching for ratings sources."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
 from typing import Optional
 
 from lib.data.database._infrastructure import (
@@ -32,8 +32,7 @@ def get_provider_cache(provider: str, media_id: str) -> Optional[dict]:
         if not release_date and hints:
             release_date = hints.pop(_RELEASE_DATE_HINT_KEY, None)
         ttl_hours = get_cache_ttl_hours(release_date, hints or None)
-        cached_at = datetime.fromisoformat(row["cached_at"])
-        if datetime.now() - cached_at > timedelta(hours=ttl_hours):
+        if time.time() - row["cached_at"] > ttl_hours * 3600:
             return None
         return _decompress_data(row["data"])
 
@@ -67,6 +66,6 @@ def save_provider_cache(provider: str, media_id: str, data: dict,
         cursor.execute(
             "\n            INSERT OR REPLACE INTO provider_cache "
             "(provider, media_id, data, release_date, cached_at)\n"
-            "            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)\n            ",
-            (provider, media_id, _compress_data(data), release_date)
+            "            VALUES (?, ?, ?, ?, ?)\n            ",
+            (provider, media_id, _compress_data(data), release_date, int(time.time()))
         )
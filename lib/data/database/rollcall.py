@@ -13,6 +13,8 @@ from lib.kodi.client import log
 _DEPENDENT_TABLES: Dict[str, Tuple[Optional[str], str]] = {
     "art_queue": ("media_type", "dbid"),
     "slideshow_pool": ("media_type", "dbid"),
+    "person_index": ("media_type", "dbid"),
+    "stinger_index": ("media_type", "dbid"),
     "ratings_synced": ("media_type", "dbid"),
     "tv_schedule": (None, "tvshowid"),
 }
@@ -1,9 +1,10 @@
 """Slideshow pool database operations."""
 from __future__ import annotations
 
-from typing import List, Optional
+from array import array
+from typing import Dict, List, Optional, Tuple
 
-from lib.data.database._infrastructure import get_db, sql_placeholders
+from lib.data.database._infrastructure import chunked_in_query, get_db, sql_placeholders
 
 _POOL_INSERT_SQL = '''
     INSERT OR REPLACE INTO slideshow_pool
@@ -87,12 +88,46 @@ def pool_generation() -> int:
     return _pool_generation
 
 
-def get_all_pool_rows() -> list:
-    """Return every pool row (all types), for building in-memory rotation cursors."""
+def get_pool_dbids() -> Dict[str, array]:
+    """Return `{media_type: array('q') of dbids}` for every pool row.
+
+    Compact handles for rotation cursors, read from the primary-key index alone. Not rowids:
+    `INSERT OR REPLACE` gives a replaced row a new one, so a cursor built before another
+    process upserted a row would lose it. Full rows are fetched per lookahead with
+    `get_pool_rows`.
+    """
+    result: Dict[str, array] = {}
     with get_db() as cursor:
-        cursor.execute(
-            'SELECT media_type, title, fanart, description, year FROM slideshow_pool')
-        return cursor.fetchall()
+        cursor.execute('SELECT media_type, dbid FROM slideshow_pool')
+        for media_type, dbid in cursor:
+            ids = result.get(media_type)
+            if ids is None:
+                ids = result[media_type] = array('q')
+            ids.append(dbid)
+    return result
+
+
+def get_pool_rows(keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], dict]:
+    """Return `{(media_type, dbid): {media_type, title, fanart, description, year}}`.
+
+    Keys that no longer exist are simply absent.
+    """
+    by_type: Dict[str, List[int]] = {}
+    for media_type, dbid in keys:
+        by_type.setdefault(media_type, []).append(dbid)
+    result: Dict[Tuple[str, int], dict] = {}
+    with get_db() as cursor:
+        for media_type, dbids in by_type.items():
+            rows = chunked_in_query(
+                cursor,
+                'SELECT dbid, title, fanart, description, year FROM slideshow_pool '
+                'WHERE media_type = ? AND dbid IN ({placeholders})',
+                [media_type], dbids)
+            for row in rows:
+                result[(media_type, row['dbid'])] = {
+                    'media_type': media_type, 'title': row['title'], 'fanart': row['fanart'],
+                    'description': row['description'], 'year': row['year']}
+    return result
 
 
 def get_artist_description(dbid: int) -> str:
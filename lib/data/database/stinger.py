@@ -0,0 +1,76 @@
+"""Precomputed stinger (post-credits scene) index for library movies.
+
+One row per movie: whether it has a during- and/or after-credits scene, the source that said
+so, when a negative answer should be looked up again, and a digest of the library fields the
+answer came from (ids and tags), so library edits re-resolve only movies whose inputs changed.
+Filled while Kodi is idle so that movie playback reads it with one primary-key lookup instead
+of TMDB/Trakt requests.
+"""
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from lib.data.database._infrastructure import get_db
+
+_MEDIA_TYPE = 'movie'
+
+
+def get_stinger(dbid: int) -> Optional[Dict[str, object]]:
+    """Return `{has_during, has_after, source}` for a movie, or None if not indexed."""
+    with get_db() as cursor:
+        cursor.execute(
+            'SELECT has_during, has_after, source FROM stinger_index '
+            'WHERE media_type = ? AND dbid = ?',
+            (_MEDIA_TYPE, dbid)
+        )
+        row = cursor.fetchone()
+    if not row:
+        return None
+    return {
+        'has_during': bool(row['has_during']),
+        'has_after': bool(row['has_after']),
+        'source': row['source'],
+    }
+
+
+def save_stinger(dbid: int, has_during: bool, has_after: bool, source: str,
+                 recheck_after_s: Optional[int] = None, inputs: Optional[str] = None) -> None:
+    """Upsert one movie. `recheck_after_s` marks the answer for a later re-lookup."""
+    now = int(time.time())
+    with get_db() as cursor:
+        cursor.execute(
+            'INSERT OR REPLACE INTO stinger_index '
+            '(media_type, dbid, has_during, has_after, source, checked_at, recheck_at, inputs) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (_MEDIA_TYPE, dbid, int(has_during), int(has_after), source, now,
+             now + recheck_after_s if recheck_after_s else None, inputs)
+        )
+
+
+def set_inputs(entries: List[Tuple[int, str]]) -> None:
+    """Record `(dbid, inputs)` for rows stored before inputs were tracked."""
+    if not entries:
+        return
+    with get_db() as cursor:
+        cursor.executemany(
+            'UPDATE stinger_index SET inputs = ? WHERE media_type = ? AND dbid = ?',
+            [(inputs, _MEDIA_TYPE, dbid) for dbid, inputs in entries])
+
+
+def forget_stinger(dbid: int) -> None:
+    """Drop a movie's row so it is resolved again."""
+    with get_db() as cursor:
+        cursor.execute('DELETE FROM stinger_index WHERE media_type = ? AND dbid = ?',
+                       (_MEDIA_TYPE, dbid))
+
+
+def get_current_inputs() -> Dict[int, Optional[str]]:
+    """`{dbid: inputs}` for movies whose row is present and not yet due for a recheck."""
+    with get_db() as cursor:
+        cursor.execute(
+            'SELECT dbid, inputs FROM stinger_index '
+            'WHERE media_type = ? AND (recheck_at IS NULL OR recheck_at > ?)',
+            (_MEDIA_TYPE, int(time.time()))
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
@@ -0,0 +1,30 @@
+"""Per-folder snapshot of Kodi's thumbnail cache disk usage.
+
+One row per folder under Thumbnails (relative path, '' for the root): its mtime and the size
+and count of the files directly inside it. A folder whose mtime is unchanged since the
+snapshot keeps its totals without being listed again.
+"""
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from lib.data.database._infrastructure import get_db
+
+
+def get_snapshot() -> Dict[str, Tuple[int, int, int]]:
+    """`{directory: (mtime_ns, size, file_count)}` from the last scan."""
+    with get_db() as cursor:
+        cursor.execute('SELECT directory, mtime_ns, size, file_count FROM texture_disk_usage')
+        return {row['directory']: (row['mtime_ns'], row['size'], row['file_count'])
+                for row in cursor.fetchall()}
+
+
+def save_snapshot(snapshot: Dict[str, Tuple[int, int, int]]) -> None:
+    """Replace the stored snapshot with `snapshot`."""
+    with get_db() as cursor:
+        cursor.execute('DELETE FROM texture_disk_usage')
+        cursor.executemany(
+            'INSERT INTO texture_disk_usage (directory, mtime_ns, size, file_count) '
+            'VALUES (?, ?, ?, ?)',
+            [(directory, *values) for directory, values in snapshot.items()]
+        )
@@ -1,19 +1,23 @@
 """Single artwork file downloader with error tracking and retry logic."""
 from __future__ import annotations
 
+import hashlib
 import os
 import time
 import urllib.parse
 import requests
 import xbmc
 import xbmcvfs
-from typing import Optional, Tuple, Dict, Callable
+from typing import Optional, Tuple, Dict, Callable, TYPE_CHECKING
 
 from lib.kodi.client import log
 from lib.data.api.client import ApiSession
 from lib.data.api.client import RetryableError
 from lib.infrastructure.paths import vfs_ensure_dir_slash, DirectoryListing
 
+if TYPE_CHECKING:
+    from lib.download.manifest import DownloadManifest
+
 
 # Every chunk costs an abort check and a VFS write, both of which cross into Kodi.
 _CHUNK_SIZE = 256 * 1024
@@ -100,13 +104,16 @@ class DownloadArtwork:
         existing_file_mode: str = 'skip',
         alternate_path: Optional[str] = None,
         abort_flag=None,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        manifest: Optional['DownloadManifest'] = None,
     ) -> Tuple[bool, Optional[str], int, Optional[str]]:
         """Download one artwork file. `local_path` is extension-less; actual extension
         comes from Content-Type.
 
         `existing_file_mode` is `skip`/`overwrite`/`use_existing`. `progress_callback` is
         invoked with each chunk's byte count during streaming so callers can detect live activity.
+        With a `manifest`, a URL already on disk for another job is copied instead of fetched,
+        and every written file is recorded.
         Returns `(success, error_or_None, bytes_written, error_category_or_None)`.
         """
         if not url:
@@ -135,6 +142,12 @@ class DownloadArtwork:
                 if self._find_existing_with_extension(check_path):
                     return False, None, 0, None
 
+        if manifest is not None:
+            copied = self._copy_recorded(manifest, url, local_path, existing_file_mode,
+                                         alternate_path)
+            if copied is not None:
+                return copied
+
         try:
             response = self.session.get_raw(
                 url,
@@ -154,34 +167,24 @@ class DownloadArtwork:
                 return False, "Unknown image type", 0, self.ERROR_BAD_CONTENT
 
             full_path = xbmcvfs.validatePath(local_path + '.' + ext)
-            parent_dir = os.path.dirname(full_path)
-            parent_dir_check = vfs_ensure_dir_slash(parent_dir)
-            if not xbmcvfs.exists(parent_dir_check):
-                xbmcvfs.mkdirs(parent_dir)
-                if not xbmcvfs.exists(parent_dir_check):
-                    self._block_file_writes()
-                    log("Download", f"Cannot create directory: {parent_dir}", xbmc.LOGERROR)
-                    response.close()
-                    return False, f"Cannot create directory: {parent_dir}", 0, self.ERROR_DIRECTORY
+            parent_error = self._ensure_parent_dir(full_path)
+            if parent_error:
+                response.close()
+                return parent_error
 
+            digest = hashlib.sha1() if manifest is not None else None
             bytes_written = self._write_file_stream(
-                full_path, response, abort_flag, progress_callback
+                full_path, response, abort_flag, progress_callback, digest
             )
             self.listing.note_written(local_path + '.' + ext)
 
             if existing_file_mode == 'overwrite':
-                stale_bases = [local_path]
-                if alternate_path:
-                    stale_bases.append(alternate_path)
-                for base in stale_bases:
-                    for ext_type in self.CONTENT_TYPE_MAP.values():
-                        stale_file = xbmcvfs.validatePath(base + '.' + ext_type)
-                        if stale_file == full_path:
-                            continue
-                        if xbmcvfs.exists(stale_file):
-                            if not xbmcvfs.delete(stale_file):
-                                log("Download", f"Failed to delete old pattern file: {stale_file}",
-                                    xbmc.LOGWARNING)
+                self._delete_stale(full_path, local_path, alternate_path)
+
+            if manifest is not None:
+                manifest.record(url, local_path, full_path, bytes_written, digest.hexdigest(),
+                                response.headers.get('ETag'),
+                                response.headers.get('Last-Modified'))
 
             self.provider_errors[hostname] = 0
             self.provider_blocked_until.pop(hostname, None)
@@ -208,6 +211,71 @@ class DownloadArtwork:
             log("Download", f"Unexpected error downloading {url}: {str(e)}", xbmc.LOGERROR)
             return False, f"Unexpected error: {str(e)}", 0, self.ERROR_UNEXPECTED
 
+    def _ensure_parent_dir(self, full_path: str) -> Optional[Tuple[bool, str, int, str]]:
+        """Create `full_path`'s folder if needed; the failure result when that isn't possible."""
+        parent_dir = os.path.dirname(full_path)
+        parent_dir_check = vfs_ensure_dir_slash(parent_dir)
+        if not xbmcvfs.exists(parent_dir_check):
+            xbmcvfs.mkdirs(parent_dir)
+            if not xbmcvfs.exists(parent_dir_check):
+                self._block_file_writes()
+                log("Download", f"Cannot create directory: {parent_dir}", xbmc.LOGERROR)
+                return False, f"Cannot create directory: {parent_dir}", 0, self.ERROR_DIRECTORY
+        return None
+
+    def _delete_stale(self, full_path: str, local_path: str,
+                      alternate_path: Optional[str]) -> None:
+        """Overwrite mode: remove other-extension and other-naming copies of the new file."""
+        stale_bases = [local_path]
+        if alternate_path:
+            stale_bases.append(alternate_path)
+        for base in stale_bases:
+            for ext_type in self.CONTENT_TYPE_MAP.values():
+                stale_file = xbmcvfs.validatePath(base + '.' + ext_type)
+                if stale_file == full_path:
+                    continue
+                if xbmcvfs.exists(stale_file):
+                    if not xbmcvfs.delete(stale_file):
+                        log("Download", f"Failed to delete old pattern file: {stale_file}",
+                            xbmc.LOGWARNING)
+
+    def _copy_recorded(self, manifest: 'DownloadManifest', url: str, local_path: str,
+                       existing_file_mode: str, alternate_path: Optional[str]
+                       ) -> Optional[Tuple[bool, Optional[str], int, Optional[str]]]:
+        """Reuse a file already downloaded from `url` for another job; None to fetch instead.
+
+        Overwrite mode only reuses files fetched during this run. A source it would delete as
+        a stale alternate is moved, not copied.
+        """
+        source = manifest.copy_source(url, local_path,
+                                      this_run_only=existing_file_mode == 'overwrite')
+        if source is None:
+            return None
+
+        source_path = source['file_path']
+        full_path = xbmcvfs.validatePath(local_path + os.path.splitext(source_path)[1])
+        if full_path == source_path:
+            return None
+        parent_error = self._ensure_parent_dir(full_path)
+        if parent_error:
+            return parent_error
+
+        move = (existing_file_mode == 'overwrite' and alternate_path is not None
+                and os.path.splitext(source_path)[0] == xbmcvfs.validatePath(alternate_path))
+        if not (xbmcvfs.rename(source_path, full_path) if move
+                else xbmcvfs.copy(source_path, full_path)):
+            log("Download", f"Local copy failed, fetching instead: {source_path}", xbmc.LOGDEBUG)
+            return None
+        self.listing.note_written(local_path + os.path.splitext(source_path)[1])
+
+        if move:
+            manifest.forget(url, source['local_path'])
+        if existing_file_mode == 'overwrite':
+            self._delete_stale(full_path, local_path, alternate_path)
+        manifest.record(url, local_path, full_path, source['size'], source['content_hash'],
+                        source['etag'], source['last_modified'], copied=True)
+        return True, None, 0, None
+
     def _find_existing_with_extension(self, base_path: str) -> Optional[str]:
         """Return the first existing file at `base_path.<ext>` for any known extension, or None."""
         return self.listing.find_with_extension(base_path, self.CONTENT_TYPE_MAP.values())
@@ -218,8 +286,9 @@ class DownloadArtwork:
         return self.CONTENT_TYPE_MAP.get(content_type)
 
     def _write_file_stream(self, path: str, response, abort_flag=None,
-                           progress_callback: Optional[Callable[[int], None]] = None) -> int:
-        """Stream `response` body to `path`.
+                           progress_callback: Optional[Callable[[int], None]] = None,
+                           digest=None) -> int:
+        """Stream `response` body to `path`, feeding each chunk to `digest` when given.
 
         Deletes partial file on error. Raises `_StreamNetworkError` if the body transfer drops
         mid-stream, `_DownloadAborted` on abort, `IOError` on write failure.
@@ -256,6 +325,8 @@ class DownloadArtwork:
                         if not written:
                             raise IOError(f"Failed to write to {path}")
                         bytes_written += len(chunk)
+                        if digest is not None:
+                            digest.update(chunk)
                         if progress_callback:
                             progress_callback(len(chunk))
         except Exception:
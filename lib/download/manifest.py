@@ -0,0 +1,120 @@
+"""Per-run view of the download manifest for incremental bulk artwork downloads."""
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import xbmcvfs
+
+from lib.data.database import download_manifest as db_manifest
+from lib.infrastructure.paths import DirectoryListing, vfs_split
+
+
+class DownloadManifest:
+    """Recorded files for one run's job URLs, plus prune/copy counters for the report.
+
+    Shared by every download worker; the in-memory view and counters are lock-protected.
+    """
+
+    def __init__(self, urls: Sequence[str]):
+        self._entries: Dict[str, List[dict]] = db_manifest.get_entries_for_urls(urls)
+        self._lock = threading.Lock()
+        self._this_run: Set[Tuple[str, str]] = set()
+        self.pruned = 0
+        self.copied = 0
+        self.bytes_saved = 0
+
+    def _entry(self, url: str, local_path: str) -> Optional[dict]:
+        for entry in self._entries.get(url, ()):
+            if entry['local_path'] == local_path:
+                return entry
+        return None
+
+    def _drop(self, url: str, local_path: str) -> None:
+        entries = self._entries.get(url)
+        if entries:
+            entries[:] = [e for e in entries if e['local_path'] != local_path]
+
+    @staticmethod
+    def _present(file_path: str, listing: DirectoryListing) -> bool:
+        directory, filename = vfs_split(file_path)
+        names = listing.files(directory) if directory else None
+        if names is not None:
+            return filename.lower() in names
+        return bool(xbmcvfs.exists(file_path))
+
+    def prune(self, jobs: List[tuple], listing: DirectoryListing,
+              existing_file_mode: str) -> List[tuple]:
+        """Drop jobs whose recorded file is still in place; return the rest.
+
+        In `overwrite` mode nothing is dropped: the user asked for every file to be fetched
+        again. Jobs repeating a URL already queued move to the end, so by the time a worker
+        reaches them the first copy is usually on disk and can be copied instead of fetched.
+        """
+        kept: List[tuple] = []
+        repeats: List[tuple] = []
+        seen_urls = set()
+        gone: List[Tuple[str, str]] = []
+        check_recorded = existing_file_mode != 'overwrite'
+
+        for job in jobs:
+            url, local_path = job[0], job[1]
+            entry = self._entry(url, local_path) if check_recorded else None
+            if entry is not None:
+                if self._present(entry['file_path'], listing):
+                    self.pruned += 1
+                    continue
+                gone.append((url, local_path))
+                self._drop(url, local_path)
+
+            if url in seen_urls:
+                repeats.append(job)
+            else:
+                seen_urls.add(url)
+                kept.append(job)
+
+        db_manifest.forget_entries(gone)
+        return kept + repeats
+
+    def copy_source(self, url: str, local_path: str,
+                    this_run_only: bool = False) -> Optional[dict]:
+        """A recorded file of `url` written for another job that is still on disk.
+
+        `this_run_only` limits it to files written during this run (for overwrite mode).
+        """
+        with self._lock:
+            candidates = [dict(e) for e in self._entries.get(url, ())
+                          if e['local_path'] != local_path
+                          and (not this_run_only or (url, e['local_path']) in self._this_run)]
+        for entry in candidates:
+            if xbmcvfs.exists(entry['file_path']):
+                return entry
+        return None
+
+    def record(self, url: str, local_path: str, file_path: str, size: int, content_hash: str,
+               etag: Optional[str] = None, last_modified: Optional[str] = None,
+               copied: bool = False) -> None:
+        """Store the file written for a job; `copied` counts it as a fetch saved."""
+        db_manifest.record_download(url, local_path, file_path, size, content_hash,
+                                    etag, last_modified)
+        entry = {'url': url, 'local_path': local_path, 'file_path': file_path, 'size': size,
+                 'content_hash': content_hash, 'etag': etag, 'last_modified': last_modified}
+        with self._lock:
+            self._drop(url, local_path)
+            self._entries.setdefault(url, []).append(entry)
+            self._this_run.add((url, local_path))
+            if copied:
+                self.copied += 1
+                self.bytes_saved += size
+
+    def forget(self, url: str, local_path: str) -> None:
+        """Drop a job's record after its file was moved away."""
+        with self._lock:
+            self._drop(url, local_path)
+        db_manifest.forget_entries([(url, local_path)])
+
+    def get_stats(self) -> Dict[str, int]:
+        """`pruned`, `copied` and `bytes_saved` so far."""
+        with self._lock:
+            return {'pruned': self.pruned, 'copied': self.copied,
+                    'bytes_saved': self.bytes_saved}
@@ -3,18 +3,22 @@ from __future__ import annotations
 
 import os
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 import xbmcvfs
 
 from lib.infrastructure.workers import WorkerQueue, VFS_WORKER_COUNT
 from lib.download.artwork import DownloadArtwork
 
+if TYPE_CHECKING:
+    from lib.download.manifest import DownloadManifest
+
 
 class DownloadQueue(WorkerQueue):
     """Multi-threaded artwork download queue; each worker owns its own `DownloadArtwork`."""
 
     def __init__(self, num_workers: Optional[int] = None, existing_file_mode: str = 'skip',
-                 abort_flag=None, task_context=None):
+                 abort_flag=None, task_context=None,
+                 manifest: Optional['DownloadManifest'] = None):
         super().__init__(
             num_workers=num_workers or VFS_WORKER_COUNT,
             abort_flag=abort_flag,
@@ -23,6 +27,7 @@ class DownloadQueue(WorkerQueue):
         )
 
         self.existing_file_mode = existing_file_mode
+        self.manifest = manifest
         self.artworks: Dict[int, DownloadArtwork] = {}
 
         self._stats_lock = threading.Lock()
@@ -61,6 +66,8 @@ class DownloadQueue(WorkerQueue):
                 'error_categories': dict(self.stats_error_categories),
                 'activity': self.stats_activity
             })
+        if self.manifest is not None:
+            base_stats.update(self.manifest.get_stats())
         return base_stats
 
     def _on_progress(self, _chunk_bytes: int) -> None:
@@ -81,7 +88,8 @@ class DownloadQueue(WorkerQueue):
             url=url,
             local_path=local_path,            existing_file_mode=self.existing_file_mode,
             alternate_path=alternate_path,            abort_flag=self.abort_flag,
-            progress_callback=self._on_progress
+            progress_callback=self._on_progress,
+            manifest=self.manifest
         )
 
         with self._stats_lock:
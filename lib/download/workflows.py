@@ -10,6 +10,7 @@ import xbmcvfs
 from typing import Optional, List, Dict, Tuple, Any
 
 from lib.kodi.client import KODI_GET_LIBRARY_METHODS, get_library_items
+from lib.download.manifest import DownloadManifest
 from lib.download.queue import DownloadQueue
 from lib.infrastructure.paths import (
     DirectoryListing, PathBuilder, get_album_folders, resolve_media_file, use_basename_for
@@ -181,18 +182,19 @@ def get_library_items_for_download(media_types: List[str]) -> List[Dict[str, Any
 
 
 def build_download_jobs(
-    items: List[Dict[str, Any]]
+    items: List[Dict[str, Any]], listing: Optional[DirectoryListing] = None
 ) -> Tuple[List[Tuple[str, str, str, str, Optional[str], str]], Dict[str, int]]:
     """Build download jobs and per-type mismatch counters.
 
     Jobs are `(url, local_path, art_type, title, alternate_path, media_type)` tuples.
     Mismatch keys: `{movie,mvid}_{basename,folder}_to_{other}`. Each increments when
-    an existing file under the opposite naming convention is detected.
+    an existing file under the opposite naming convention is detected. Pass `listing` to
+    share its folder listings with the caller.
     """
     log("Artwork", f"Building download jobs from {len(items)} library items", xbmc.LOGDEBUG)
     jobs = []
     path_builder = PathBuilder()
-    listing = DirectoryListing()
+    listing = listing or DirectoryListing()
 
     savewith_basefilename = ADDON.getSettingBool('download.savewith_basefilename')
 
@@ -341,7 +343,13 @@ def download_scope_artwork(scope: str, media_filter: Optional[List[str]] = None,
         )
         existing_file_mode = ['skip', 'overwrite'][existing_file_mode_int]
 
-        jobs, mismatch_counts = build_download_jobs(items)
+        listing = DirectoryListing()
+        jobs, mismatch_counts = build_download_jobs(items, listing)
+        total_jobs = len(jobs)
+        manifest = DownloadManifest([job[0] for job in jobs])
+        jobs = manifest.prune(jobs, listing, existing_file_mode)
+        if manifest.pruned:
+            log("Artwork", f"{manifest.pruned} of {total_jobs} jobs unchanged since last run")
 
         if existing_file_mode == 'overwrite' and sum(mismatch_counts.values()) > 0:
             progress.close()
@@ -383,10 +391,15 @@ def download_scope_artwork(scope: str, media_filter: Optional[List[str]] = None,
 
         if not jobs:
             progress.close()
-            show_ok(
-                ADDON.getLocalizedString(32290),
-                ADDON.getLocalizedString(32118).format(len(items))
-            )
+            if not total_jobs:
+                show_ok(
+                    ADDON.getLocalizedString(32290),
+                    ADDON.getLocalizedString(32118).format(len(items))
+                )
+            else:
+                _show_download_report(
+                    manifest.get_stats(), total_jobs, scope=scope,
+                    use_background=use_background, mismatch_counts=mismatch_counts)
             return
 
         if monitor.abortRequested() or (
@@ -404,7 +417,8 @@ def download_scope_artwork(scope: str, media_filter: Optional[List[str]] = None,
             queue = DownloadQueue(
                 existing_file_mode=existing_file_mode,
                 abort_flag=ctx.abort_flag,
-                task_context=ctx
+                task_context=ctx,
+                manifest=manifest
             )
             queue.start()
 
@@ -500,16 +514,21 @@ def download_scope_artwork(scope: str, media_filter: Optional[List[str]] = None,
                 log("Artwork", f"Download finished: downloaded={final_stats.get('downloaded', 0)} "
                     f"skipped={final_stats.get('skipped', 0)} "
                     f"failed={final_stats.get('failed', 0)} "
-                    f"of {len(jobs)} jobs (cancelled={cancelled}, stalled={stalled}) "
+                    f"pruned={final_stats.get('pruned', 0)} "
+                    f"copied={final_stats.get('copied', 0)} "
+                    f"of {total_jobs} jobs (cancelled={cancelled}, stalled={stalled}) "
                     f"errors={final_stats.get('error_categories', {})}")
 
                 db.save_operation_stats('artwork_download', {
-                    'total_jobs': len(jobs),
+                    'total_jobs': total_jobs,
                     'total_items': len(items),
                     'downloaded': final_stats.get('downloaded', 0),
                     'skipped': final_stats.get('skipped', 0),
                     'failed': final_stats.get('failed', 0),
                     'bytes_downloaded': final_stats.get('bytes_downloaded', 0),
+                    'pruned': final_stats.get('pruned', 0),
+                    'copied': final_stats.get('copied', 0),
+                    'bytes_saved': final_stats.get('bytes_saved', 0),
                     'cancelled': cancelled,
                     'stalled': stalled,
                     'mismatch_counts': mismatch_counts,
@@ -518,7 +537,7 @@ def download_scope_artwork(scope: str, media_filter: Optional[List[str]] = None,
                 }, scope=scope)
 
                 _show_download_report(
-                    final_stats, len(jobs), scope=scope, use_background=use_background,
+                    final_stats, total_jobs, scope=scope, use_background=use_background,
                     mismatch_counts=mismatch_counts, stalled=stalled)
 
             finally:
@@ -620,6 +639,13 @@ def _show_download_report(stats: Dict, total_jobs: int, scope: str = 'all',
         "",
         f"Total size: {mb:.2f} MB",
     ]
+    pruned = stats.get('pruned', 0)
+    copied = stats.get('copied', 0)
+    if pruned or copied:
+        saved_mb = stats.get('bytes_saved', 0) / (1024 * 1024)
+        lines[6:6] = [f"Unchanged since last run: {pruned}",
+                      f"Copied from existing files: {copied}"]
+        lines.append(f"Saved: {saved_mb:.2f} MB")
     if stalled:
         lines.extend([
             "",
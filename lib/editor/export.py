@@ -0,0 +1,302 @@
+"""Whole-library NFO export.
+
+Details are fetched in `batch_request` pages and rendered by a worker pool through the same
+`render_nfo` path as the single-item export, so output is identical. Files whose content
+already matches are skipped, and writes drain through one bounded I/O queue so slow
+shares apply back-pressure instead of buffering the library in memory.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from queue import Full, Queue
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import xbmc
+import xbmcgui
+
+from lib.kodi.client import (
+    ADDON, KODI_GET_DETAILS_METHODS, batch_request, extract_result, get_library_items, log,
+    request, LibraryScanAborted,
+)
+from lib.editor.nfo import NFO_PROPERTIES, nfo_targets, render_nfo, write_nfo_content
+from lib.infrastructure import tasks as task_manager
+from lib.infrastructure.dialogs import ProgressDialog
+from lib.infrastructure.menus import confirm_cancel_running_task
+from lib.infrastructure.workers import WorkerQueue
+
+EXPORT_MEDIA_TYPES = ('movie', 'tvshow', 'episode', 'musicvideo')
+
+# Details per JSON-RPC batch; full NFO property sets make each response large.
+DETAILS_PAGE_SIZE = 50
+# Pending writes before render workers block; bounds memory on slow shares.
+WRITE_QUEUE_SIZE = 64
+# How long shutdown waits on renderers and the writer; a hung SMB/NFS call is abandoned.
+SHUTDOWN_TIMEOUT_S = 30.0
+
+
+def _fetch_set_overviews() -> Dict[int, str]:
+    """One `GetMovieSets` call in place of a set lookup per exported movie."""
+    resp = request("VideoLibrary.GetMovieSets", {"properties": ["plot"]})
+    return {
+        s['setid']: s.get('plot') or ""
+        for s in extract_result(resp, 'sets', []) if isinstance(s, dict) and s.get('setid')
+    }
+
+
+class _NfoRenderQueue(WorkerQueue):
+    """Renders `(media_type, details)` items and hands changed NFO text to the writer."""
+
+    def __init__(self, write_queue: Queue, writer: threading.Thread, include_watched: bool,
+                 set_overviews: Dict[int, str], abort_flag=None, task_context=None):
+        super().__init__(abort_flag=abort_flag, task_context=task_context,
+                         result_retention='none')
+        self.write_queue = write_queue
+        self.writer = writer
+        self.include_watched = include_watched
+        self.set_overviews = set_overviews
+        self.stats_lock = threading.Lock()
+        self.unchanged = 0
+        self.skipped = 0
+        self.dropped = 0
+
+    def _put(self, entry: Tuple[str, str]) -> None:
+        """Queue a write, giving up (and counting it dropped) if the writer has exited."""
+        while True:
+            try:
+                self.write_queue.put(entry, timeout=0.5)
+                return
+            except Full:
+                if not self.writer.is_alive():
+                    with self.stats_lock:
+                        self.dropped += 1
+                    return
+
+    def _process_item(self, item: Tuple[str, Dict[str, Any]], worker_id: int) -> Optional[Dict]:
+        media_type, details = item
+        targets = nfo_targets(media_type, details.get("file", ""))
+        if not targets:
+            with self.stats_lock:
+                self.skipped += 1
+            return {'success': True}
+
+        for path in targets:
+            content, existing_text = render_nfo(
+                path, media_type, details, self.include_watched, force_create=True,
+                set_overviews=self.set_overviews)
+            if content is None:
+                continue
+            if existing_text == content:
+                with self.stats_lock:
+                    self.unchanged += 1
+                continue
+            self._put((path, content))
+        return {'success': True}
+
+
+def _join_all(threads: List[threading.Thread], timeout: float,
+              should_stop: Callable[[], bool]) -> bool:
+    """Join `threads` until `timeout` passes or an abort is requested. True if all exited."""
+    monitor = xbmc.Monitor()
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        while thread.is_alive():
+            if time.monotonic() >= deadline or should_stop() or monitor.abortRequested():
+                return False
+            thread.join(0.1)
+    return True
+
+
+class _NfoWriter(threading.Thread):
+    """Single consumer of the bounded write queue. A `None` item stops it."""
+
+    def __init__(self, write_queue: Queue):
+        super().__init__(daemon=True, name="NfoWriter")
+        self.write_queue = write_queue
+        self.written = 0
+        self.failed = 0
+
+    def run(self) -> None:
+        while True:
+            entry = self.write_queue.get()
+            try:
+                if entry is None:
+                    return
+                path, content = entry
+                if write_nfo_content(path, content):
+                    self.written += 1
+                else:
+                    self.failed += 1
+            except Exception as e:
+                log("Editor", f"NFO export: writing {entry[0]} failed: {e}", xbmc.LOGERROR)
+                self.failed += 1
+            finally:
+                self.write_queue.task_done()
+
+
+def export_library_nfos(media_types: Tuple[str, ...] = EXPORT_MEDIA_TYPES,
+                        progress_callback: Optional[Callable[[int, int], None]] = None,
+                        abort_check: Optional[Callable[[], bool]] = None,
+                        abort_flag=None, task_context=None) -> Dict[str, Any]:
+    """Write NFOs for every library item of `media_types`.
+
+    Returns `{written, unchanged, skipped, failed, total, elapsed, items_per_second,
+    cancelled}`. `progress_callback(done, total)` is called after each details page.
+    """
+    stats: Dict[str, Any] = {
+        'written': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0, 'total': 0,
+        'elapsed': 0.0, 'items_per_second': 0.0, 'cancelled': False,
+    }
+    started = time.monotonic()
+
+    def should_stop() -> bool:
+        return bool(abort_check and abort_check())
+
+    try:
+        ids: List[Tuple[str, int]] = [
+            (item['media_type'], item['dbid'])
+            for item in get_library_items(list(media_types), ['file'], abort_check=should_stop)
+            if item.get('dbid')
+        ]
+    except LibraryScanAborted:
+        stats['cancelled'] = True
+        return stats
+
+    stats['total'] = len(ids)
+    if not ids:
+        return stats
+
+    write_queue: Queue = Queue(maxsize=WRITE_QUEUE_SIZE)
+    writer = _NfoWriter(write_queue)
+    renderer = _NfoRenderQueue(
+        write_queue, writer,
+        include_watched=ADDON.getSettingBool('nfo.write_watched_state'),
+        set_overviews=_fetch_set_overviews() if 'movie' in media_types else {},
+        abort_flag=abort_flag, task_context=task_context,
+    )
+    writer.start()
+    renderer.start()
+    monitor = xbmc.Monitor()
+    finished = False
+
+    try:
+        for start in range(0, len(ids), DETAILS_PAGE_SIZE):
+            if should_stop():
+                stats['cancelled'] = True
+                break
+
+            page = ids[start:start + DETAILS_PAGE_SIZE]
+            calls = []
+            for media_type, dbid in page:
+                method, id_key, _ = KODI_GET_DETAILS_METHODS[media_type]
+                calls.append({
+                    'method': method,
+                    'params': {id_key: dbid, 'properties': NFO_PROPERTIES[media_type]},
+                })
+
+            for (media_type, dbid), resp in zip(page, batch_request(calls)):
+                details = extract_result(resp, KODI_GET_DETAILS_METHODS[media_type][2])
+                if not isinstance(details, dict):
+                    log("Editor", f"NFO export: no details for {media_type} {dbid}",
+                        xbmc.LOGWARNING)
+                    stats['failed'] += 1
+                    continue
+                renderer.add_item((media_type, details), dedupe_key=(media_type, dbid))
+
+            # Keep at most a couple of pages of details in memory ahead of the renderers
+            while renderer.queue.qsize() > DETAILS_PAGE_SIZE * 2 and not should_stop():
+                if monitor.waitForAbort(0.05):
+                    break
+
+            if progress_callback:
+                progress_callback(min(start + len(page), len(ids)), len(ids))
+
+        while not stats['cancelled'] and (not renderer.queue.empty() or renderer.processing_set):
+            if should_stop() or monitor.waitForAbort(0.1):
+                stats['cancelled'] = True
+        finished = True
+    finally:
+        # Render workers must be gone before the writer's sentinel, or a late result would
+        # be queued behind it; the writer keeps draining meanwhile, so their puts can't block.
+        renderer.stop(wait=finished and not stats['cancelled'])
+        if not _join_all(renderer.workers, SHUTDOWN_TIMEOUT_S, should_stop):
+            log("Editor", "NFO export: render workers still busy, abandoning their output",
+                xbmc.LOGWARNING)
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT_S
+        while writer.is_alive() and time.monotonic() < deadline:
+            try:
+                write_queue.put(None, timeout=0.5)
+                break
+            except Full:
+                pass
+        if not _join_all([writer], SHUTDOWN_TIMEOUT_S, should_stop):
+            log("Editor", "NFO export: writer still busy, abandoning pending writes",
+                xbmc.LOGWARNING)
+
+    stats['written'] = writer.written
+    stats['failed'] += writer.failed + renderer.failed_count + renderer.dropped
+    stats['unchanged'] = renderer.unchanged
+    stats['skipped'] = renderer.skipped
+    stats['elapsed'] = time.monotonic() - started
+    processed = renderer.completed_count
+    stats['items_per_second'] = processed / stats['elapsed'] if stats['elapsed'] > 0 else 0.0
+
+    log("Editor",
+        f"NFO export: {processed} items in {stats['elapsed']:.1f}s "
+        f"({stats['items_per_second']:.1f} items/s), written={stats['written']}, "
+        f"unchanged={stats['unchanged']}, skipped={stats['skipped']}, failed={stats['failed']}",
+        xbmc.LOGINFO)
+    return stats
+
+
+def run_export_library_nfos() -> None:
+    """Confirm, then export NFOs for the whole video library with a progress dialog."""
+    dialog = xbmcgui.Dialog()
+    operation_name = ADDON.getLocalizedString(32685)
+
+    if not dialog.yesno(operation_name, ADDON.getLocalizedString(32686)):
+        return
+
+    if task_manager.is_task_running():
+        if not confirm_cancel_running_task(operation_name):
+            return
+        task_manager.cancel_task()
+        monitor = xbmc.Monitor()
+        while task_manager.is_task_running() and not monitor.abortRequested():
+            monitor.waitForAbort(0.1)
+
+    progress = None
+    try:
+        with task_manager.TaskContext(operation_name) as ctx:
+            progress = ProgressDialog(use_background=False, heading=operation_name)
+            progress.create("")
+            active = progress
+
+            def on_progress(done: int, total: int) -> None:
+                active.update(int(done / total * 100),
+                              ADDON.getLocalizedString(32688).format(done, total))
+
+            stats = export_library_nfos(
+                progress_callback=on_progress,
+                abort_check=lambda: ctx.abort_flag.is_requested() or active.is_cancelled(),
+                abort_flag=ctx.abort_flag,
+                task_context=ctx,
+            )
+            progress.close()
+
+        message = ADDON.getLocalizedString(32687).format(
+            stats['written'], stats['unchanged'], stats['skipped'], stats['failed'],
+            stats['items_per_second'],
+        )
+        if stats['cancelled']:
+            message = f"{message}[CR][CR][B]Cancelled[/B]"
+        dialog.ok(operation_name, message)
+
+    except Exception as e:
+        if progress:
+            try:
+                progress.close()
+            except Exception:
+                pass
+        log("Editor", f"NFO export failed: {e}", xbmc.LOGERROR)
+        dialog.ok(operation_name, str(e))
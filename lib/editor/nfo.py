@@ -25,7 +25,7 @@ _ROOT_TAG = {
 }
 
 # JSON-RPC properties needed to populate the NFO, per media type.
-_NFO_PROPERTIES = {
+NFO_PROPERTIES = {
     'movie': [
         "title", "originaltitle", "sorttitle", "ratings", "userrating", "top250",
         "plotoutline", "plot", "tagline", "runtime", "mpaa", "playcount", "lastplayed",
@@ -193,7 +193,18 @@ def _fetch_set_overview(setid: Any) -> str:
     return ""
 
 
-def _build_root(media_type: str, d: Dict[str, Any], include_watched: bool = True) -> ET.Element:
+def _set_overview(setid: Any, set_overviews: Optional[Dict[int, str]]) -> str:
+    """Overview from a prefetched `setid -> plot` map when given, else one lookup per call."""
+    if set_overviews is None:
+        return _fetch_set_overview(setid)
+    try:
+        return set_overviews.get(int(setid), "")
+    except (TypeError, ValueError):
+        return ""
+
+
+def _build_root(media_type: str, d: Dict[str, Any], include_watched: bool = True,
+                set_overviews: Optional[Dict[int, str]] = None) -> ET.Element:
     """Serialize details into an NFO root element in Kodi's exact field order."""
     tag = _ROOT_TAG[media_type]
     root = ET.Element(tag)
@@ -241,7 +252,7 @@ def _build_root(media_type: str, d: Dict[str, Any], include_watched: bool = True
     if set_name:
         set_elem = ET.SubElement(root, "set")
         _set_str(set_elem, "name", set_name)
-        _set_str_if(set_elem, "overview", _fetch_set_overview(d.get("setid")))
+        _set_str_if(set_elem, "overview", _set_overview(d.get("setid"), set_overviews))
 
     _set_array(root, "tag", d.get("tag"))
     _set_array(root, "credits", d.get("writer"))
@@ -296,21 +307,32 @@ def _indent(elem: ET.Element, level: int = 0) -> None:
         elem.tail = pad
 
 
-def _read_existing(path: str) -> Optional[ET.Element]:
+def _read_existing_text(path: str) -> str:
     try:
         with xbmcvfs.File(path) as f:
-            content = f.read()
-        if content:
-            return ET.fromstring(content)
+            return f.read() or ""
+    except Exception as e:
+        log("Editor", f"NFO: failed to read existing {path}: {e}", xbmc.LOGWARNING)
+    return ""
+
+
+def _parse_existing(path: str, content: str) -> Optional[ET.Element]:
+    if not content:
+        return None
+    try:
+        return ET.fromstring(content)
     except Exception as e:
         log("Editor", f"NFO: failed to read existing {path}: {e}", xbmc.LOGWARNING)
     return None
 
 
-def _write(path: str, root: ET.Element) -> bool:
+def _render(root: ET.Element) -> str:
     _indent(root)
     body = ET.tostring(root, encoding="unicode")
-    content = '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>\n' + body + '\n'
+    return '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>\n' + body + '\n'
+
+
+def write_nfo_content(path: str, content: str) -> bool:
     try:
         with xbmcvfs.File(path, 'w') as f:
             return bool(f.write(content))
@@ -319,15 +341,46 @@ def _write(path: str, root: ET.Element) -> bool:
         return False
 
 
-def _write_one(path: str, media_type: str, details: Dict[str, Any],
-               include_watched: bool, force_create: bool = False) -> bool:
-    existing = _read_existing(path) if xbmcvfs.exists(path) else None
+def render_nfo(path: str, media_type: str, details: Dict[str, Any], include_watched: bool,
+               force_create: bool = False,
+               set_overviews: Optional[Dict[int, str]] = None) -> Tuple[Optional[str], str]:
+    """Build the NFO text for `path`, merged over any existing file.
+
+    Returns `(content, existing_text)`; `content` is None when there is no NFO to update
+    and creation is not allowed.
+    """
+    existing_text = _read_existing_text(path) if xbmcvfs.exists(path) else ""
+    existing = _parse_existing(path, existing_text)
     if existing is None and not force_create and not ADDON.getSettingBool('nfo.create_missing'):
-        return False
-    root = _build_root(media_type, details, include_watched)
+        return None, existing_text
+    root = _build_root(media_type, details, include_watched, set_overviews)
     if existing is not None:
         _merge_preserve(root, existing)
-    return _write(path, root)
+    return _render(root), existing_text
+
+
+def _write_one(path: str, media_type: str, details: Dict[str, Any],
+               include_watched: bool, force_create: bool = False) -> bool:
+    content, _ = render_nfo(path, media_type, details, include_watched, force_create)
+    if content is None:
+        return False
+    return write_nfo_content(path, content)
+
+
+def nfo_targets(media_type: str, media_file: str) -> List[str]:
+    """NFO paths to write for an item: the primary path, plus an existing movie.nfo sibling."""
+    path = _nfo_path(media_type, media_file)
+    if not path:
+        return []
+    targets = [path]
+    # Movies also support a sibling movie.nfo; update it only if it already exists.
+    if media_type == "movie":
+        slash = max(media_file.rfind('/'), media_file.rfind('\\'))
+        if slash != -1:
+            alt = media_file[:slash + 1] + "movie.nfo"
+            if alt != path and xbmcvfs.exists(alt):
+                targets.append(alt)
+    return targets
 
 
 def write_nfo(media_type: str, dbid: int, forced: bool = False) -> bool:
@@ -340,31 +393,21 @@ def write_nfo(media_type: str, dbid: int, forced: bool = False) -> bool:
     if media_type not in _ROOT_TAG:
         return False
 
-    details = get_item_details(media_type, dbid, _NFO_PROPERTIES[media_type])
+    details = get_item_details(media_type, dbid, NFO_PROPERTIES[media_type])
     if not isinstance(details, dict):
         log("Editor", f"NFO: no details for {media_type} {dbid}", xbmc.LOGWARNING)
         return False
 
-    media_file = details.get("file", "")
-    path = _nfo_path(media_type, media_file)
-    if not path:
+    targets = nfo_targets(media_type, details.get("file", ""))
+    if not targets:
         log("Editor", f"NFO: no path for {media_type} {dbid}", xbmc.LOGWARNING)
         return False
 
     include_watched = ADDON.getSettingBool('nfo.write_watched_state')
 
-    targets: List[Tuple[str, str]] = [(path, media_type)]
-    # Movies also support a sibling movie.nfo; update it only if it already exists.
-    if media_type == "movie":
-        slash = max(media_file.rfind('/'), media_file.rfind('\\'))
-        if slash != -1:
-            alt = media_file[:slash + 1] + "movie.nfo"
-            if alt != path and xbmcvfs.exists(alt):
-                targets.append((alt, media_type))
-
     wrote = False
-    for target_path, target_type in targets:
-        if _write_one(target_path, target_type, details, include_watched, force_create=forced):
+    for target_path in targets:
+        if _write_one(target_path, media_type, details, include_watched, force_create=forced):
             wrote = True
             log("Editor", f"NFO: wrote {target_path}", xbmc.LOGDEBUG)
     return wrote
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import threading
+import time
 
 import xbmcgui
 import xbmcvfs
@@ -157,11 +158,15 @@ class DirectoryListing:
     """Per-directory filename cache, so existence checks cost one listing instead of a stat each.
 
     Every stat is a network round trip serialised behind Kodi's global NFS/SMB lock.
+    Listings never expire unless `ttl` (seconds) is given; `include_dirs` adds subfolder names.
     """
 
-    def __init__(self, max_dirs: int = 4096):
-        self._dirs: Dict[str, Set[str]] = {}
+    def __init__(self, max_dirs: int = 4096, ttl: Optional[float] = None,
+                 include_dirs: bool = False):
+        self._dirs: Dict[str, Tuple[Set[str], float]] = {}
         self.max_dirs = max_dirs
+        self.ttl = ttl
+        self.include_dirs = include_dirs
 
     def files(self, directory: str) -> Optional[Set[str]]:
         """Lowercased filenames in `directory`; None when it can't be listed or came back empty.
@@ -172,28 +177,33 @@ class DirectoryListing:
         """
         cached = self._dirs.get(directory)
         if cached is not None:
-            return cached
+            if self.ttl is None or cached[1] > time.monotonic():
+                return cached[0]
+            self._dirs.pop(directory, None)
 
         try:
-            _subdirs, names = xbmcvfs.listdir(vfs_ensure_dir_slash(directory))
+            subdirs, names = xbmcvfs.listdir(vfs_ensure_dir_slash(directory))
         except Exception:
             return None
 
+        if self.include_dirs:
+            names = list(names) + list(subdirs)
         if not names:
             return None
 
         listing = {name.lower() for name in names}
         if len(self._dirs) >= self.max_dirs:
             self._dirs.clear()
-        self._dirs[directory] = listing
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._dirs[directory] = (listing, expires)
         return listing
 
     def note_written(self, full_path: str) -> None:
         """Record a file just created, so a later lookup in that folder sees it."""
         directory, filename = vfs_split(full_path)
-        listing = self._dirs.get(directory)
-        if listing is not None:
-            listing.add(filename.lower())
+        cached = self._dirs.get(directory)
+        if cached is not None:
+            cached[0].add(filename.lower())
 
     def find_with_extension(self, base_path: str, extensions) -> Optional[str]:
         """First existing `base_path.<ext>`, falling back to per-file stat when unlisted."""
@@ -213,6 +223,53 @@ class DirectoryListing:
         return None
 
 
+class PathExistence:
+    """Memoized `xbmcvfs.exists` for repeated probes of the same folders.
+
+    A file probe is answered from its folder's listing (files and subfolders), fetched once
+    per `ttl`. Folder probes (trailing separator), URLs and folders that list empty fall back
+    to a stat whose result, found or not, is also kept for `ttl`.
+    """
+
+    _UNLISTABLE = ('http://', 'https://', 'plugin://', 'image://', 'videodb://', 'musicdb://')
+
+    def __init__(self, ttl: float = 120.0, max_paths: int = 8192):
+        self.ttl = ttl
+        self.max_paths = max_paths
+        self._listing = DirectoryListing(ttl=ttl, include_dirs=True)
+        self._paths: Dict[str, Tuple[bool, float]] = {}
+        self._unlisted: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def exists(self, path: str) -> bool:
+        """True if `path` exists, answered from cache when possible."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._paths.get(path)
+            if cached is not None and cached[1] > now:
+                return cached[0]
+
+        directory, filename = vfs_split(path)
+        if (directory and filename and path[-1] not in '/\\'
+                and not path.lower().startswith(self._UNLISTABLE)):
+            with self._lock:
+                skip = self._unlisted.get(directory, 0.0) > now
+            if not skip:
+                listing = self._listing.files(directory)
+                if listing is not None:
+                    return filename.lower() in listing
+                with self._lock:
+                    self._unlisted[directory] = now + self.ttl
+
+        found = bool(xbmcvfs.exists(path))
+        with self._lock:
+            if len(self._paths) >= self.max_paths:
+                self._paths.clear()
+                self._unlisted.clear()
+            self._paths[path] = (found, now + self.ttl)
+        return found
+
+
 def use_basename_for(media_type: str, savewith_basefilename: bool) -> bool:
     """True when art saves as `<mediafile>-<type>` rather than a bare `<type>` in the folder.
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import time
 import threading
+import urllib.parse
 import xbmc
+from collections import deque
 from queue import Queue, Empty
-from typing import Optional, Set, List, Dict, Any
+from typing import Optional, Set, List, Dict, Any, Callable, Deque, Tuple
 from multiprocessing import cpu_count
 from lib.kodi.client import log
 
@@ -39,7 +41,7 @@ class WorkerQueue:
         self.task_context = task_context
         self.result_retention = result_retention
 
-        self.queue: Queue = Queue()
+        self.queue: Queue = self._make_queue()
         self.processing_set: Set[Any] = set()
         self.processing_lock = threading.Lock()
 
@@ -277,6 +279,10 @@ class WorkerQueue:
 
         return True
 
+    def _make_queue(self) -> Queue:
+        """Optional subclass hook: the queue workers pull from (FIFO by default)."""
+        return Queue()
+
     def _process_item(self, item: Any, worker_id: int) -> Optional[Dict]:
         """Override in subclass. Return a result dict (must include `success`)."""
         raise NotImplementedError("Subclasses must implement _process_item()")
@@ -292,3 +298,154 @@ class WorkerQueue:
     def _on_item_complete(self, item: Any, result: Dict) -> None:
         """Optional subclass hook: called after every item (success or failure)."""
         pass
+
+
+_LOCAL_SCHEMES = {'', 'file', 'special'}
+
+# A host's latency average may rise this far above its best before it loses a slot...
+_SLOWDOWN_FACTOR = 2.0
+# ...and must stay within this much of its best to earn another.
+_HEADROOM_FACTOR = 1.5
+_LATENCY_SMOOTHING = 0.2
+_ERROR_WINDOW = 10
+_ERROR_LIMIT = 3
+
+
+def host_group(url: str) -> str:
+    """Group for a source URL: scheme plus host, or `local` for local files."""
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme in _LOCAL_SCHEMES or len(scheme) == 1:  # one letter is a Windows drive
+        return 'local'
+    return f"{scheme}://{parts.hostname or ''}"
+
+
+class _HostGroup:
+    """Pending items and adaptive in-flight limit for one source host."""
+
+    def __init__(self, limit: int):
+        self.limit = self.ceiling = limit
+        self.items: Deque[Any] = deque()
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.best_latency: Optional[float] = None
+        self.streak = 0
+        self.outcomes: Deque[bool] = deque(maxlen=_ERROR_WINDOW)
+
+    def record(self, seconds: float, ok: bool) -> None:
+        """Adjust the limit: shed a slot as latency climbs and win it back after a fast round;
+        halve on a burst of host faults and cap it below where they started."""
+        self.outcomes.append(ok)
+        if not ok:
+            self.streak = 0
+            if self.outcomes.count(False) >= _ERROR_LIMIT:
+                # Stay below the level that drew the errors for the rest of the run.
+                self.ceiling = max(1, self.limit - 1)
+                self.limit = max(1, self.limit // 2)
+                self.outcomes.clear()
+            return
+
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += _LATENCY_SMOOTHING * (seconds - self.latency)
+        if self.best_latency is None or self.latency < self.best_latency:
+            self.best_latency = self.latency
+
+        self.streak += 1
+        if self.latency > self.best_latency * _SLOWDOWN_FACTOR:
+            if self.limit > 1:
+                self.limit -= 1
+            self.streak = 0
+        elif (self.streak >= self.limit and self.limit < self.ceiling
+              and self.latency <= self.best_latency * _HEADROOM_FACTOR):
+            self.limit += 1
+            self.streak = 0
+
+
+class HostQueue(Queue):
+    """Queue that hands out items round-robin across source hosts, each under its own limit.
+
+    `url_of` maps a queued item to its source URL. Every host starts at `limit` in-flight
+    items (the pool size, so by default this only orders items) and never goes above it; a
+    host that slows down or fails gives up slots so the other hosts' items keep flowing.
+    Workers must call `finish()` once per item taken so the host's slot frees up.
+    """
+
+    def __init__(self, url_of: Callable[[Any], str], limit: int):
+        self._url_of = url_of
+        self._limit = limit
+        super().__init__()
+
+    def _init(self, maxsize: int) -> None:
+        self._groups: Dict[str, _HostGroup] = {}
+        self._order: Deque[str] = deque()
+        self._pending = 0
+        self._sentinels = 0
+
+    def _qsize(self) -> int:
+        return self._pending + self._sentinels
+
+    def _group_for(self, entry: Any) -> _HostGroup:
+        key = host_group(self._url_of(entry[0]))
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _HostGroup(self._limit)
+            self._order.append(key)
+        return group
+
+    def _put(self, entry: Any) -> None:
+        if entry is None:
+            self._sentinels += 1
+            return
+        self._group_for(entry).items.append(entry)
+        self._pending += 1
+
+    def _take(self) -> Tuple[bool, Any]:
+        for _ in range(len(self._order)):
+            group = self._groups[self._order[0]]
+            self._order.rotate(-1)
+            if group.items and group.in_flight < group.limit:
+                group.in_flight += 1
+                self._pending -= 1
+                return True, group.items.popleft()
+        if self._sentinels and not self._pending:
+            self._sentinels -= 1
+            return True, None
+        return False, None
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Next item from the next host with a free slot; waits for one like `Queue.get`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_empty:
+            while True:
+                found, entry = self._take()
+                if found:
+                    self.not_full.notify()
+                    return entry
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not block or (remaining is not None and remaining <= 0):
+                    raise Empty
+                self.not_empty.wait(remaining)
+
+    def finish(self, item: Any, seconds: float, ok: bool, host_fault: bool = False) -> None:
+        """Release `item`'s host slot and record how its fetch went.
+
+        Only `ok` fetches feed the latency and only `host_fault` failures (transport errors,
+        5xx, 429) count against the host; other failures, like a missing file, just free
+        the slot.
+        """
+        key = host_group(self._url_of(item))
+        with self.not_empty:
+            group = self._groups.get(key)
+            if group is None:
+                return
+            group.in_flight = max(0, group.in_flight - 1)
+            if ok or host_fault:
+                group.record(seconds, ok)
+            self.not_empty.notify_all()
+
+    def describe(self) -> str:
+        """`group=limit` for each host, for the end-of-run log line."""
+        with self.mutex:
+            return ', '.join(f"{key}={group.limit}" for key, group in self._groups.items())
@@ -165,13 +165,17 @@ def extract_result(resp: Optional[dict], result_key: str, default=None):
     return value
 
 
-def _call_jsonrpc(payload: Any, error_context: str) -> Any:
+def _call_jsonrpc(payload: Any, error_context: str, sizes: Optional[List[int]] = None) -> Any:
     """Execute a JSON-RPC payload (single dict or batch list) and return the parsed body.
 
-    Returns None on transport, JSON, or shape errors.
+    Returns None on transport, JSON, or shape errors. When `sizes` is given, request and
+    response byte lengths are appended to it for tracing.
     """
     try:
-        raw = xbmc.executeJSONRPC(json.dumps(payload, separators=(",", ":")))
+        body = json.dumps(payload, separators=(",", ":"))
+        raw = xbmc.executeJSONRPC(body)
+        if sizes is not None:
+            sizes.extend((len(body), len(raw) if isinstance(raw, str) else 0))
     except (OSError, IOError) as e:
         log("General", f"Network error in {error_context}: {str(e)}", xbmc.LOGWARNING)
         return None
@@ -198,19 +202,28 @@ def request(method: str, params: Optional[Dict[str, Any]] = None,
     """
     global _request_count
     ttl = CACHE_DEFAULT_TTL if ttl_seconds is None else max(1, int(ttl_seconds))
+    trace = _is_trace_enabled()
+    started = monotonic() if trace else 0.0
 
     if cache_key:
         cached = get_cache_only(cache_key)
         if cached is not None:
+            if trace:
+                _trace_calls([method], [params], started, None, hit=True)
             return cached
 
     _request_count += 1
     _cleanup_expired_cache()
 
+    sizes: Optional[List[int]] = [] if trace else None
     data = _call_jsonrpc(
         {"jsonrpc": "2.0", "method": method, "params": params or {}, "id": 1},
         f"call to {method}",
+        sizes,
     )
+    if trace:
+        _trace_calls([method], [params], started, sizes,
+                     error=not isinstance(data, dict) or "error" in data)
     if data is None:
         return None
 
@@ -243,6 +256,17 @@ def request(method: str, params: Optional[Dict[str, Any]] = None,
     return data
 
 
+def _trace_calls(methods: List[str], params: List[Optional[Dict[str, Any]]], started: float,
+                 sizes: Optional[List[int]], hit: bool = False, error: bool = False) -> None:
+    """Record calls with the tracer. A batch's latency and payload are split evenly."""
+    from lib.kodi import tracing
+    count = len(methods)
+    latency = (monotonic() - started) / count
+    req_bytes, resp_bytes = (sizes[0] // count, sizes[1] // count) if sizes else (0, 0)
+    for method, call_params in zip(methods, params):
+        tracing.record(method, call_params, latency, req_bytes, resp_bytes, hit=hit, error=error)
+
+
 def batch_request(calls: List[Dict[str, Any]],
                   ttl_seconds: Optional[int] = None) -> List[Optional[dict]]:
     """Execute multiple JSON-RPC calls in one batch. Each entry: `{method, params?, cache_key?}`.
@@ -256,6 +280,8 @@ def batch_request(calls: List[Dict[str, Any]],
         return []
 
     ttl = CACHE_DEFAULT_TTL if ttl_seconds is None else max(1, int(ttl_seconds))
+    trace = _is_trace_enabled()
+    started = monotonic() if trace else 0.0
     all_cached: List[Optional[dict]] = []
     all_hit = True
 
@@ -271,6 +297,9 @@ def batch_request(calls: List[Dict[str, Any]],
             all_hit = False
 
     if all_hit:
+        if trace:
+            _trace_calls([c.get("method") or "" for c in calls],
+                         [c.get("params") for c in calls], started, None, hit=True)
         return all_cached
 
     _request_count += len(calls)
@@ -285,7 +314,11 @@ def batch_request(calls: List[Dict[str, Any]],
             "id": i,
         })
 
-    data = _call_jsonrpc(payloads, "batch request")
+    sizes: Optional[List[int]] = [] if trace else None
+    data = _call_jsonrpc(payloads, "batch request", sizes)
+    if trace:
+        _trace_calls([p["method"] or "" for p in payloads], [c.get("params") for c in calls],
+                     started, sizes, error=not isinstance(data, list))
     if data is None:
         return [None] * len(calls)
 
@@ -603,6 +636,29 @@ def _is_debug_enabled() -> bool:
     return _debug_enabled
 
 
+_trace_enabled: Optional[bool] = None
+
+
+def _is_trace_enabled() -> bool:
+    """Check if JSON-RPC tracing is enabled (cached until `reset_trace_setting`)."""
+    global _trace_enabled
+    if _trace_enabled is None:
+        try:
+            _trace_enabled = KodiSettings.get_bool('jsonrpc_trace')
+        except Exception:
+            _trace_enabled = False
+    return _trace_enabled
+
+
+def reset_trace_setting() -> None:
+    """Re-read the tracing setting on next call. Flushes pending trace data when turning off."""
+    global _trace_enabled
+    if _trace_enabled:
+        from lib.kodi import tracing
+        tracing.flush()
+    _trace_enabled = None
+
+
 def log(category: str, message: str, level: int = xbmc.LOGDEBUG) -> None:
     """Log `[category] message` at `level`, prefixed with the addon id.
 
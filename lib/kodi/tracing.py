@@ -0,0 +1,247 @@
+"""Opt-in JSON-RPC call tracing for `lib.kodi.client`.
+
+With the `jsonrpc_trace` setting on, every `request` and `batch_request` call is recorded
+per (method, calling function): call count, L1 cache hits, errors, parameter shapes, payload
+sizes and a bucketed latency histogram. Each Kodi Python process keeps its own window and
+appends it as one JSON line to a rotating file in addon_data every `FLUSH_INTERVAL_S` and at
+exit. `build_report` merges those lines into a top-offenders summary.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import xbmcvfs
+
+TRACE_FILE = 'jsonrpc_trace.log'
+TRACE_FILE_PREVIOUS = 'jsonrpc_trace_previous.log'
+MAX_TRACE_FILE_BYTES = 1024 * 1024
+FLUSH_INTERVAL_S = 60.0
+
+# Upper bounds (ms) of the latency histogram buckets; one extra bucket catches the rest.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# Distinct parameter shapes kept per entry; beyond this new shapes are only counted.
+MAX_SHAPES = 5
+
+_SKIP_MODULES = frozenset(('lib.kodi.client', __name__))
+
+_lock = threading.Lock()
+_window: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_window_started = time.time()
+_last_flush = time.monotonic()
+_atexit_registered = False
+
+
+def _trace_dir() -> str:
+    return xbmcvfs.translatePath('special://profile/addon_data/script.skin.info.service/')
+
+
+def _caller() -> str:
+    """`module:function` of the first frame outside the client and this module."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module not in _SKIP_MODULES:
+            return f"{module}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def param_shape(params: Optional[Dict[str, Any]]) -> str:
+    """Sorted top-level keys, with list lengths, e.g. `filter,properties[12]`."""
+    if not params:
+        return "-"
+    parts = []
+    for key in sorted(params):
+        value = params[key]
+        parts.append(f"{key}[{len(value)}]" if isinstance(value, list) else key)
+    return ",".join(parts)
+
+
+def _bucket(latency_ms: float) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if latency_ms <= bound:
+            return i
+    return len(LATENCY_BUCKETS_MS)
+
+
+def _new_entry(method: str, caller: str) -> Dict[str, Any]:
+    return {
+        'method': method, 'caller': caller, 'calls': 0, 'hits': 0, 'errors': 0,
+        'total_ms': 0.0, 'max_ms': 0.0, 'req_bytes': 0, 'resp_bytes': 0,
+        'hist': [0] * (len(LATENCY_BUCKETS_MS) + 1), 'shapes': {},
+    }
+
+
+def record(method: str, params: Optional[Dict[str, Any]], latency_s: float,
+           req_bytes: int = 0, resp_bytes: int = 0, hit: bool = False,
+           error: bool = False) -> None:
+    """Add one call to the current window. Flushes when the window is due."""
+    global _atexit_registered
+
+    caller = _caller()
+    shape = param_shape(params)
+    latency_ms = latency_s * 1000.0
+
+    with _lock:
+        entry = _window.get((method, caller))
+        if entry is None:
+            entry = _window[(method, caller)] = _new_entry(method, caller)
+        entry['calls'] += 1
+        entry['hits'] += hit
+        entry['errors'] += error
+        entry['total_ms'] += latency_ms
+        entry['max_ms'] = max(entry['max_ms'], latency_ms)
+        entry['req_bytes'] += req_bytes
+        entry['resp_bytes'] += resp_bytes
+        entry['hist'][_bucket(latency_ms)] += 1
+        shapes = entry['shapes']
+        if shape in shapes or len(shapes) < MAX_SHAPES:
+            shapes[shape] = shapes.get(shape, 0) + 1
+
+        if not _atexit_registered:
+            _atexit_registered = True
+            atexit.register(flush)
+        due = time.monotonic() - _last_flush >= FLUSH_INTERVAL_S
+
+    if due:
+        flush()
+
+
+def _rotate(path: str, previous: str) -> None:
+    try:
+        if os.path.getsize(path) >= MAX_TRACE_FILE_BYTES:
+            os.replace(path, previous)
+    except OSError:
+        pass
+
+
+def flush() -> None:
+    """Append the current window as one summary line and start a new window."""
+    global _window, _window_started, _last_flush
+
+    with _lock:
+        entries = list(_window.values())
+        started = _window_started
+        _window = {}
+        _window_started = time.time()
+        _last_flush = time.monotonic()
+
+    if not entries:
+        return
+
+    line = json.dumps({
+        'started': int(started),
+        'ended': int(time.time()),
+        'pid': os.getpid(),
+        'entries': entries,
+    }, separators=(",", ":"))
+
+    try:
+        folder = _trace_dir()
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, TRACE_FILE)
+        _rotate(path, os.path.join(folder, TRACE_FILE_PREVIOUS))
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + "\n")
+    except OSError as e:
+        from lib.kodi.client import log
+        import xbmc
+        log("General", f"JSON-RPC trace flush failed: {e}", xbmc.LOGWARNING)
+
+
+def _percentile(hist: List[int], fraction: float) -> str:
+    total = sum(hist)
+    if not total:
+        return "-"
+    threshold = total * fraction
+    running = 0
+    for i, count in enumerate(hist):
+        running += count
+        if running >= threshold:
+            if i < len(LATENCY_BUCKETS_MS):
+                return f"<={LATENCY_BUCKETS_MS[i]}ms"
+            return f">{LATENCY_BUCKETS_MS[-1]}ms"
+    return "-"
+
+
+def load_entries() -> List[Dict[str, Any]]:
+    """Merge all recorded windows into one entry per (method, caller)."""
+    merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    folder = _trace_dir()
+
+    for name in (TRACE_FILE_PREVIOUS, TRACE_FILE):
+        try:
+            with open(os.path.join(folder, name), encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+
+        for line in lines:
+            try:
+                window = json.loads(line)
+            except ValueError:
+                continue
+            for e in window.get('entries', []):
+                key = (e.get('method', ''), e.get('caller', ''))
+                target = merged.get(key)
+                if target is None:
+                    target = merged[key] = _new_entry(*key)
+                for field in ('calls', 'hits', 'errors', 'total_ms', 'req_bytes', 'resp_bytes'):
+                    target[field] += e.get(field, 0)
+                target['max_ms'] = max(target['max_ms'], e.get('max_ms', 0.0))
+                hist = e.get('hist', [])
+                for i in range(min(len(hist), len(target['hist']))):
+                    target['hist'][i] += hist[i]
+                for shape, count in e.get('shapes', {}).items():
+                    target['shapes'][shape] = target['shapes'].get(shape, 0) + count
+
+    return list(merged.values())
+
+
+def build_report(limit: int = 20) -> str:
+    """Top offenders by total latency, then by call count. Empty string when nothing is recorded."""
+    flush()
+    entries = load_entries()
+    if not entries:
+        return ""
+
+    total_calls = sum(e['calls'] for e in entries)
+    total_ms = sum(e['total_ms'] for e in entries)
+    total_hits = sum(e['hits'] for e in entries)
+    hit_rate = total_hits / total_calls * 100 if total_calls else 0.0
+
+    lines = [
+        "[B]Summary[/B]",
+        f"Calls: {total_calls}  L1 hits: {total_hits} ({hit_rate:.0f}%)  "
+        f"Total latency: {total_ms / 1000:.1f}s",
+        "",
+        "[B]By total latency[/B]",
+    ]
+
+    def describe(e: Dict[str, Any]) -> List[str]:
+        misses = e['calls'] - e['hits']
+        avg = e['total_ms'] / e['calls'] if e['calls'] else 0.0
+        resp_kb = e['resp_bytes'] / 1024 / misses if misses else 0.0
+        top_shape = max(e['shapes'].items(), key=lambda s: s[1])[0] if e['shapes'] else "-"
+        return [
+            f"{e['method']}  <  {e['caller']}",
+            f"    calls {e['calls']}, hits {e['hits']}, errors {e['errors']}, "
+            f"total {e['total_ms']:.0f}ms, avg {avg:.1f}ms, max {e['max_ms']:.0f}ms, "
+            f"p50 {_percentile(e['hist'], 0.5)}, p95 {_percentile(e['hist'], 0.95)}",
+            f"    response {resp_kb:.1f}KB/call, params {top_shape}",
+        ]
+
+    for e in sorted(entries, key=lambda x: x['total_ms'], reverse=True)[:limit]:
+        lines.extend(describe(e))
+
+    lines.extend(["", "[B]By call count[/B]"])
+    for e in sorted(entries, key=lambda x: x['calls'], reverse=True)[:limit]:
+        lines.append(f"{e['calls']:>7}  {e['method']}  <  {e['caller']}")
+
+    return "\n".join(lines)
@@ -14,6 +14,8 @@ from lib.data.api.utilities import tmdb_image_url
 
 _MAX_CAST_ITEMS = 2000
 
+_DEFAULT_ACTOR_ART = {'icon': 'DefaultActor.png', 'thumb': 'DefaultActor.png'}
+
 
 def _deduplicate_cast(items: list) -> list:
     """Dedupe cast across items by `name` (first wins); adds `_source_id` to each actor."""
@@ -41,7 +43,7 @@ def _deduplicate_cast(items: list) -> list:
 
 def _create_cast_listitems(handle: int, cast_list: list) -> int:
     """Add ListItems to the plugin directory for each actor. Returns count added."""
-    items_added = 0
+    items = []
     for actor in cast_list:
         name = actor.get('name', '')
         if not name:
@@ -60,7 +62,7 @@ def _create_cast_listitems(handle: int, cast_list: list) -> int:
         if thumb:
             item.setArt({'icon': thumb, 'thumb': thumb})
         else:
-            item.setArt({'icon': 'DefaultActor.png', 'thumb': 'DefaultActor.png'})
+            item.setArt(_DEFAULT_ACTOR_ART)
 
         source_id = actor.get('_source_id')
         if source_id:
@@ -70,13 +72,13 @@ def _create_cast_listitems(handle: int, cast_list: list) -> int:
         if person_id:
             item.setProperty('person_id', str(person_id))
 
-        xbmcplugin.addDirectoryItem(handle, '', item, False)
-        items_added += 1
+        items.append(('', item, False))
 
-    if items_added > 0:
+    if items:
+        xbmcplugin.addDirectoryItems(handle, items, len(items))
         xbmcplugin.setContent(handle, 'actors')
 
-    return items_added
+    return len(items)
 
 
 def _handle_online_cast(handle: int, dbtype: str, dbid: int, tmdb_id: int = 0,
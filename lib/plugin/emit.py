@@ -0,0 +1,394 @@
+"""Shared ListItem builders and bulk directory emission for plugin handlers.
+
+Handlers build `(url, ListItem, is_folder)` tuples with the per-type builders here and submit
+the whole directory through `emit_directory`, one `addDirectoryItems` call instead of one
+Kodi crossing per item. Art derived from a parent record (show art under episodes) is
+memoized (as are TMDB credit art maps), so a widget listing many episodes of one show builds
+it once.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import xbmc
+import xbmcgui
+import xbmcplugin
+
+DirectoryItem = Tuple[str, xbmcgui.ListItem, bool]
+
+
+def _as_list(value: Any) -> list:
+    return value if isinstance(value, list) else [value]
+
+
+def _votes(value: Any) -> int:
+    return int(value) if isinstance(value, (int, str)) and str(value).isdigit() else 0
+
+
+# field -> setter, applied only when the record's value is truthy
+_VIDEO_FIELD_SETTERS: Dict[str, Callable[[xbmc.InfoTagVideo, Any], None]] = {
+    'plot': lambda tag, v: tag.setPlot(v),
+    'rating': lambda tag, v: tag.setRating(float(v)),
+    'userrating': lambda tag, v: tag.setUserRating(int(v)),
+    'votes': lambda tag, v: tag.setVotes(_votes(v)),
+    'year': lambda tag, v: tag.setYear(int(v)),
+    'premiered': lambda tag, v: tag.setPremiered(v),
+    'playcount': lambda tag, v: tag.setPlaycount(int(v)),
+    'lastplayed': lambda tag, v: tag.setLastPlayed(v),
+    'runtime': lambda tag, v: tag.setDuration(int(v)),
+    'genre': lambda tag, v: tag.setGenres(_as_list(v)),
+    'director': lambda tag, v: tag.setDirectors(_as_list(v)),
+    'studio': lambda tag, v: tag.setStudios(_as_list(v)),
+    'artist': lambda tag, v: tag.setArtists(_as_list(v)),
+    'album': lambda tag, v: tag.setAlbum(v),
+    'track': lambda tag, v: tag.setTrackNumber(int(v)),
+    'mpaa': lambda tag, v: tag.setMpaa(v),
+    'tagline': lambda tag, v: tag.setTagLine(v),
+    'trailer': lambda tag, v: tag.setTrailer(v),
+    'tag': lambda tag, v: tag.setTags(_as_list(v)),
+    'originaltitle': lambda tag, v: tag.setOriginalTitle(v),
+    'imdbnumber': lambda tag, v: tag.setIMDBNumber(v),
+    'cast': lambda tag, v: tag.setCast([
+        xbmc.Actor(m.get('name', ''), m.get('role', ''), m.get('order', 0),
+                   m.get('thumbnail', ''))
+        for m in v
+    ]),
+}
+
+_MOVIE_FIELDS = ('plot', 'rating', 'userrating', 'votes', 'year', 'playcount', 'lastplayed',
+                 'runtime', 'genre', 'director', 'studio', 'mpaa', 'tagline', 'trailer', 'tag')
+_TVSHOW_FIELDS = ('plot', 'rating', 'userrating', 'votes', 'year', 'premiered', 'playcount',
+                  'lastplayed', 'genre', 'studio', 'mpaa', 'cast', 'tag', 'originaltitle',
+                  'imdbnumber')
+_MUSICVIDEO_FIELDS = ('year', 'runtime', 'plot', 'director', 'studio', 'genre', 'artist',
+                      'album', 'track', 'playcount', 'lastplayed', 'rating', 'userrating',
+                      'tag')
+
+
+def _apply_video_fields(video_tag: xbmc.InfoTagVideo, record: dict,
+                        fields: Tuple[str, ...]) -> None:
+    for field in fields:
+        value = record.get(field)
+        if value:
+            _VIDEO_FIELD_SETTERS[field](video_tag, value)
+
+
+def _apply_resume(video_tag: xbmc.InfoTagVideo, record: dict) -> None:
+    resume = record.get('resume', {})
+    if isinstance(resume, dict):
+        position = resume.get('position', 0)
+        total = resume.get('total', 0)
+        if position > 0 and total > 0:
+            video_tag.setResumePoint(position, total)
+
+
+def build_movie_listitem(movie: dict) -> xbmcgui.ListItem:
+    """Create a movie ListItem from a JSON-RPC movie dict."""
+    title = movie.get('title', '')
+    listitem = xbmcgui.ListItem(title, offscreen=True)
+
+    video_tag = listitem.getVideoInfoTag()
+    video_tag.setTitle(title)
+    video_tag.setMediaType('movie')
+
+    movieid = movie.get('movieid')
+    if movieid:
+        video_tag.setDbId(movieid)
+
+    _apply_video_fields(video_tag, movie, _MOVIE_FIELDS)
+    _apply_resume(video_tag, movie)
+
+    listitem.setArt(movie.get('art', {}))
+    return listitem
+
+
+def build_tvshow_listitem(show: dict) -> xbmcgui.ListItem:
+    """Create a TV show ListItem from a JSON-RPC show dict, with episode-count properties."""
+    title = show.get('title', '')
+    listitem = xbmcgui.ListItem(title, offscreen=True)
+
+    video_tag = listitem.getVideoInfoTag()
+    video_tag.setTitle(title)
+    video_tag.setMediaType('tvshow')
+
+    tvshowid = show.get('tvshowid')
+    if tvshowid:
+        video_tag.setDbId(tvshowid)
+
+    _apply_video_fields(video_tag, show, _TVSHOW_FIELDS)
+
+    episode_count = show.get('episode', 0)
+    watched_episodes = show.get('watchedepisodes', 0)
+    unwatched_episodes = episode_count - watched_episodes
+    # integer math, not round(), to match Kodi's own WatchedEpisodePercent
+    watched_percent = (watched_episodes * 100) // episode_count if episode_count > 0 else 0
+    listitem.setProperty('TotalEpisodes', str(episode_count))
+    listitem.setProperty('WatchedEpisodes', str(watched_episodes))
+    listitem.setProperty('UnWatchedEpisodes', str(unwatched_episodes))
+    listitem.setProperty('WatchedEpisodePercent', str(watched_percent))
+
+    listitem.setArt(show.get('art', {}))
+    return listitem
+
+
+def build_episode_listitem(episode: dict) -> xbmcgui.ListItem:
+    """Create an episode ListItem labeled `2x05. Title` (or `S05. Title` for specials)."""
+    season = episode.get('season', 0)
+    ep_num = episode.get('episode', 0)
+    title = episode.get('title', '')
+
+    ep_label = f"0{ep_num}. {title}" if ep_num < 10 else f"{ep_num}. {title}"
+    label = f"S{ep_label}" if season == 0 else f"{season}x{ep_label}"
+
+    listitem = xbmcgui.ListItem(label, offscreen=True)
+
+    video_tag = listitem.getVideoInfoTag()
+    video_tag.setTitle(title)
+
+    episodeid = episode.get('episodeid')
+    if episodeid:
+        video_tag.setDbId(episodeid)
+    video_tag.setEpisode(ep_num)
+    video_tag.setSeason(season)
+    video_tag.setTvShowTitle(episode.get('showtitle', ''))
+    video_tag.setPlot(episode.get('plot', ''))
+    video_tag.setFirstAired(episode.get('firstaired', ''))
+
+    rating = episode.get('rating', 0.0)
+    video_tag.setRating(float(rating) if rating else 0.0)
+
+    userrating = episode.get('userrating', 0)
+    video_tag.setUserRating(int(userrating) if userrating else 0)
+
+    playcount = episode.get('playcount', 0)
+    video_tag.setPlaycount(int(playcount) if playcount else 0)
+
+    video_tag.setLastPlayed(episode.get('lastplayed', ''))
+
+    runtime = episode.get('runtime', 0)
+    video_tag.setDuration(int(runtime) if runtime else 0)
+
+    video_tag.setMediaType('episode')
+    _apply_resume(video_tag, episode)
+
+    return listitem
+
+
+_SHOW_ART_KEYS = ('poster', 'fanart', 'banner', 'landscape', 'clearart')
+
+
+@lru_cache(maxsize=128)
+def _show_art_base(show_art: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    art = dict(show_art)
+    base = {key: art.get(key, '') for key in _SHOW_ART_KEYS}
+    base['clearlogo'] = art.get('clearlogo', '') or art.get('logo', '')
+    base['icon'] = 'DefaultTVShows.png'
+    return base
+
+
+def set_episode_artwork_from_show(listitem: xbmcgui.ListItem, show_art: dict,
+                                  episode_art: dict) -> None:
+    """Set episode ListItem art using show artwork + episode thumb."""
+    art = dict(_show_art_base(tuple(sorted(show_art.items()))))
+    art['thumb'] = episode_art.get('thumb', '')
+    listitem.setArt(art)
+
+
+def _music_art(record: dict) -> dict:
+    """`art`, falling back to `{'thumb': thumbnail}` for records without an art map."""
+    art = record.get('art', {})
+    if not art:
+        thumb = record.get('thumbnail', '')
+        if thumb:
+            art = {'thumb': thumb}
+    return art
+
+
+def build_artist_listitem(artist: dict) -> xbmcgui.ListItem:
+    """Create artist ListItem with MusicInfoTag + art."""
+    name = artist.get('artist') or artist.get('label', '')
+    item = xbmcgui.ListItem(name, offscreen=True)
+
+    music_tag = item.getMusicInfoTag()
+    music_tag.setMediaType('artist')
+    music_tag.setArtist(name)
+
+    artistid = artist.get('artistid')
+    if artistid:
+        music_tag.setDbId(artistid, 'artist')
+
+    genres = artist.get('genre', [])
+    if genres:
+        music_tag.setGenres(_as_list(genres))
+
+    description = artist.get('description', '')
+    if description:
+        music_tag.setComment(description)
+
+    art = _music_art(artist)
+    if art:
+        item.setArt(art)
+    return item
+
+
+def build_album_listitem(album: dict) -> xbmcgui.ListItem:
+    """Create album ListItem with MusicInfoTag + art."""
+    title = album.get('title') or album.get('label', '')
+    item = xbmcgui.ListItem(title, offscreen=True)
+
+    music_tag = item.getMusicInfoTag()
+    music_tag.setMediaType('album')
+    music_tag.setAlbum(title)
+
+    albumid = album.get('albumid')
+    if albumid:
+        music_tag.setDbId(albumid, 'album')
+
+    artists = album.get('artist', [])
+    if artists:
+        if isinstance(artists, list):
+            music_tag.setArtist(artists[0] if artists else '')
+        else:
+            music_tag.setArtist(str(artists))
+
+    year = album.get('year', 0)
+    if year:
+        music_tag.setYear(int(year))
+
+    genres = album.get('genre', [])
+    if genres:
+        music_tag.setGenres(_as_list(genres))
+
+    rating = album.get('rating')
+    if rating:
+        music_tag.setRating(float(rating))
+
+    userrating = album.get('userrating')
+    if userrating:
+        music_tag.setUserRating(int(userrating))
+
+    art = _music_art(album)
+    if art:
+        item.setArt(art)
+    return item
+
+
+def build_musicvideo_listitem(mv: dict) -> xbmcgui.ListItem:
+    """Create musicvideo ListItem with VideoInfoTag + art."""
+    title = mv.get('title') or mv.get('label', '')
+    item = xbmcgui.ListItem(title, offscreen=True)
+
+    video_tag = item.getVideoInfoTag()
+    video_tag.setMediaType('musicvideo')
+    video_tag.setTitle(title)
+
+    mvid = mv.get('musicvideoid')
+    if mvid:
+        video_tag.setDbId(mvid)
+
+    _apply_video_fields(video_tag, mv, _MUSICVIDEO_FIELDS)
+    _apply_resume(video_tag, mv)
+
+    art = mv.get('art', {})
+    if art:
+        item.setArt(art)
+    return item
+
+
+@lru_cache(maxsize=512)
+def _credit_art(poster_path: Optional[str], backdrop_path: Optional[str]) -> Dict[str, str]:
+    from lib.data.api.utilities import tmdb_image_url
+    art = {}
+    if poster_path:
+        art['poster'] = tmdb_image_url(poster_path, 'w500')
+    if backdrop_path:
+        art['fanart'] = tmdb_image_url(backdrop_path, 'w780')
+    return art
+
+
+def build_credit_listitem(credit: dict) -> xbmcgui.ListItem:
+    """Create ListItem from a TMDB credit entry."""
+    title = credit.get('title') or credit.get('name', 'Unknown')
+    item = xbmcgui.ListItem(title, offscreen=True)
+
+    video_tag = item.getVideoInfoTag()
+
+    media_type = credit.get('media_type', 'movie')
+    video_tag.setMediaType(media_type)
+
+    video_tag.setTitle(title)
+
+    if credit.get('overview'):
+        video_tag.setPlot(credit['overview'])
+
+    release_date = credit.get('release_date') or credit.get('first_air_date')
+    if release_date:
+        try:
+            year = int(release_date[:4])
+            video_tag.setYear(year)
+        except (ValueError, TypeError, IndexError):
+            pass
+
+    if credit.get('vote_average'):
+        video_tag.setRating(float(credit['vote_average']))
+
+    art = _credit_art(credit.get('poster_path'), credit.get('backdrop_path'))
+    if art:
+        item.setArt(art)
+
+    tmdb_id = credit.get('id')
+    if tmdb_id:
+        item.setProperty('tmdb_id', str(tmdb_id))
+
+    character = credit.get('character', '')
+    item.setProperty('Role', character)
+    item.setProperty('ReleaseDate', release_date or '')
+    if character:
+        item.setLabel2(character)
+    item.setProperty('MediaType', media_type)
+
+    return item
+
+
+BUILDERS: Dict[str, Callable[[dict], xbmcgui.ListItem]] = {
+    'movie': build_movie_listitem,
+    'tvshow': build_tvshow_listitem,
+    'episode': build_episode_listitem,
+    'artist': build_artist_listitem,
+    'album': build_album_listitem,
+    'musicvideo': build_musicvideo_listitem,
+    'credit': build_credit_listitem,
+}
+
+
+def build_directory_items(media_type: str, records: List[dict],
+                          url_key: Optional[str] = None,
+                          is_folder: bool = False) -> List[DirectoryItem]:
+    """`(url, ListItem, is_folder)` for each record via the `media_type` builder.
+
+    `url_key` names the record field holding the item URL (e.g. `file`); '' when omitted.
+    """
+    build = BUILDERS[media_type]
+    return [(record.get(url_key, '') if url_key else '', build(record), is_folder)
+            for record in records]
+
+
+def build_menu_items(entries: List[Tuple[str, str, str, bool]]) -> List[DirectoryItem]:
+    """Icon-only navigation entries from `(label, path, icon, is_folder)` tuples."""
+    items = []
+    for label, path, icon, is_folder in entries:
+        li = xbmcgui.ListItem(label, offscreen=True)
+        li.setArt({'icon': icon, 'thumb': icon})
+        items.append((path, li, is_folder))
+    return items
+
+
+def emit_directory(handle: int, items: List[DirectoryItem], content: Optional[str] = None,
+                   succeeded: bool = True) -> None:
+    """Submit `items` in one `addDirectoryItems` call, set content, and end the directory."""
+    if items:
+        xbmcplugin.addDirectoryItems(handle, items, len(items))
+    if content:
+        xbmcplugin.setContent(handle, content)
+    xbmcplugin.endOfDirectory(handle, succeeded=succeeded)
@@ -1,12 +1,17 @@
 """Plugin handlers for person info, person library, crew lists, and TMDB details."""
 from __future__ import annotations
 
+from typing import Dict
+
 import xbmc
 import xbmcgui
 import xbmcplugin
 
 from lib.kodi.client import log, extract_result
 from lib.data.api.utilities import tmdb_image_url
+from lib.plugin.emit import build_directory_items, emit_directory
+
+_DEFAULT_ACTOR_ART = {'thumb': 'DefaultActor.png', 'icon': 'DefaultActor.png'}
 
 
 def handle_person_info(handle: int, params: dict) -> None:
@@ -82,6 +87,7 @@ def _handle_person_images(handle: int, person_data: dict) -> None:
 
     images.sort(key=lambda x: x.get('vote_average', 0), reverse=True)
 
+    items = []
     for i, image in enumerate(images):
         file_path = image.get('file_path')
         if not file_path:
@@ -111,10 +117,9 @@ def _handle_person_images(handle: int, person_data: dict) -> None:
 
         item.setProperty('AspectRatio', str(image.get('aspect_ratio', '')))
 
-        xbmcplugin.addDirectoryItem(handle, '', item, False)
+        items.append(('', item, False))
 
-    xbmcplugin.setContent(handle, 'images')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, items, 'images')
 
 
 def _handle_person_filmography(handle: int, person_data: dict, params: dict) -> None:
@@ -132,12 +137,7 @@ def _handle_person_filmography(handle: int, person_data: dict, params: dict) ->
         except (ValueError, TypeError):
             pass
 
-    for credit in credits:
-        item = _create_credit_listitem(credit)
-        xbmcplugin.addDirectoryItem(handle, '', item, False)
-
-    xbmcplugin.setContent(handle, 'movies')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_directory_items('credit', credits), 'movies')
 
 
 def _handle_person_crew(handle: int, person_data: dict, params: dict) -> None:
@@ -163,18 +163,14 @@ def _handle_person_crew(handle: int, person_data: dict, params: dict) -> None:
         except (ValueError, TypeError):
             pass
 
-    for credit in credits:
-        item = _create_credit_listitem(credit)
-
+    items = build_directory_items('credit', credits)
+    for credit, (_, item, _) in zip(credits, items):
         if credit.get('job'):
             item.setProperty('Job', credit['job'])
         if credit.get('department'):
             item.setProperty('Department', credit['department'])
 
-        xbmcplugin.addDirectoryItem(handle, '', item, False)
-
-    xbmcplugin.setContent(handle, 'movies')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, items, 'movies')
 
 
 def _dedupe_crew_credits(credits: list) -> list:
@@ -241,6 +237,58 @@ def _sort_credits(credits: list, params: dict) -> list:
     return credits
 
 
+def get_library_roles(actor: str, media_type: str, items: list) -> Dict[int, str]:
+    """`{dbid: role}` of `actor` across GetMovies/GetTVShows `items`.
+
+    Items fetched with a `cast` array are read directly. The rest come from the person index,
+    with one batched cast fetch for titles it doesn't cover yet.
+    """
+    from lib.kodi.client import KODI_GET_DETAILS_METHODS, KODI_ID_KEYS, batch_request
+
+    id_key = KODI_ID_KEYS[media_type]
+    roles: Dict[int, str] = {}
+    unindexed = []
+    for item in items:
+        dbid = item.get(id_key)
+        if not dbid:
+            continue
+        if 'cast' in item:
+            roles[dbid] = _cast_role(item['cast'], actor)
+        else:
+            unindexed.append(dbid)
+
+    if unindexed:
+        from lib.data.database import person_index
+        indexed = person_index.get_roles(actor, media_type) or {}
+        missing = []
+        for dbid in unindexed:
+            if dbid in indexed:
+                roles[dbid] = indexed[dbid]
+            else:
+                missing.append(dbid)
+
+        if missing:
+            method, details_id_key, details_key = KODI_GET_DETAILS_METHODS[media_type]
+            responses = batch_request([
+                {'method': method, 'params': {details_id_key: dbid, 'properties': ['cast']}}
+                for dbid in missing
+            ])
+            for dbid, resp in zip(missing, responses):
+                details = extract_result(resp, details_key)
+                if isinstance(details, dict):
+                    roles[dbid] = _cast_role(details.get('cast', []), actor)
+
+    return roles
+
+
+def _cast_role(cast: list, actor: str) -> str:
+    """The actor's role in a JSON-RPC cast list, or '' if not found."""
+    for member in cast:
+        if member.get('name') == actor:
+            return member.get('role', '') or ''
+    return ''
+
+
 def handle_person_library(handle: int, params: dict) -> None:
     """Plugin entry for library items featuring an actor. `info_type` is `movies` or `tvshows`."""
     try:
@@ -258,6 +306,12 @@ def handle_person_library(handle: int, params: dict) -> None:
             return
 
         from lib.kodi.client import request
+        from lib.data.database import person_index
+
+        # roles come from the person index once built; cast arrays only as the fallback
+        properties = ['title', 'year', 'rating', 'playcount', 'art']
+        if not person_index.is_built():
+            properties.append('cast')
 
         if info_type == 'movies':
             result = request('VideoLibrary.GetMovies', {
@@ -266,7 +320,7 @@ def handle_person_library(handle: int, params: dict) -> None:
                     'operator': 'is',
                     'value': person_name
                 },
-                'properties': ['title', 'year', 'rating', 'playcount', 'art', 'cast'],
+                'properties': properties,
                 'sort': {'method': 'sorttitle', 'order': 'ascending'}
             })
             items = extract_result(result, 'movies', [])
@@ -277,14 +331,16 @@ def handle_person_library(handle: int, params: dict) -> None:
                     'operator': 'is',
                     'value': person_name
                 },
-                'properties': ['title', 'year', 'rating', 'playcount', 'art', 'cast'],
+                'properties': properties,
                 'sort': {'method': 'sorttitle', 'order': 'ascending'}
             })
             items = extract_result(result, 'tvshows', [])
 
         dbtype = 'movie' if info_type == 'movies' else 'tvshow'
         dbid_key = 'movieid' if info_type == 'movies' else 'tvshowid'
+        roles = get_library_roles(person_name, dbtype, items)
 
+        entries = []
         for item in items:
             title = item.get('title', 'Unknown')
             year = item.get('year', '')
@@ -312,23 +368,18 @@ def handle_person_library(handle: int, params: dict) -> None:
             if playcount:
                 listitem.setProperty('Playcount', str(playcount))
 
-            cast = item.get('cast', [])
-            for actor in cast:
-                if actor.get('name') == person_name:
-                    role = actor.get('role', '')
-                    if role:
-                        listitem.setProperty('Role', role)
-                        listitem.setLabel2(role)
-                    break
+            role = roles.get(dbid, '')
+            if role:
+                listitem.setProperty('Role', role)
+                listitem.setLabel2(role)
 
             art = item.get('art', {})
             if art:
                 listitem.setArt(art)
 
-            xbmcplugin.addDirectoryItem(handle, '', listitem, False)
+            entries.append(('', listitem, False))
 
-        xbmcplugin.setContent(handle, 'movies' if info_type == 'movies' else 'tvshows')
-        xbmcplugin.endOfDirectory(handle, succeeded=True)
+        emit_directory(handle, entries, 'movies' if info_type == 'movies' else 'tvshows')
 
     except Exception as e:
         log("Plugin", f"Person Library: Error - {e}", xbmc.LOGERROR)
@@ -337,54 +388,6 @@ def handle_person_library(handle: int, params: dict) -> None:
         xbmcplugin.endOfDirectory(handle, succeeded=False)
 
 
-def _create_credit_listitem(credit: dict) -> xbmcgui.ListItem:
-    """Create ListItem from credit entry."""
-    title = credit.get('title') or credit.get('name', 'Unknown')
-    item = xbmcgui.ListItem(title, offscreen=True)
-
-    video_tag = item.getVideoInfoTag()
-
-    media_type = credit.get('media_type', 'movie')
-    video_tag.setMediaType(media_type)
-
-    video_tag.setTitle(title)
-
-    if credit.get('overview'):
-        video_tag.setPlot(credit['overview'])
-
-    release_date = credit.get('release_date') or credit.get('first_air_date')
-    if release_date:
-        try:
-            year = int(release_date[:4])
-            video_tag.setYear(year)
-        except (ValueError, TypeError, IndexError):
-            pass
-
-    if credit.get('vote_average'):
-        video_tag.setRating(float(credit['vote_average']))
-
-    art = {}
-    if credit.get('poster_path'):
-        art['poster'] = tmdb_image_url(credit['poster_path'], 'w500')
-    if credit.get('backdrop_path'):
-        art['fanart'] = tmdb_image_url(credit['backdrop_path'], 'w780')
-    if art:
-        item.setArt(art)
-
-    tmdb_id = credit.get('id')
-    if tmdb_id:
-        item.setProperty('tmdb_id', str(tmdb_id))
-
-    character = credit.get('character', '')
-    item.setProperty('Role', character)
-    item.setProperty('ReleaseDate', release_date or '')
-    if character:
-        item.setLabel2(character)
-    item.setProperty('MediaType', media_type)
-
-    return item
-
-
 def handle_crew_list(handle: int, params: dict) -> None:
     """Plugin entry for crew listings (director/writer/creator); accepts `tmdb_id` directly for
     TMDB-only items with no library entry."""
@@ -453,6 +456,7 @@ def handle_crew_list(handle: int, params: dict) -> None:
         xbmcplugin.endOfDirectory(handle, succeeded=True)
         return
 
+    items = []
     for member in crew_list:
         name = member.get('name', 'Unknown')
         item = xbmcgui.ListItem(label=name, offscreen=True)
@@ -465,7 +469,7 @@ def handle_crew_list(handle: int, params: dict) -> None:
             image_url = tmdb_image_url(profile_path, 'h632')
             item.setArt({'thumb': image_url, 'icon': image_url})
         else:
-            item.setArt({'thumb': 'DefaultActor.png', 'icon': 'DefaultActor.png'})
+            item.setArt(_DEFAULT_ACTOR_ART)
 
         person_id = member.get('id')
         if person_id:
@@ -473,10 +477,9 @@ def handle_crew_list(handle: int, params: dict) -> None:
 
         item.setProperty('Job', member.get('job', ''))
 
-        xbmcplugin.addDirectoryItem(handle, '', item, False)
+        items.append(('', item, False))
 
-    xbmcplugin.setContent(handle, 'actors')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, items, 'actors')
 
     log(
         "Plugin",
@@ -4,10 +4,10 @@ from __future__ import annotations
 import sys
 from urllib.parse import parse_qs
 import xbmc
-import xbmcgui
 import xbmcplugin
 
 from lib.kodi.client import ADDON, log
+from lib.plugin.emit import build_menu_items, emit_directory
 
 
 def _handle_root_menu(handle: int) -> None:
@@ -21,12 +21,7 @@ def _handle_root_menu(handle: int) -> None:
          "DefaultAddonVideo.png", True),
     ]
 
-    for label, path, icon, is_folder in items:
-        li = xbmcgui.ListItem(label, offscreen=True)
-        li.setArt({'icon': icon, 'thumb': icon})
-        xbmcplugin.addDirectoryItem(handle, path, li, isFolder=is_folder)
-
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items(items))
 
 
 def _handle_search_menu(handle: int) -> None:
@@ -43,12 +38,7 @@ def _handle_search_menu(handle: int) -> None:
          "DefaultActor.png"),
     ]
 
-    for label, path, icon in items:
-        li = xbmcgui.ListItem(label, offscreen=True)
-        li.setArt({'icon': icon, 'thumb': icon})
-        xbmcplugin.addDirectoryItem(handle, path, li, isFolder=False)
-
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items([entry + (False,) for entry in items]))
 
 
 def _handle_widgets_menu(handle: int) -> None:
@@ -71,12 +61,7 @@ def _handle_widgets_menu(handle: int) -> None:
          "DefaultTVShows.png", True),
     ]
 
-    for label, path, icon, is_folder in items:
-        li = xbmcgui.ListItem(label, offscreen=True)
-        li.setArt({'icon': icon, 'thumb': icon})
-        xbmcplugin.addDirectoryItem(handle, path, li, isFolder=is_folder)
-
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items(items))
 
 
 _SEASONAL_MENU = [
@@ -88,14 +73,12 @@ _SEASONAL_MENU = [
 
 def _handle_seasonal_menu(handle: int) -> None:
     """Show seasonal submenu (one entry per SEASONAL_TAGS key)."""
-    for string_id, key in _SEASONAL_MENU:
-        li = xbmcgui.ListItem(ADDON.getLocalizedString(string_id), offscreen=True)
-        li.setArt({'icon': "DefaultYear.png", 'thumb': "DefaultYear.png"})
-        xbmcplugin.addDirectoryItem(
-            handle, f"plugin://script.skin.info.service/?action=seasonal&season={key}",
-            li, isFolder=True)
-
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items([
+        (ADDON.getLocalizedString(string_id),
+         f"plugin://script.skin.info.service/?action=seasonal&season={key}",
+         "DefaultYear.png", True)
+        for string_id, key in _SEASONAL_MENU
+    ]))
 
 
 def _wrap_menu(menu_handler):
@@ -10,6 +10,7 @@ import xbmcplugin
 
 from lib.kodi.client import ADDON, log, request, extract_result
 from lib.data.api.utilities import tmdb_image_url
+from lib.plugin.emit import build_menu_items, emit_directory
 
 # Trakt wrapped responses nest the media object under "movie" or "show"
 _TRAKT_WRAPPED = {
@@ -339,12 +340,7 @@ def handle_discover(handle: int, action: str, params: dict) -> None:
             url, listitem, is_folder = _create_listitem(normalized, lib_match)
             items.append((url, listitem, is_folder))
 
-        for url, listitem, is_folder in items:
-            xbmcplugin.addDirectoryItem(handle, url, listitem, is_folder)
-
-        content = "movies" if media_type == "movie" else "tvshows"
-        xbmcplugin.setContent(handle, content)
-        xbmcplugin.endOfDirectory(handle, succeeded=True)
+        emit_directory(handle, items, "movies" if media_type == "movie" else "tvshows")
 
         log("Plugin", f"Discover: {action} ({media_type}) returned {len(items)} items",
             xbmc.LOGINFO)
@@ -422,11 +418,7 @@ def handle_tmdb_recommendations(handle: int, params: dict) -> None:
             url, listitem, is_folder = _create_listitem(normalized, lib_match)
             items.append((url, listitem, is_folder))
 
-        for url, listitem, is_folder in items:
-            xbmcplugin.addDirectoryItem(handle, url, listitem, is_folder)
-
-        xbmcplugin.setContent(handle, "movies" if media_type == "movie" else "tvshows")
-        xbmcplugin.endOfDirectory(handle, succeeded=True)
+        emit_directory(handle, items, "movies" if media_type == "movie" else "tvshows")
 
         log("Plugin",
             f"TMDB Recommendations: Returned {len(items)} items for {dbtype} tmdb={tmdb_id}",
@@ -452,39 +444,32 @@ def handle_discover_menu(handle: int, params: dict) -> None:
          "plugin://script.skin.info.service/?action=discover_tvshows_menu", "DefaultTVShows.png"),
     ]
 
-    for label, path, icon in items:
-        li = xbmcgui.ListItem(label, offscreen=True)
-        li.setArt({"icon": icon, "thumb": icon})
-        xbmcplugin.addDirectoryItem(handle, path, li, isFolder=True)
-
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items([entry + (True,) for entry in items]))
 
 
 def handle_discover_movies_menu(handle: int, params: dict) -> None:
     """Render the movies sub-menu listing every movie-capable widget from WIDGET_REGISTRY."""
+    entries = []
     for action, config in WIDGET_REGISTRY.items():
         if "movie" not in config["types"]:
             continue
         label = ADDON.getLocalizedString(config["label"])
         if config.get("auth") == "oauth":
             label += " " + ADDON.getLocalizedString(32641)
-        li = xbmcgui.ListItem(label, offscreen=True)
-        li.setArt({"icon": "DefaultMovies.png", "thumb": "DefaultMovies.png"})
-        xbmcplugin.addDirectoryItem(handle, _discover_url(action, "movie"), li, isFolder=True)
+        entries.append((label, _discover_url(action, "movie"), "DefaultMovies.png", True))
 
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items(entries))
 
 
 def handle_discover_tvshows_menu(handle: int, params: dict) -> None:
     """Render the TV shows sub-menu listing every TV-capable widget from WIDGET_REGISTRY."""
+    entries = []
     for action, config in WIDGET_REGISTRY.items():
         if "tv" not in config["types"]:
             continue
         label = ADDON.getLocalizedString(config["label"])
         if config.get("auth") == "oauth":
             label += " " + ADDON.getLocalizedString(32641)
-        li = xbmcgui.ListItem(label, offscreen=True)
-        li.setArt({"icon": "DefaultTVShows.png", "thumb": "DefaultTVShows.png"})
-        xbmcplugin.addDirectoryItem(handle, _discover_url(action, "tv"), li, isFolder=True)
+        entries.append((label, _discover_url(action, "tv"), "DefaultTVShows.png", True))
 
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_menu_items(entries))
@@ -4,10 +4,10 @@ from __future__ import annotations
 from typing import Optional
 
 import xbmc
-import xbmcgui
 import xbmcplugin
 
 from lib.kodi.client import log, request, extract_result, get_item_details
+from lib.plugin.emit import build_directory_items, emit_directory
 
 
 def _resolve_artist_name(params: dict) -> Optional[str]:
@@ -74,168 +74,6 @@ _MUSICVIDEO_PROPERTIES = ['title', 'artist', 'album', 'genre', 'year', 'art',
                            'rating', 'userrating', 'tag', 'resume', 'thumbnail']
 
 
-def _create_artist_listitem(artist: dict) -> xbmcgui.ListItem:
-    """Create artist ListItem with MusicInfoTag + art."""
-    name = artist.get('artist') or artist.get('label', '')
-    item = xbmcgui.ListItem(name, offscreen=True)
-
-    music_tag = item.getMusicInfoTag()
-    music_tag.setMediaType('artist')
-    music_tag.setArtist(name)
-
-    artistid = artist.get('artistid')
-    if artistid:
-        music_tag.setDbId(artistid, 'artist')
-
-    genres = artist.get('genre', [])
-    if genres:
-        music_tag.setGenres(genres if isinstance(genres, list) else [genres])
-
-    description = artist.get('description', '')
-    if description:
-        music_tag.setComment(description)
-
-    art = artist.get('art', {})
-    if not art:
-        thumb = artist.get('thumbnail', '')
-        if thumb:
-            art = {'thumb': thumb}
-    if art:
-        item.setArt(art)
-
-    return item
-
-
-def _create_album_listitem(album: dict) -> xbmcgui.ListItem:
-    """Create album ListItem with MusicInfoTag + art."""
-    title = album.get('title') or album.get('label', '')
-    item = xbmcgui.ListItem(title, offscreen=True)
-
-    music_tag = item.getMusicInfoTag()
-    music_tag.setMediaType('album')
-    music_tag.setAlbum(title)
-
-    albumid = album.get('albumid')
-    if albumid:
-        music_tag.setDbId(albumid, 'album')
-
-    artists = album.get('artist', [])
-    if artists:
-        if isinstance(artists, list):
-            music_tag.setArtist(artists[0] if artists else '')
-        else:
-            music_tag.setArtist(str(artists))
-
-    year = album.get('year', 0)
-    if year:
-        music_tag.setYear(int(year))
-
-    genres = album.get('genre', [])
-    if genres:
-        music_tag.setGenres(genres if isinstance(genres, list) else [genres])
-
-    rating = album.get('rating')
-    if rating:
-        music_tag.setRating(float(rating))
-
-    userrating = album.get('userrating')
-    if userrating:
-        music_tag.setUserRating(int(userrating))
-
-    art = album.get('art', {})
-    if not art:
-        thumb = album.get('thumbnail', '')
-        if thumb:
-            art = {'thumb': thumb}
-    if art:
-        item.setArt(art)
-
-    return item
-
-
-def _create_musicvideo_listitem(mv: dict) -> xbmcgui.ListItem:
-    """Create musicvideo ListItem with VideoInfoTag + art."""
-    title = mv.get('title') or mv.get('label', '')
-    item = xbmcgui.ListItem(title, offscreen=True)
-
-    video_tag = item.getVideoInfoTag()
-    video_tag.setMediaType('musicvideo')
-    video_tag.setTitle(title)
-
-    mvid = mv.get('musicvideoid')
-    if mvid:
-        video_tag.setDbId(mvid)
-
-    year = mv.get('year', 0)
-    if year:
-        video_tag.setYear(int(year))
-
-    runtime = mv.get('runtime', 0)
-    if runtime:
-        video_tag.setDuration(int(runtime))
-
-    plot = mv.get('plot', '')
-    if plot:
-        video_tag.setPlot(plot)
-
-    directors = mv.get('director', [])
-    if directors:
-        video_tag.setDirectors(directors if isinstance(directors, list) else [directors])
-
-    studios = mv.get('studio', [])
-    if studios:
-        video_tag.setStudios(studios if isinstance(studios, list) else [studios])
-
-    genres = mv.get('genre', [])
-    if genres:
-        video_tag.setGenres(genres if isinstance(genres, list) else [genres])
-
-    artists = mv.get('artist', [])
-    if artists:
-        video_tag.setArtists(artists if isinstance(artists, list) else [artists])
-
-    album = mv.get('album', '')
-    if album:
-        video_tag.setAlbum(album)
-
-    track = mv.get('track', 0)
-    if track:
-        video_tag.setTrackNumber(int(track))
-
-    playcount = mv.get('playcount', 0)
-    if playcount:
-        video_tag.setPlaycount(int(playcount))
-
-    lastplayed = mv.get('lastplayed', '')
-    if lastplayed:
-        video_tag.setLastPlayed(lastplayed)
-
-    rating = mv.get('rating', 0.0)
-    if rating:
-        video_tag.setRating(float(rating))
-
-    userrating = mv.get('userrating', 0)
-    if userrating:
-        video_tag.setUserRating(int(userrating))
-
-    tags = mv.get('tag', [])
-    if tags:
-        video_tag.setTags(tags if isinstance(tags, list) else [tags])
-
-    resume = mv.get('resume', {})
-    if isinstance(resume, dict):
-        position = resume.get('position', 0)
-        total = resume.get('total', 0)
-        if position > 0 and total > 0:
-            video_tag.setResumePoint(position, total)
-
-    art = mv.get('art', {})
-    if art:
-        item.setArt(art)
-
-    return item
-
-
 def handle_similar_artists(handle: int, params: dict) -> None:
     """Get library artists similar to the given artist via Last.fm data."""
     artist_name = _resolve_artist_name(params)
@@ -261,12 +99,7 @@ def handle_similar_artists(handle: int, params: dict) -> None:
     })
     matched = extract_result(result, 'artists', [])[:limit]
 
-    for artist in matched:
-        item = _create_artist_listitem(artist)
-        xbmcplugin.addDirectoryItem(handle, '', item, isFolder=False)
-
-    xbmcplugin.setContent(handle, 'artists')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_directory_items('artist', matched), 'artists')
     log("Plugin", f"similar_artists: Returned {len(matched)} artists for '{artist_name}'",
         xbmc.LOGDEBUG)
 
@@ -297,12 +130,7 @@ def handle_artist_albums(handle: int, params: dict) -> None:
     })
     albums = extract_result(result, 'albums', [])
 
-    for album in albums:
-        item = _create_album_listitem(album)
-        xbmcplugin.addDirectoryItem(handle, '', item, isFolder=False)
-
-    xbmcplugin.setContent(handle, 'albums')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, build_directory_items('album', albums), 'albums')
     log("Plugin", f"artist_albums: Returned {len(albums)} albums for '{artist_name}'",
         xbmc.LOGDEBUG)
 
@@ -334,19 +162,12 @@ def handle_artist_musicvideos(handle: int, params: dict) -> None:
     })
     musicvideos = extract_result(result, 'musicvideos', [])
 
-    count = 0
-    for mv in musicvideos:
-        if exclude_id and mv.get('musicvideoid') == exclude_id:
-            continue
-        if count >= limit:
-            break
-        item = _create_musicvideo_listitem(mv)
-        file_path = mv.get('file', '')
-        xbmcplugin.addDirectoryItem(handle, file_path, item, isFolder=False)
-        count += 1
-
-    xbmcplugin.setContent(handle, 'musicvideos')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    musicvideos = [mv for mv in musicvideos
+                   if not (exclude_id and mv.get('musicvideoid') == exclude_id)][:limit]
+    count = len(musicvideos)
+
+    emit_directory(handle, build_directory_items('musicvideo', musicvideos, url_key='file'),
+                   'musicvideos')
     log("Plugin", f"artist_musicvideos: Returned {count} musicvideos for '{artist_name}'",
         xbmc.LOGDEBUG)
 
@@ -388,17 +209,12 @@ def handle_genre_artists(handle: int, params: dict) -> None:
     })
     artists = extract_result(result, 'artists', [])
 
-    count = 0
-    for artist in artists:
-        name = artist.get('artist') or artist.get('label', '')
-        if source_artist and name.lower() == source_artist.lower():
-            continue
-        if count >= limit:
-            break
-        item = _create_artist_listitem(artist)
-        xbmcplugin.addDirectoryItem(handle, '', item, isFolder=False)
-        count += 1
-
-    xbmcplugin.setContent(handle, 'artists')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    if source_artist:
+        source_key = source_artist.lower()
+        artists = [a for a in artists
+                   if (a.get('artist') or a.get('label', '')).lower() != source_key]
+    artists = artists[:limit]
+    count = len(artists)
+
+    emit_directory(handle, build_directory_items('artist', artists), 'artists')
     log("Plugin", f"genre_artists: Returned {count} artists for genre '{genre}'", xbmc.LOGDEBUG)
@@ -8,21 +8,10 @@ import xbmc
 import xbmcgui
 import xbmcplugin
 from lib.kodi.client import request, get_item_details, extract_result, ADDON
-
-
-def _set_episode_artwork_from_show(listitem: xbmcgui.ListItem, show_art: dict,
-                                   episode_art: dict) -> None:
-    """Set episode ListItem art using show artwork + episode thumb."""
-    listitem.setArt({
-        'poster': show_art.get('poster', ''),
-        'fanart': show_art.get('fanart', ''),
-        'clearlogo': show_art.get('clearlogo', '') or show_art.get('logo', ''),
-        'banner': show_art.get('banner', ''),
-        'landscape': show_art.get('landscape', ''),
-        'clearart': show_art.get('clearart', ''),
-        'thumb': episode_art.get('thumb', ''),
-        'icon': 'DefaultTVShows.png'
-    })
+from lib.plugin.emit import (
+    build_directory_items, build_episode_listitem, build_movie_listitem, build_tvshow_listitem,
+    emit_directory, set_episode_artwork_from_show,
+)
 
 
 def handle_next_up(handle: int, params: dict) -> None:
@@ -87,8 +76,8 @@ def handle_next_up(handle: int, params: dict) -> None:
 
         if next_ep:
             episode = next_ep[0]
-            listitem = _create_episode_listitem(episode)
-            _set_episode_artwork_from_show(listitem, show['art'], episode['art'])
+            listitem = build_episode_listitem(episode)
+            set_episode_artwork_from_show(listitem, show['art'], episode['art'])
             video_tag = listitem.getVideoInfoTag()
             if show.get('mpaa'):
                 video_tag.setMpaa(show['mpaa'])
@@ -96,67 +85,7 @@ def handle_next_up(handle: int, params: dict) -> None:
                 video_tag.setStudios(show['studio'])
             items.append((episode['file'], listitem, False))
 
-    for url, listitem, isfolder in items:
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
-
-    xbmcplugin.setContent(handle, 'episodes')
-    xbmcplugin.endOfDirectory(handle)
-
-
-def _create_episode_listitem(episode: dict) -> xbmcgui.ListItem:
-    """Create an episode ListItem labeled `2x05. Title` (or `S05. Title` for specials)."""
-    season = episode.get('season', 0)
-    ep_num = episode.get('episode', 0)
-    title = episode.get('title', '')
-
-    if ep_num < 10:
-        ep_label = f"0{ep_num}. {title}"
-    else:
-        ep_label = f"{ep_num}. {title}"
-
-    if season == 0:
-        label = f"S{ep_label}"
-    else:
-        label = f"{season}x{ep_label}"
-
-    listitem = xbmcgui.ListItem(label, offscreen=True)
-
-    video_tag = listitem.getVideoInfoTag()
-    video_tag.setTitle(title)
-
-    episodeid = episode.get('episodeid')
-    if episodeid:
-        video_tag.setDbId(episodeid)
-    video_tag.setEpisode(ep_num)
-    video_tag.setSeason(season)
-    video_tag.setTvShowTitle(episode.get('showtitle', ''))
-    video_tag.setPlot(episode.get('plot', ''))
-    video_tag.setFirstAired(episode.get('firstaired', ''))
-
-    rating = episode.get('rating', 0.0)
-    video_tag.setRating(float(rating) if rating else 0.0)
-
-    userrating = episode.get('userrating', 0)
-    video_tag.setUserRating(int(userrating) if userrating else 0)
-
-    playcount = episode.get('playcount', 0)
-    video_tag.setPlaycount(int(playcount) if playcount else 0)
-
-    video_tag.setLastPlayed(episode.get('lastplayed', ''))
-
-    runtime = episode.get('runtime', 0)
-    video_tag.setDuration(int(runtime) if runtime else 0)
-
-    video_tag.setMediaType('episode')
-
-    resume = episode.get('resume', {})
-    if isinstance(resume, dict):
-        resume_position = resume.get('position', 0)
-        resume_total = resume.get('total', 0)
-        if resume_position > 0 and resume_total > 0:
-            video_tag.setResumePoint(resume_position, resume_total)
-
-    return listitem
+    emit_directory(handle, items, 'episodes')
 
 
 def handle_recent_episodes_grouped(handle: int, params: dict) -> None:
@@ -200,8 +129,8 @@ def handle_recent_episodes_grouped(handle: int, params: dict) -> None:
 
             if episodes:
                 episode = episodes[0]
-                listitem = _create_episode_listitem(episode)
-                _set_episode_artwork_from_show(listitem, show['art'], episode['art'])
+                listitem = build_episode_listitem(episode)
+                set_episode_artwork_from_show(listitem, show['art'], episode['art'])
                 if show.get('season'):
                     listitem.setProperty('TotalSeasons', str(show['season']))
                 items.append((episode['file'], listitem, False))
@@ -222,134 +151,33 @@ def handle_recent_episodes_grouped(handle: int, params: dict) -> None:
                 date2 = recent_eps[1].get('dateadded', '').split('T')[0]
 
                 if date1 == date2:
-                    listitem = _create_tvshow_listitem(show)
+                    listitem = build_tvshow_listitem(show)
                     if show.get('season'):
                         listitem.setProperty('TotalSeasons', str(show['season']))
                     show_url = f"videodb://tvshows/titles/{show['tvshowid']}/"
                     items.append((show_url, listitem, True))
                 else:
                     episode = recent_eps[0]
-                    listitem = _create_episode_listitem(episode)
-                    _set_episode_artwork_from_show(listitem, show['art'], episode['art'])
+                    listitem = build_episode_listitem(episode)
+                    set_episode_artwork_from_show(listitem, show['art'], episode['art'])
                     if show.get('season'):
                         listitem.setProperty('TotalSeasons', str(show['season']))
                     items.append((episode['file'], listitem, False))
             elif recent_eps:
                 episode = recent_eps[0]
-                listitem = _create_episode_listitem(episode)
-                _set_episode_artwork_from_show(listitem, show['art'], episode['art'])
+                listitem = build_episode_listitem(episode)
+                set_episode_artwork_from_show(listitem, show['art'], episode['art'])
                 if show.get('season'):
                     listitem.setProperty('TotalSeasons', str(show['season']))
                 items.append((episode['file'], listitem, False))
         else:
-            listitem = _create_tvshow_listitem(show)
+            listitem = build_tvshow_listitem(show)
             if show.get('season'):
                 listitem.setProperty('TotalSeasons', str(show['season']))
             show_url = f"videodb://tvshows/titles/{show['tvshowid']}/"
             items.append((show_url, listitem, True))
 
-    for url, listitem, isfolder in items:
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
-
-    xbmcplugin.setContent(handle, 'tvshows')
-    xbmcplugin.endOfDirectory(handle)
-
-
-def _create_tvshow_listitem(show: dict) -> xbmcgui.ListItem:
-    """Create a TV show ListItem from a JSON-RPC show dict."""
-    title = show.get('title', '')
-    listitem = xbmcgui.ListItem(title, offscreen=True)
-
-    video_tag = listitem.getVideoInfoTag()
-    video_tag.setTitle(title)
-    video_tag.setMediaType('tvshow')
-
-    tvshowid = show.get('tvshowid')
-    if tvshowid:
-        video_tag.setDbId(tvshowid)
-
-    plot = show.get('plot', '')
-    if plot:
-        video_tag.setPlot(plot)
-
-    rating = show.get('rating', 0.0)
-    if rating:
-        video_tag.setRating(float(rating))
-
-    userrating = show.get('userrating', 0)
-    if userrating:
-        video_tag.setUserRating(int(userrating))
-
-    votes = show.get('votes', 0)
-    if votes:
-        votes_int = int(votes) if isinstance(votes, (int, str)) and str(votes).isdigit() else 0
-        video_tag.setVotes(votes_int)
-
-    year = show.get('year', 0)
-    if year:
-        video_tag.setYear(int(year))
-
-    premiered = show.get('premiered', '')
-    if premiered:
-        video_tag.setPremiered(premiered)
-
-    playcount = show.get('playcount', 0)
-    if playcount:
-        video_tag.setPlaycount(int(playcount))
-
-    lastplayed = show.get('lastplayed', '')
-    if lastplayed:
-        video_tag.setLastPlayed(lastplayed)
-
-    genres = show.get('genre', [])
-    if genres:
-        video_tag.setGenres(genres if isinstance(genres, list) else [genres])
-
-    studios = show.get('studio', [])
-    if studios:
-        video_tag.setStudios(studios if isinstance(studios, list) else [studios])
-
-    mpaa = show.get('mpaa', '')
-    if mpaa:
-        video_tag.setMpaa(mpaa)
-
-    cast_list = show.get('cast', [])
-    if cast_list:
-        video_tag.setCast([
-            xbmc.Actor(
-                member.get('name', ''),
-                member.get('role', ''),
-                member.get('order', 0),
-                member.get('thumbnail', '')
-            )
-            for member in cast_list
-        ])
-
-    tags = show.get('tag', [])
-    if tags:
-        video_tag.setTags(tags if isinstance(tags, list) else [tags])
-
-    originaltitle = show.get('originaltitle', '')
-    if originaltitle:
-        video_tag.setOriginalTitle(originaltitle)
-
-    imdbnumber = show.get('imdbnumber', '')
-    if imdbnumber:
-        video_tag.setIMDBNumber(imdbnumber)
-
-    episode_count = show.get('episode', 0)
-    watched_episodes = show.get('watchedepisodes', 0)
-    unwatched_episodes = episode_count - watched_episodes
-    # integer math, not round(), to match Kodi's own WatchedEpisodePercent
-    watched_percent = (watched_episodes * 100) // episode_count if episode_count > 0 else 0
-    listitem.setProperty('TotalEpisodes', str(episode_count))
-    listitem.setProperty('WatchedEpisodes', str(watched_episodes))
-    listitem.setProperty('UnWatchedEpisodes', str(unwatched_episodes))
-    listitem.setProperty('WatchedEpisodePercent', str(watched_percent))
-
-    listitem.setArt(show.get('art', {}))
-
-    return listitem
+    emit_directory(handle, items, 'tvshows')
 
 
 def _find_actor_role(cast: list, actor_name: str) -> str:
@@ -435,7 +263,7 @@ def handle_by_actor(handle: int, params: dict) -> None:
 
         for movie in movies:
             if movie.get('movieid') != dbid or dbtype != 'movie':
-                listitem = _create_movie_listitem(movie)
+                listitem = build_movie_listitem(movie)
                 role = _find_actor_role(movie.get('cast', []), actor)
                 if role:
                     listitem.setProperty('Role', role)
@@ -455,7 +283,7 @@ def handle_by_actor(handle: int, params: dict) -> None:
 
         for show in shows:
             if show.get('tvshowid') != dbid or dbtype != 'tvshow':
-                listitem = _create_tvshow_listitem(show)
+                listitem = build_tvshow_listitem(show)
                 role = _find_actor_role(show.get('cast', []), actor)
                 if role:
                     listitem.setProperty('Role', role)
@@ -464,103 +292,16 @@ def handle_by_actor(handle: int, params: dict) -> None:
 
     random.shuffle(all_items)
 
-    for url, listitem, isfolder in all_items:
+    for _, listitem, _ in all_items:
         listitem.setProperty('Actor', actor)
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
 
     if mix:
-        xbmcplugin.setContent(handle, 'videos')
+        content = 'videos'
     elif dbtype in ('movie', 'set'):
-        xbmcplugin.setContent(handle, 'movies')
+        content = 'movies'
     else:
-        xbmcplugin.setContent(handle, 'tvshows')
-    xbmcplugin.endOfDirectory(handle)
-
-
-def _create_movie_listitem(movie: dict) -> xbmcgui.ListItem:
-    """Create a movie ListItem from a JSON-RPC movie dict."""
-    title = movie.get('title', '')
-    listitem = xbmcgui.ListItem(title, offscreen=True)
-
-    video_tag = listitem.getVideoInfoTag()
-    video_tag.setTitle(title)
-    video_tag.setMediaType('movie')
-
-    movieid = movie.get('movieid')
-    if movieid:
-        video_tag.setDbId(movieid)
-
-    plot = movie.get('plot', '')
-    if plot:
-        video_tag.setPlot(plot)
-
-    rating = movie.get('rating', 0.0)
-    if rating:
-        video_tag.setRating(float(rating))
-
-    userrating = movie.get('userrating', 0)
-    if userrating:
-        video_tag.setUserRating(int(userrating))
-
-    votes = movie.get('votes', 0)
-    if votes:
-        votes_int = int(votes) if isinstance(votes, (int, str)) and str(votes).isdigit() else 0
-        video_tag.setVotes(votes_int)
-
-    year = movie.get('year', 0)
-    if year:
-        video_tag.setYear(int(year))
-
-    playcount = movie.get('playcount', 0)
-    if playcount:
-        video_tag.setPlaycount(int(playcount))
-
-    lastplayed = movie.get('lastplayed', '')
-    if lastplayed:
-        video_tag.setLastPlayed(lastplayed)
-
-    runtime = movie.get('runtime', 0)
-    if runtime:
-        video_tag.setDuration(int(runtime))
-
-    genres = movie.get('genre', [])
-    if genres:
-        video_tag.setGenres(genres if isinstance(genres, list) else [genres])
-
-    directors = movie.get('director', [])
-    if directors:
-        video_tag.setDirectors(directors if isinstance(directors, list) else [directors])
-
-    studios = movie.get('studio', [])
-    if studios:
-        video_tag.setStudios(studios if isinstance(studios, list) else [studios])
-
-    mpaa = movie.get('mpaa', '')
-    if mpaa:
-        video_tag.setMpaa(mpaa)
-
-    tagline = movie.get('tagline', '')
-    if tagline:
-        video_tag.setTagLine(tagline)
-
-    trailer = movie.get('trailer', '')
-    if trailer:
-        video_tag.setTrailer(trailer)
-
-    tags = movie.get('tag', [])
-    if tags:
-        video_tag.setTags(tags if isinstance(tags, list) else [tags])
-
-    resume = movie.get('resume', {})
-    if isinstance(resume, dict):
-        resume_position = resume.get('position', 0)
-        resume_total = resume.get('total', 0)
-        if resume_position > 0 and resume_total > 0:
-            video_tag.setResumePoint(resume_position, resume_total)
-
-    listitem.setArt(movie.get('art', {}))
-
-    return listitem
+        content = 'tvshows'
+    emit_directory(handle, all_items, content)
 
 
 def handle_by_director(handle: int, params: dict) -> None:
@@ -613,7 +354,7 @@ def handle_by_director(handle: int, params: dict) -> None:
 
         for movie in movies:
             if movie.get('movieid') != dbid or dbtype != 'movie':
-                listitem = _create_movie_listitem(movie)
+                listitem = build_movie_listitem(movie)
                 all_items.append((movie['file'], listitem, False))
 
     if mix or dbtype == 'episode':
@@ -630,7 +371,7 @@ def handle_by_director(handle: int, params: dict) -> None:
         show_art_cache: dict[int, dict] = {}
         for episode in episodes:
             if episode.get('episodeid') != dbid or dbtype != 'episode':
-                listitem = _create_episode_listitem(episode)
+                listitem = build_episode_listitem(episode)
 
                 tvshowid = episode.get('tvshowid')
                 if tvshowid:
@@ -646,23 +387,22 @@ def handle_by_director(handle: int, params: dict) -> None:
 
                     show_art = show_art_cache[tvshowid]
                     if show_art:
-                        _set_episode_artwork_from_show(listitem, show_art, episode['art'])
+                        set_episode_artwork_from_show(listitem, show_art, episode['art'])
 
                 all_items.append((episode['file'], listitem, False))
 
     random.shuffle(all_items)
 
-    for url, listitem, isfolder in all_items:
+    for _, listitem, _ in all_items:
         listitem.setProperty('Director', director)
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
 
     if mix:
-        xbmcplugin.setContent(handle, 'videos')
+        content = 'videos'
     elif dbtype in ('movie', 'set'):
-        xbmcplugin.setContent(handle, 'movies')
+        content = 'movies'
     else:
-        xbmcplugin.setContent(handle, 'episodes')
-    xbmcplugin.endOfDirectory(handle)
+        content = 'episodes'
+    emit_directory(handle, all_items, content)
 
 
 def handle_similar(handle: int, params: dict) -> None:
@@ -819,7 +559,7 @@ def handle_similar(handle: int, params: dict) -> None:
             if not full:
                 continue
             full['movieid'] = item_id
-            listitem = _create_movie_listitem(full)
+            listitem = build_movie_listitem(full)
             all_items.append((full.get('file', ''), listitem, False))
         else:
             detail = request('VideoLibrary.GetTVShowDetails',
@@ -828,17 +568,10 @@ def handle_similar(handle: int, params: dict) -> None:
             if not full:
                 continue
             full['tvshowid'] = item_id
-            listitem = _create_tvshow_listitem(full)
+            listitem = build_tvshow_listitem(full)
             all_items.append((f"videodb://tvshows/titles/{item_id}/", listitem, True))
 
-    for url, listitem, isfolder in all_items:
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
-
-    if target_dbtype == 'movie':
-        xbmcplugin.setContent(handle, 'movies')
-    else:
-        xbmcplugin.setContent(handle, 'tvshows')
-    xbmcplugin.endOfDirectory(handle, succeeded=True)
+    emit_directory(handle, all_items, 'movies' if target_dbtype == 'movie' else 'tvshows')
 
 
 def _fetch_unwatched(dbtype: str, genre_filter: dict) -> list:
@@ -918,7 +651,7 @@ def _render_recommended(handle: int, scored_items: list, based_on_label: str, db
             if not full:
                 continue
             full['movieid'] = item_id
-            listitem = _create_movie_listitem(full)
+            listitem = build_movie_listitem(full)
             listitem.setProperty('BasedOn', based_on_raw)
             if based_on_label:
                 listitem.setProperty('BasedOnLabel', based_on_label)
@@ -931,7 +664,7 @@ def _render_recommended(handle: int, scored_items: list, based_on_label: str, db
             if not full:
                 continue
             full['tvshowid'] = item_id
-            listitem = _create_tvshow_listitem(full)
+            listitem = build_tvshow_listitem(full)
             listitem.setProperty('BasedOn', based_on_raw)
             if based_on_label:
                 listitem.setProperty('BasedOnLabel', based_on_label)
@@ -939,16 +672,13 @@ def _render_recommended(handle: int, scored_items: list, based_on_label: str, db
                 listitem.setProperty('TotalSeasons', str(full['season']))
             all_items.append((f"videodb://tvshows/titles/{item_id}/", listitem, True))
 
-    for url, listitem, isfolder in all_items:
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
-
     if dbtype == 'movie':
-        xbmcplugin.setContent(handle, 'movies')
+        content = 'movies'
     elif dbtype == 'tvshow':
-        xbmcplugin.setContent(handle, 'tvshows')
+        content = 'tvshows'
     else:
-        xbmcplugin.setContent(handle, 'videos')
-    xbmcplugin.endOfDirectory(handle)
+        content = 'videos'
+    emit_directory(handle, all_items, content)
 
 
 def _recommend_single(handle: int, history: list, dbtype: str, limit: int,
@@ -1410,13 +1140,4 @@ def handle_seasonal(handle: int, params: dict) -> None:
             return
         movies = _query_movies(movie_filter, sort_method, limit)
 
-    all_items = []
-    for movie in movies:
-        listitem = _create_movie_listitem(movie)
-        all_items.append((movie['file'], listitem, False))
-
-    for url, listitem, isfolder in all_items:
-        xbmcplugin.addDirectoryItem(handle, url, listitem, isfolder)
-
-    xbmcplugin.setContent(handle, 'movies')
-    xbmcplugin.endOfDirectory(handle)
+    emit_directory(handle, build_directory_items('movie', movies, url_key='file'), 'movies')
@@ -22,13 +22,14 @@ PROGRESS_SAVE_INTERVAL = 50
 
 _RATING_EPSILON = 0.05  # IMDb ratings are 1-decimal; ignore sub-step drift from other scrapers
 
-_DRIP_DELAY = {
-    "idle": {"movie": 0, "tvshow": 0, "episode": 0},
-    "library": {"movie": 500, "tvshow": 1500, "episode": 1500},
-}
+# Adaptive apply: batches double while Kodi answers well under the target latency and halve
+# when it answers over it. Browsing the library keeps batches small and pauses after each
+# one for `_LIBRARY_PAUSE_RATIO` times its latency, so Kodi stays free most of the time.
+_APPLY_BATCH_LIMITS = {"idle": 100, "library": 10}
+_APPLY_TARGET_MS = {"idle": 500, "library": 150}
+_LIBRARY_PAUSE_RATIO = 3
 _PLAYBACK_POLL_MS = 10000
 _RESUME_GRACE_S = 300
-_SYNC_FLUSH_SIZE = 50
 
 
 def _get_kodi_state() -> str:
@@ -63,6 +64,29 @@ def _wait_until_video_idle(monitor: xbmc.Monitor) -> bool:
             return True
 
 
+class _AdaptiveBatchSizer:
+    """Sizes rating apply batches from measured JSON-RPC latency and Kodi state."""
+
+    def __init__(self) -> None:
+        self.size = 1
+
+    def next_size(self, state: str) -> int:
+        return max(1, min(self.size, _APPLY_BATCH_LIMITS.get(state, 1)))
+
+    def record(self, state: str, elapsed_s: float) -> float:
+        """Adjust the next batch size for one batch's latency. Returns the pause in seconds."""
+        limit = _APPLY_BATCH_LIMITS.get(state, 1)
+        target_ms = _APPLY_TARGET_MS.get(state, _APPLY_TARGET_MS["library"])
+        elapsed_ms = elapsed_s * 1000
+
+        if elapsed_ms < target_ms / 2:
+            self.size = min(self.size * 2, limit)
+        elif elapsed_ms > target_ms:
+            self.size = max(1, self.size // 2)
+
+        return elapsed_s * _LIBRARY_PAUSE_RATIO if state == "library" else 0.0
+
+
 def preserve_other_ratings(existing_ratings: Dict, kodi_ratings: Dict) -> None:
     """Copy non-imdb ratings from existing into kodi_ratings during IMDb-only updates."""
     for source_name, rating_data in existing_ratings.items():
@@ -119,86 +143,97 @@ def update_changed_imdb_ratings(
     if not monitor:
         monitor = xbmc.Monitor()
 
-    sync_batch: List[tuple] = []
     heading = ADDON.getLocalizedString(32318)
     progress = xbmcgui.DialogProgressBG()
     progress.create(heading)
+    sizer = _AdaptiveBatchSizer()
+    idx = 0
 
-    for idx, (item_media_type, item) in enumerate(work_items):
+    while idx < len(work_items):
         if monitor.abortRequested():
             log("Ratings", "Abort requested, stopping incremental update", xbmc.LOGINFO)
             break
 
-        pct = int((idx / combined_total) * 100)
-        label = (item.get("title") or title_map.get((item_media_type, item["dbid"]))
-                 or item.get("imdb_id", ""))
-        progress.update(pct, heading,
-                        ADDON.getLocalizedString(32306).format(idx + 1, combined_total, label))
-
         state = _get_kodi_state()
         if state == "playing":
-            if sync_batch:
-                db.update_synced_ratings_batch(sync_batch)
-                sync_batch = []
             progress.close()
             if not _wait_until_video_idle(monitor):
                 break
             progress.create(heading)
             state = _get_kodi_state()
 
-        set_method_info = KODI_SET_DETAILS_METHODS.get(item_media_type)
-        if not set_method_info:
-            stats["failed"] += 1
-            continue
+        chunk = work_items[idx:idx + sizer.next_size(state)]
+        idx += len(chunk)
+
+        first_type, first_item = chunk[0]
+        label = (first_item.get("title") or title_map.get((first_type, first_item["dbid"]))
+                 or first_item.get("imdb_id", ""))
+        progress.update(int((idx / combined_total) * 100), heading,
+                        ADDON.getLocalizedString(32306).format(idx, combined_total, label))
+
+        pending: List[Tuple[str, Dict]] = []
+        calls = []
+        for item_media_type, item in chunk:
+            set_method_info = KODI_SET_DETAILS_METHODS.get(item_media_type)
+            if not set_method_info:
+                stats["failed"] += 1
+                continue
 
-        if not item.get("imdb_id"):
-            stats["skipped"] += 1
+            if not item.get("imdb_id"):
+                stats["skipped"] += 1
+                continue
+
+            set_method, set_id_key = set_method_info
+            pending.append((item_media_type, item))
+            calls.append({"method": set_method, "params": {
+                set_id_key: item["dbid"],
+                "ratings": {
+                    "imdb": {"rating": item["new_rating"], "votes": item["new_votes"],
+                             "default": True}
+                }
+            }})
+
+        if not calls:
             continue
 
-        set_method, set_id_key = set_method_info
-        response = request(set_method, {
-            set_id_key: item["dbid"],
-            "ratings": {
-                "imdb": {"rating": item["new_rating"], "votes": item["new_votes"], "default": True}
-            }
-        })
-
-        if response is not None and "error" not in response:
-            sync_batch.append((
-                item_media_type, item["dbid"], 'imdb',
-                item["imdb_id"], item["new_rating"], item["new_votes"]
-            ))
-            is_new = item.get('old_rating', 0.0) == 0.0 and item.get('old_votes', 0) == 0
-            if is_new:
-                log("Ratings", f"Added {item['imdb_id']}: imdb ({item['new_rating']:.1f})",
-                    xbmc.LOGDEBUG)
+        started = time.monotonic()
+        responses = batch_request(calls)
+        elapsed = time.monotonic() - started
+
+        sync_batch: List[tuple] = []
+        for (item_media_type, item), response in zip(pending, responses):
+            if response is not None and "error" not in response:
+                sync_batch.append((
+                    item_media_type, item["dbid"], 'imdb',
+                    item["imdb_id"], item["new_rating"], item["new_votes"]
+                ))
+                is_new = item.get('old_rating', 0.0) == 0.0 and item.get('old_votes', 0) == 0
+                if is_new:
+                    log("Ratings", f"Added {item['imdb_id']}: imdb ({item['new_rating']:.1f})",
+                        xbmc.LOGDEBUG)
+                else:
+                    log("Ratings",
+                        f"Updated {item['imdb_id']}: imdb "
+                        f"({item.get('old_rating', 0):.1f} -> {item['new_rating']:.1f})",
+                        xbmc.LOGDEBUG)
+                stats["updated"] += 1
             else:
                 log("Ratings",
-                    f"Updated {item['imdb_id']}: imdb "
-                    f"({item.get('old_rating', 0):.1f} -> {item['new_rating']:.1f})",
+                    f"Failed {item['imdb_id']}: {item_media_type} dbid={item['dbid']} "
+                    "(stale or invalid)",
                     xbmc.LOGDEBUG)
-            stats["updated"] += 1
-        else:
-            log("Ratings",
-                f"Failed {item['imdb_id']}: {item_media_type} dbid={item['dbid']} "
-                "(stale or invalid)",
-                xbmc.LOGDEBUG)
-            db.clear_synced_ratings(item_media_type, item["dbid"])
-            stats["failed"] += 1
+                db.clear_synced_ratings(item_media_type, item["dbid"])
+                stats["failed"] += 1
 
-        if len(sync_batch) >= _SYNC_FLUSH_SIZE:
+        if sync_batch:
             db.update_synced_ratings_batch(sync_batch)
-            sync_batch = []
 
-        delay_ms = _DRIP_DELAY.get(state, _DRIP_DELAY["idle"]).get(item_media_type, 100)
-        if delay_ms > 0:
-            xbmc.sleep(delay_ms)
+        pause = sizer.record(state, elapsed)
+        if pause > 0 and monitor.waitForAbort(pause):
+            break
 
     progress.close()
 
-    if sync_batch:
-        db.update_synced_ratings_batch(sync_batch)
-
     total = stats["updated"] + stats["skipped"] + stats["failed"]
     if total > 0:
         log("Ratings",
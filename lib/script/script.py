@@ -1,7 +1,7 @@
 """Entry point for script.skin.info.service."""
 import sys
 import xbmc
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
 from lib.kodi.client import log
 from lib.kodi.utilities import set_prop, clear_prop, resolve_infolabel
 from lib.infrastructure.dialogs import DialogProgress
@@ -71,12 +71,15 @@ def _blur_image_and_set_property(source: str, prefix: str = "",
 
 def _parse_args(start_index: int) -> dict:
     """Parse `sys.argv[start_index:]` with both positional and `key=value` support."""
+    return parse_arg_list(sys.argv[start_index:])
+
+
+def parse_arg_list(arg_list: List[str]) -> dict:
+    """Parse RunScript-style arguments with both positional and `key=value` support."""
     args = {}
     positional_index = 0
 
-    for i in range(start_index, len(sys.argv)):
-        arg = sys.argv[i]
-
+    for arg in arg_list:
         if '=' in arg:
             key, value = arg.split('=', 1)
             args[key.strip()] = value.strip()
@@ -272,6 +275,22 @@ def _handle_export_nfo(args: dict) -> None:
                           xbmcgui.NOTIFICATION_WARNING, 3000)
 
 
+def _handle_export_nfo_library(_args: dict) -> None:
+    from lib.editor.export import run_export_library_nfos
+    run_export_library_nfos()
+
+
+def _handle_jsonrpc_trace_report(_args: dict) -> None:
+    from lib.kodi.client import ADDON
+    from lib.kodi.tracing import build_report
+    from lib.infrastructure.dialogs import show_ok, show_textviewer
+    report = build_report()
+    if report:
+        show_textviewer(ADDON.getLocalizedString(32691), report)
+    else:
+        show_ok(ADDON.getLocalizedString(32691), ADDON.getLocalizedString(32692))
+
+
 def _handle_settings_action(args: dict) -> None:
     from lib.data.api import settings as api_settings
     sub_action = args.get('sub_action')
@@ -826,6 +845,8 @@ _HANDLERS: Dict[str, Callable[[dict], None]] = {
     "update_ratings": _handle_update_ratings,
     "edit": _handle_edit,
     "export_nfo": _handle_export_nfo,
+    "export_nfo_library": _handle_export_nfo_library,
+    "jsonrpc_trace_report": _handle_jsonrpc_trace_report,
     "settings_action": _handle_settings_action,
     "arttest": _handle_arttest,
     "multiarttest": _handle_multiarttest,
@@ -840,6 +861,23 @@ _HANDLERS: Dict[str, Callable[[dict], None]] = {
 }
 
 
+# Actions that only read infolabels and set window properties. The service also runs these
+# in-process for `NotifyAll` commands (lib/service/commands.py); anything that opens a dialog
+# or runs a long task stays RunScript-only.
+RESIDENT_ACTIONS = frozenset((
+    "blur", "split_string", "urlencode", "urldecode", "math", "copy_item",
+    "container_labels", "refresh_counter", "file_exists", "get_setting",
+))
+
+
+def run_resident_action(action: str, args: dict) -> bool:
+    """Run one of `RESIDENT_ACTIONS`. Returns False if `action` isn't one of them."""
+    if action not in RESIDENT_ACTIONS:
+        return False
+    _HANDLERS[action](args)
+    return True
+
+
 def _dispatch_dialog(dialog: str, args: dict) -> None:
     from lib.skin.dialogs import (
         dialog_yesno, dialog_yesnocustom, dialog_ok, dialog_select,
@@ -2,7 +2,8 @@
 
 import hashlib
 import os
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
 import xbmc
 import xbmcvfs
@@ -12,6 +13,23 @@ from lib.kodi.client import log, decode_image_url, encode_image_url
 
 PIL_AVAILABLE = None
 
+# Output size of every blurred copy; skins stretch it to the background control.
+_OUTPUT_SIZE = 480
+
+# The blur itself runs on a copy this many times smaller, at a proportionally smaller radius,
+# then upscales. A Gaussian of radius r leaves no detail finer than r, so shrinking by up to
+# r/4 loses nothing visible and cuts the blur cost by the factor squared.
+_MAX_DOWNSCALE = 4
+
+# Part of every cache key; bump when `render_blur` output changes so old renders aren't reused.
+_PIPELINE_VERSION = 2
+
+# Cache filenames currently being rendered, so a focus render and a neighbor pre-blur of the
+# same image share one decode instead of racing to write the same file.
+_inflight: Dict[str, threading.Event] = {}
+_inflight_lock = threading.Lock()
+_INFLIGHT_WAIT_SECONDS = 10.0
+
 
 def _check_pil():
     global PIL_AVAILABLE
@@ -29,14 +47,14 @@ def _check_pil():
         return False
 
 
-def _get_resize_filter():
+def _get_resize_filter(name: str = 'NEAREST'):
     """Compatibility for old and new Pillow versions."""
     try:
         from PIL.Image import Resampling
-        return Resampling.NEAREST
+        return getattr(Resampling, name)
     except (ImportError, AttributeError):
         from PIL import Image
-        return Image.NEAREST  # type: ignore[attr-defined]
+        return getattr(Image, name)
 
 
 def _get_cache_dir():
@@ -76,7 +94,7 @@ def _url_to_cached_path(url: str) -> Optional[str]:
 
 
 def _generate_cache_key(source_path: str, blur_radius: int) -> str:
-    cache_key = f"{source_path}_{blur_radius}"
+    cache_key = f"{source_path}_{blur_radius}_v{_PIPELINE_VERSION}"
     hash_value = hashlib.md5(cache_key.encode("utf-8")).hexdigest()
     return f"{hash_value}.jpg"
 
@@ -113,6 +131,48 @@ def _cache_is_fresh(source_path: str, cache_path: str) -> bool:
         return True
 
 
+def _downscale_factor(blur_radius: int) -> int:
+    return max(1, min(_MAX_DOWNSCALE, blur_radius // 4))
+
+
+def render_blur(img, blur_radius: int):
+    """Blur an RGB PIL image to `_OUTPUT_SIZE` square via the downscale-first pipeline."""
+    from PIL import ImageFilter
+
+    img = img.resize((_OUTPUT_SIZE, _OUTPUT_SIZE), _get_resize_filter())
+
+    factor = _downscale_factor(blur_radius)
+    if factor > 1:
+        work_size = _OUTPUT_SIZE // factor
+        img = img.resize((work_size, work_size), _get_resize_filter('BILINEAR'))
+        img = img.filter(ImageFilter.GaussianBlur(radius=blur_radius / factor))
+        return img.resize((_OUTPUT_SIZE, _OUTPUT_SIZE), _get_resize_filter('BILINEAR'))
+
+    return img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+
+
+def _claim_render(cache_filename: str) -> Optional[threading.Event]:
+    """Register this thread as the renderer for `cache_filename`.
+
+    Returns the new event to set when done, or None if another thread already owns the
+    render (after waiting for it to finish).
+    """
+    with _inflight_lock:
+        existing = _inflight.get(cache_filename)
+        if existing is None:
+            event = threading.Event()
+            _inflight[cache_filename] = event
+            return event
+    existing.wait(_INFLIGHT_WAIT_SECONDS)
+    return None
+
+
+def _release_render(cache_filename: str, event: threading.Event) -> None:
+    with _inflight_lock:
+        _inflight.pop(cache_filename, None)
+    event.set()
+
+
 def blur_image(source_path: str, blur_radius: int = 40) -> Optional[str]:
     """Return a cached blurred copy of `source_path`. Creates it if missing. None on failure.
 
@@ -131,18 +191,32 @@ def blur_image(source_path: str, blur_radius: int = 40) -> Optional[str]:
         return None
 
     cache_dir = _get_cache_dir()
-    if cache_dir:
-        cache_filename = _generate_cache_key(source_path, blur_radius)
-        cache_path = os.path.join(cache_dir, cache_filename)
-        if xbmcvfs.exists(cache_path) and _cache_is_fresh(source_path, cache_path):
-            return cache_path
+    if not cache_dir:
+        return None
+
+    cache_filename = _generate_cache_key(source_path, blur_radius)
+    cache_path = os.path.join(cache_dir, cache_filename)
+    if xbmcvfs.exists(cache_path) and _cache_is_fresh(source_path, cache_path):
+        return cache_path
 
     if not _check_pil():
         return None
 
-    original_path = source_path
+    event = _claim_render(cache_filename)
+    if event is None:
+        return cache_path if xbmcvfs.exists(cache_path) else None
+
+    try:
+        return _blur_uncached(source_path, blur_radius, cache_path)
+    finally:
+        _release_render(cache_filename, event)
+
+
+def read_source_bytes(source_path: str) -> Optional[bytes]:
+    """Read image bytes for a local path, `image://` or http(s) URL. None on failure.
 
-    img_bytes = None
+    URLs are read from Kodi's texture cache when present, otherwise downloaded.
+    """
     if source_path.startswith(('http://', 'https://', 'image://')):
         local_path = _url_to_cached_path(source_path)
 
@@ -154,56 +228,67 @@ def blur_image(source_path: str, blur_radius: int = 40) -> Optional[str]:
                 if not img_bytes:
                     log("Blur", f"Failed to download artwork: {source_path}", xbmc.LOGWARNING)
                     return None
+                return bytes(img_bytes)
 
             except Exception as e:
                 log("Blur", f"Failed to download artwork: {source_path}: {e}", xbmc.LOGWARNING)
                 return None
-        else:
-            source_path = local_path
+
+        source_path = local_path
     else:
         source_path = xbmcvfs.translatePath(source_path)
 
-    if img_bytes is None and not xbmcvfs.exists(source_path):
+    if not xbmcvfs.exists(source_path):
         log("Blur", f"Source image does not exist: {source_path}", xbmc.LOGWARNING)
         return None
 
-    if not cache_dir:
+    try:
+        with xbmcvfs.File(source_path, 'rb') as f:
+            return bytes(f.readBytes())
+    except Exception as e:
+        log("Blur", f"Failed to read image {source_path}: {e}", xbmc.LOGWARNING)
         return None
 
-    cache_filename = _generate_cache_key(original_path, blur_radius)
-    cache_path = os.path.join(cache_dir, cache_filename)
 
+def _blur_uncached(source_path: str, blur_radius: int, cache_path: str) -> Optional[str]:
+    """Decode `source_path` once, store its palette, then blur and atomically write the cache."""
+    img_data = read_source_bytes(source_path)
+    if not img_data:
+        return None
+
+    tmp_path = None
     try:
-        from PIL import Image, ImageFilter
+        from PIL import Image
         import io
-
-        if img_bytes is None:
-            with xbmcvfs.File(source_path, 'rb') as f:
-                img_data = f.readBytes()
-        else:
-            img_data = img_bytes
+        from lib.service import palette
 
         with Image.open(io.BytesIO(img_data)) as img:
             if img.format == 'JPEG':
-                img.draft('RGB', (480, 480))
+                img.draft('RGB', (_OUTPUT_SIZE, _OUTPUT_SIZE))
 
             # JPEG doesn't support transparency
             if img.mode in ("RGBA", "LA", "PA", "P"):
                 img = img.convert("RGB")
 
-            img = img.resize((480, 480), _get_resize_filter())
+            palette.store_palette(source_path, img)
 
-            img = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+            img = render_blur(img, blur_radius)
 
-            img.save(
-                xbmcvfs.translatePath(cache_path),
-                "JPEG", quality=70, optimize=False, subsampling=2,
-            )
+            # Write beside the target and swap in, so a reader never sees a half-written file.
+            # `_inflight` is per process; the unique name keeps a RunScript render and the
+            # service's from writing the same temp file.
+            target = xbmcvfs.translatePath(cache_path)
+            tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+            img.save(tmp_path, "JPEG", quality=70, optimize=False, subsampling=2)
+            os.replace(tmp_path, target)
 
         return cache_path
 
     except Exception as e:
         log("Blur", f"Failed to blur image {source_path}: {e}", xbmc.LOGERROR)
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
         return None
-
-
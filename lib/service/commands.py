@@ -0,0 +1,119 @@
+"""Resident skin-command server.
+
+Skins can send the property-setting `RunScript` actions to the running service instead of
+starting a script interpreter per call:
+
+    NotifyAll(script.skin.info.service,"action=math,expression=1+2,prefix=Foo")
+
+The message uses the same comma-separated `key=value` arguments as `RunScript`. An optional
+JSON object as the third `NotifyAll` parameter adds arguments whose values contain commas.
+Only `RESIDENT_ACTIONS` are accepted; they run on one worker thread. A command waiting behind
+another that writes the same properties (same action, window, prefix and any argument in
+`_TARGET_ARGS`) is replaced by the newer one, so rapid focus changes only compute the last
+value. `refresh_counter` increments a property, so its commands all run.
+`SkinInfo.Service.Commands` is `true` while the server is running; skins fall back to
+`RunScript` when it isn't.
+"""
+from __future__ import annotations
+
+import itertools
+import json
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import xbmc
+
+from lib.infrastructure.workers import WorkerQueue
+from lib.kodi.client import log
+from lib.kodi.utilities import clear_prop, set_prop
+
+COMMAND_SENDER = "script.skin.info.service"
+READY_PROPERTY = "SkinInfo.Service.Commands"
+_METHOD_PREFIX = "Other."
+
+# Arguments besides prefix and window that go into the property names an action writes
+_TARGET_ARGS = {
+    'container_labels': ('infolabel',),
+    'copy_item': ('infolabels', 'artwork'),
+    'get_setting': ('setting',),
+}
+# Each run builds on the previous value, so a queued command is never replaced
+_NEVER_COALESCED = frozenset(('refresh_counter',))
+
+
+def parse_command(method: str, data: str) -> Optional[Dict[Any, str]]:
+    """RunScript-style args from a `NotifyAll` notification, or None if it isn't a command."""
+    if not method.startswith(_METHOD_PREFIX):
+        return None
+
+    from lib.script.script import parse_arg_list
+    args = parse_arg_list(method[len(_METHOD_PREFIX):].split(','))
+
+    if data and data != 'null':
+        try:
+            extra = json.loads(data)
+        except ValueError:
+            extra = None
+        if isinstance(extra, dict):
+            args.update({str(k): str(v) for k, v in extra.items()})
+
+    return args if args.get('action') else None
+
+
+def _target_key(action: str, args: Dict[Any, str]) -> Tuple[str, ...]:
+    """Commands with equal keys write the same properties; only the newest needs to run."""
+    window = args.get('window') or args.get('window_id') or 'home'
+    names = tuple(args.get(name, '') for name in _TARGET_ARGS.get(action, ()))
+    return (action, args.get('prefix', ''), window) + names
+
+
+class SkinCommandServer(WorkerQueue):
+    """Runs skin commands in-process, coalescing queued commands per target."""
+
+    def __init__(self):
+        super().__init__(num_workers=1, result_retention='none')
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[Hashable, ...], Tuple[Dict[Any, str], float]] = {}
+        self._sequence = itertools.count()
+        self.coalesced = 0
+
+    def _on_start(self) -> None:
+        set_prop(READY_PROPERTY, "true")
+
+    def stop(self, wait: bool = True) -> None:
+        clear_prop(READY_PROPERTY)
+        super().stop(wait)
+
+    def submit(self, args: Dict[Any, str]) -> bool:
+        """Queue one command. Returns False if its action can't run in the service."""
+        from lib.script.script import RESIDENT_ACTIONS
+
+        action = args.get('action', '')
+        if action not in RESIDENT_ACTIONS:
+            log("Service", f"Skin command '{action}' is RunScript-only, ignored",
+                xbmc.LOGWARNING)
+            return False
+
+        if action in _NEVER_COALESCED:
+            key: Tuple[Hashable, ...] = (action, next(self._sequence))
+        else:
+            key = _target_key(action, args)
+        with self._lock:
+            queued = key in self._pending
+            self._pending[key] = (args, time.monotonic())
+            if queued:
+                self.coalesced += 1
+                return True
+        # Coalescing is done through `_pending`, so every queue entry gets a unique dedupe key
+        return self.add_item(key, dedupe_key=next(self._sequence))
+
+    def _process_item(self, key: Tuple[Hashable, ...], worker_id: int) -> Optional[Dict]:
+        from lib.script.script import run_resident_action
+
+        with self._lock:
+            args, received = self._pending.pop(key)
+        run_resident_action(key[0], args)
+        log("Service", f"Skin command {key[0]} done in "
+            f"{(time.monotonic() - received) * 1000:.1f}ms", xbmc.LOGDEBUG)
+        return {'success': True}
@@ -1,15 +1,54 @@
-"""Blur orchestration: focus blur and audio player blur, both async-threaded."""
+"""Blur orchestration: focus blur and audio player blur, both async-threaded.
+
+Focus blur also pre-blurs the neighbors of the focused item on a small worker pool, so
+scrolling onto them finds the blurred copy already cached. Each blur publishes the source's
+color palette alongside the blurred image.
+"""
 from __future__ import annotations
 
 import threading
-from typing import List, Optional
+import time
+from queue import Empty
+from typing import Dict, List, Optional, Tuple
 
 import xbmc
 import xbmcgui
 
+from lib.infrastructure.workers import WorkerQueue
 from lib.kodi.client import log
 from lib.kodi.utilities import set_prop, clear_prop
 
+# Container offsets pre-blurred after each focus change, nearest first.
+PREFETCH_OFFSETS = (1, -1, 2, -2)
+PREFETCH_WORKER_COUNT = 2
+
+# Library palette precompute: at most once per interval, only after the box has been idle.
+PALETTE_PRECOMPUTE_INTERVAL_S = 86400
+PALETTE_PRECOMPUTE_IDLE_S = 120
+
+
+class BlurPrefetchQueue(WorkerQueue):
+    """Renders `(source, radius)` items into the blur cache ahead of focus."""
+
+    def __init__(self):
+        super().__init__(num_workers=PREFETCH_WORKER_COUNT, result_retention='none')
+
+    def drop_pending(self) -> None:
+        """Forget queued neighbors of an earlier focus; renders already running finish."""
+        while True:
+            try:
+                _item, dedupe_key, _queued_at = self.queue.get_nowait()
+            except Empty:
+                return
+            with self.processing_lock:
+                self.processing_set.discard(dedupe_key)
+            self.queue.task_done()
+
+    def _process_item(self, item: Tuple[str, int], worker_id: int) -> Optional[Dict]:
+        from lib.service import blur
+        source, radius = item
+        return {'success': blur.blur_image(source, radius) is not None}
+
 
 class BlurHandler:
     """Owns focus + player blur state and threads. Sets `SkinInfo.[prefix.]BlurredImage` props."""
@@ -19,6 +58,48 @@ class BlurHandler:
         self._focus_last_source: Optional[str] = None
         self._player_thread: Optional[threading.Thread] = None
         self._player_last_source: Optional[str] = None
+        self._prefetch: Optional[BlurPrefetchQueue] = None
+        self._palette_thread: Optional[threading.Thread] = None
+        self._last_palette_precompute = 0.0
+        self._stopping = False
+
+    def cleanup(self) -> None:
+        """Stop the prefetch pool, dropping anything still queued."""
+        self._stopping = True
+        if self._prefetch is not None:
+            self._prefetch.stop(wait=False)
+            self._prefetch = None
+
+    def precompute_palettes_if_idle(self) -> None:
+        """Idle-gated batch fill of the palette cache for library fanart.
+
+        Runs at most once per interval while focus blur is enabled, never during video playback.
+        """
+        if not xbmc.getCondVisibility("Skin.HasSetting(SkinInfo.Blur)"):
+            return
+        if (time.time() - self._last_palette_precompute) < PALETTE_PRECOMPUTE_INTERVAL_S:
+            return
+        if xbmc.Player().isPlayingVideo():
+            return
+        if xbmc.getGlobalIdleTime() < PALETTE_PRECOMPUTE_IDLE_S:
+            return
+        if self._palette_thread and self._palette_thread.is_alive():
+            return
+        self._last_palette_precompute = time.time()
+        self._palette_thread = threading.Thread(target=self._run_palette_precompute, daemon=True)
+        self._palette_thread.start()
+
+    def _run_palette_precompute(self) -> None:
+        def should_stop() -> bool:
+            return (self._stopping or xbmc.Monitor().abortRequested()
+                    or xbmc.getGlobalIdleTime() < PALETTE_PRECOMPUTE_IDLE_S
+                    or xbmc.Player().isPlayingVideo())
+
+        try:
+            from lib.service.palette import precompute_library_palettes
+            precompute_library_palettes(should_stop)
+        except Exception as e:
+            log("Blur", f"Palette precompute error: {e}", xbmc.LOGERROR)
 
     def handle_focus(self) -> None:
         """Run a blur pass for the focused item's background."""
@@ -64,6 +145,7 @@ class BlurHandler:
                 self._set_last(slot, None)
             return
 
+        neighbor_labels: List[str] = []
         blur_source_var = xbmcgui.Window(10000).getProperty(source_property + "Var")
         if blur_source_var:
             source_path = self._resolve_with_fallbacks(blur_source_var.split("|"), is_var=True)
@@ -84,6 +166,8 @@ class BlurHandler:
             source_path = self._resolve_with_fallbacks(
                 blur_source_infolabel.split("|"), is_var=False
             )
+            if slot == "focus":
+                neighbor_labels = blur_source_infolabel.split("|")
 
         if not source_path:
             if self._get_last(slot) is not None:
@@ -108,23 +192,68 @@ class BlurHandler:
         self._set_thread(slot, new_thread)
         new_thread.start()
 
+        if neighbor_labels:
+            self._prefetch_neighbors(neighbor_labels, source_path)
+
+    def _prefetch_neighbors(self, infolabels: List[str], focused_source: str) -> None:
+        """Queue pre-blurs for the items around focus.
+
+        Only `ListItem.*`/`Container.ListItem.*` sources can be offset; VAR sources resolve
+        against the focused item alone and are skipped.
+        """
+        # Fast scrolling queues far more neighbors than can be rendered; only the latest
+        # focus's are worth rendering.
+        if self._prefetch is not None:
+            self._prefetch.drop_pending()
+        radius = self._get_blur_radius()
+        queued = {focused_source}
+        for offset in PREFETCH_OFFSETS:
+            labels = [
+                self._offset_infolabel(label.strip(), offset)
+                for label in infolabels if label.strip()
+            ]
+            if not labels or not all(labels):
+                return
+            source = self._resolve_with_fallbacks(labels, is_var=False)
+            if not source or source in queued:
+                continue
+            queued.add(source)
+            if self._prefetch is None:
+                self._prefetch = BlurPrefetchQueue()
+                self._prefetch.start()
+            self._prefetch.add_item((source, radius), dedupe_key=(source, radius))
+
+    @staticmethod
+    def _offset_infolabel(infolabel: str, offset: int) -> str:
+        """Rewrite a focused-item infolabel to `Container.ListItemNoWrap(offset).*`, or ''."""
+        for prefix in ("Container.ListItem.", "ListItem."):
+            if infolabel.startswith(prefix):
+                return f"Container.ListItemNoWrap({offset}).{infolabel[len(prefix):]}"
+        return ""
+
+    @staticmethod
+    def _get_blur_radius() -> int:
+        blur_radius_str = xbmc.getInfoLabel("Skin.String(SkinInfo.BlurRadius)") or "40"
+        try:
+            blur_radius = int(blur_radius_str)
+        except (ValueError, TypeError):
+            return 40
+        return blur_radius if blur_radius >= 1 else 40
+
     def _worker(self, source: str, prop_base: str, slot: str) -> None:
         try:
             from lib.service import blur
 
-            blur_radius_str = xbmc.getInfoLabel("Skin.String(SkinInfo.BlurRadius)") or "40"
-            try:
-                blur_radius = int(blur_radius_str)
-                if blur_radius < 1:
-                    blur_radius = 40
-            except (ValueError, TypeError):
-                blur_radius = 40
-
-            blurred_path = blur.blur_image(source, blur_radius)
+            blurred_path = blur.blur_image(source, self._get_blur_radius())
 
             if blurred_path:
+                from lib.service.palette import get_palette
                 set_prop(f"{prop_base}BlurredImage", blurred_path)
                 set_prop(f"{prop_base}BlurredImage.Original", source)
+                colors = get_palette(source) or {}
+                set_prop(f"{prop_base}Palette.Dominant", colors.get('dominant'))
+                set_prop(f"{prop_base}Palette.Average", colors.get('average'))
+                set_prop(f"{prop_base}Palette.Contrast", colors.get('contrast'))
             else:
                 self._clear_props(prop_base)
 
@@ -150,6 +279,9 @@ class BlurHandler:
     def _clear_props(prop_base: str) -> None:
         clear_prop(f"{prop_base}BlurredImage")
         clear_prop(f"{prop_base}BlurredImage.Original")
+        clear_prop(f"{prop_base}Palette.Dominant")
+        clear_prop(f"{prop_base}Palette.Average")
+        clear_prop(f"{prop_base}Palette.Contrast")
 
     def _get_last(self, slot: str) -> Optional[str]:
         return self._focus_last_source if slot == "focus" else self._player_last_source
@@ -7,9 +7,11 @@ runs the main loop.
 from __future__ import annotations
 
 import threading
+from typing import Dict, Optional, Tuple
 
 import xbmc
 
+from lib.infrastructure.workers import WorkerQueue
 from lib.kodi.client import log
 from lib.service.library.refresh import RefreshTracker
 from lib.service.library.blur import BlurHandler
@@ -21,6 +23,33 @@ from lib.service.library.focus import FocusDispatcher
 SERVICE_POLL_INTERVAL = 0.10
 MAX_CONSECUTIVE_ERRORS = 10
 
+# Library changes that can move items between letters or shift their positions.
+_LETTER_INDEX_METHODS = frozenset({
+    'VideoLibrary.OnUpdate', 'VideoLibrary.OnRemove', 'VideoLibrary.OnScanFinished',
+    'VideoLibrary.OnCleanFinished', 'AudioLibrary.OnUpdate', 'AudioLibrary.OnRemove',
+    'AudioLibrary.OnScanFinished', 'AudioLibrary.OnCleanFinished',
+})
+
+
+class PersonRefreshQueue(WorkerQueue):
+    """Re-indexes the cast of updated titles on one thread, at most once per queued title.
+
+    Bulk jobs (ratings sync, artwork apply, NFO edits) send an `OnUpdate` per item, so these
+    arrive in bursts of thousands.
+    """
+
+    def __init__(self):
+        super().__init__(num_workers=1, result_retention='none')
+
+    def _process_item(self, item: Tuple[str, int], worker_id: int) -> Optional[Dict]:
+        # Queued before a scan started; its rebuild covers this title
+        if xbmc.getCondVisibility('Library.IsScanningVideo'):
+            return {'success': True}
+        from lib.data.database.person_index import refresh_person_item
+        media_type, dbid = item
+        refresh_person_item(media_type, dbid)
+        return {'success': True}
+
 
 class LibraryMonitor(xbmc.Monitor):
     """Routes Kodi library/audio notifications to the appropriate handler on `service_main`."""
@@ -33,6 +62,9 @@ class LibraryMonitor(xbmc.Monitor):
         """Route Kodi library/audio notifications to the matching handler."""
         if method in ('VideoLibrary.OnUpdate', 'VideoLibrary.OnScanFinished'):
             self.service_main.refresh.increment()
+        if method in _LETTER_INDEX_METHODS:
+            from lib.skin.container import clear_letter_index
+            clear_letter_index()
         if method == 'VideoLibrary.OnUpdate':
             self.service_main.focus.invalidate_asset_view()
             self._on_video_update(data)
@@ -51,12 +83,23 @@ class LibraryMonitor(xbmc.Monitor):
         if method in ('VideoLibrary.OnScanFinished', 'VideoLibrary.OnCleanFinished'):
             from lib.data.database.runtime import clear_all_runtime_cache
             clear_all_runtime_cache()
+        if method == 'VideoLibrary.OnScanFinished':
+            threading.Thread(target=self._rebuild_person_index, args=(self.abortRequested,),
+                             daemon=True).start()
 
     @staticmethod
     def _sync_dbids() -> None:
         from lib.data.database.rollcall import sync_dbids
         sync_dbids()
 
+    @staticmethod
+    def _rebuild_person_index(abort_check) -> None:
+        from lib.data.database.person_index import rebuild_person_index
+        try:
+            rebuild_person_index(abort_check)
+        except Exception as e:
+            log("Service", f"Person index rebuild failed: {e}", xbmc.LOGWARNING)
+
     @staticmethod
     def _on_video_remove(data: str) -> None:
         try:
@@ -94,6 +137,10 @@ class LibraryMonitor(xbmc.Monitor):
             if media_type == 'tvshow':
                 from lib.data.database.runtime import invalidate_show_runtime
                 invalidate_show_runtime(int(dbid))
+            # a scan re-indexes everything once it finishes; skip the per-title refetch
+            if media_type != 'episode' and not xbmc.getCondVisibility('Library.IsScanningVideo'):
+                item = (media_type, int(dbid))
+                self.service_main.person_refresh.add_item(item, dedupe_key=item)
 
 
 class ServiceMain(threading.Thread):
@@ -109,14 +156,18 @@ class ServiceMain(threading.Thread):
         self.musicvideo = MusicVideoArt()
         self.slideshow = SlideshowDriver()
         self.focus = FocusDispatcher(self)
+        self.person_refresh = PersonRefreshQueue()
 
     def run(self) -> None:
         """Service thread entry. Polls every 100ms; halts after too many consecutive errors."""
+        self.person_refresh.start()
         monitor = LibraryMonitor(self)
         log("Service", "Library service started", xbmc.LOGINFO)
 
         self.slideshow.populate_pool_if_needed()
         self.slideshow.update()
+        threading.Thread(target=self._ensure_person_index, args=(monitor.abortRequested,),
+                         daemon=True).start()
 
         consecutive_errors = 0
 
@@ -128,6 +179,7 @@ class ServiceMain(threading.Thread):
                     self._loop()
                     self.slideshow.update()
                     self.slideshow.reconcile_if_idle()
+                    self.blur.precompute_palettes_if_idle()
                     self.refresh.tick()
                     consecutive_errors = 0
                 except (KeyError, ValueError, TypeError) as e:
@@ -147,9 +199,19 @@ class ServiceMain(threading.Thread):
                     )
                     break
         finally:
+            self.person_refresh.stop(wait=False)
             self.slideshow.cleanup()
+            self.blur.cleanup()
             log("Service", "Library service stopped", xbmc.LOGINFO)
 
+    @staticmethod
+    def _ensure_person_index(abort_check) -> None:
+        from lib.data.database.person_index import ensure_person_index
+        try:
+            ensure_person_index(abort_check)
+        except Exception as e:
+            log("Service", f"Person index build failed: {e}", xbmc.LOGWARNING)
+
     def _loop(self) -> None:
         """One service tick: player blur, video/audio player tracking, focus dispatch."""
         self.blur.handle_player()
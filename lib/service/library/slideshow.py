@@ -25,9 +25,10 @@ class SlideshowDriver:
         self._stopping = False
         self._last_reconcile = 0.0
         self._reconcile_thread: Optional[threading.Thread] = None
-        from lib.service.slideshow import PlaylistRotator, LibrarySlideshow
-        self._library = LibrarySlideshow()
-        self._playlists = PlaylistRotator()
+        from lib.service.slideshow import ImageWarmer, PlaylistRotator, LibrarySlideshow
+        self._warmer = ImageWarmer()
+        self._library = LibrarySlideshow(self._warmer)
+        self._playlists = PlaylistRotator(self._warmer)
 
     def invalidate_playlists(self) -> None:
         """Force playlist-background slots to re-fetch on the next tick (library changed)."""
@@ -125,6 +126,7 @@ class SlideshowDriver:
             for thread in (self._update_thread, self._reconcile_thread):
                 if thread and thread.is_alive():
                     thread.join(timeout=5)
+            self._warmer.stop(wait=False)
             self._library.clear()
             self._playlists.clear()
         except Exception as e:
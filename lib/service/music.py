@@ -7,7 +7,7 @@ and artwork URLs from AudioDB and Fanart.tv, with persistent caching in music_me
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import xbmc
 
@@ -29,6 +29,9 @@ from lib.kodi.formatters import format_number
 from lib.kodi.settings import KodiSettings
 from lib.kodi.utilities import MULTI_VALUE_SEP
 
+if TYPE_CHECKING:
+    from lib.data.database.cache import ArtworkLookup
+
 
 def resolve_artist_mbids(artist_name: str, *, mbids: Optional[List[str]] = None,
                          album: Optional[str] = None, track: Optional[str] = None,
@@ -86,53 +89,58 @@ def resolve_artist_mbids(artist_name: str, *, mbids: Optional[List[str]] = None,
     return [], None
 
 
-def read_cached_fanart(mbids: List[str]) -> List[str]:
+_ARTIST_ART_SOURCES = ('fanarttv', 'theaudiodb')
+_ARTIST_ART_TYPES = ('fanart', 'thumb', 'clearlogo', 'banner')
+
+
+def read_artist_artwork(mbids: List[str]) -> ArtworkLookup:
+    """One bulk read of every cached artist artwork combination for `mbids`."""
+    from lib.data.database.cache import get_cached_artwork_bulk
+    return get_cached_artwork_bulk('artist', mbids, _ARTIST_ART_SOURCES, _ARTIST_ART_TYPES)
+
+
+def read_cached_fanart(mbids: List[str], artwork: Optional[ArtworkLookup] = None) -> List[str]:
     """Read cached fanart URLs for artist MBIDs.
 
-    Prefers Fanart.tv over AudioDB. Returns deduplicated URL list.
+    Prefers Fanart.tv over AudioDB. Returns deduplicated URL list. `artwork` is a
+    `read_artist_artwork` result to reuse; read fresh when omitted.
     """
-    from lib.data.database import cache as db_cache
+    if artwork is None:
+        artwork = read_artist_artwork(mbids)
 
     seen: set = set()
     urls: List[str] = []
 
-    for mbid in mbids:
-        cached = db_cache.get_cached_artwork('artist', mbid, 'fanarttv', 'fanart')
-        if cached:
-            for art in cached:
-                url = art.get('url', '')
-                if url and url not in seen:
-                    seen.add(url)
-                    urls.append(url)
-
-    if urls:
-        return urls
-
-    for mbid in mbids:
-        cached = db_cache.get_cached_artwork('artist', mbid, 'theaudiodb', 'fanart')
-        if cached:
-            for art in cached:
-                url = art.get('url', '')
-                if url and url not in seen:
-                    seen.add(url)
-                    urls.append(url)
+    for source in _ARTIST_ART_SOURCES:
+        for mbid in mbids:
+            cached = artwork.get(mbid, source, 'fanart')
+            if cached:
+                for art in cached:
+                    url = art.get('url', '')
+                    if url and url not in seen:
+                        seen.add(url)
+                        urls.append(url)
+        if urls:
+            return urls
 
     return urls
 
 
-def read_cached_artist_art(mbids: List[str]) -> Dict[str, str]:
+def read_cached_artist_art(mbids: List[str],
+                           artwork: Optional[ArtworkLookup] = None) -> Dict[str, str]:
     """Read cached thumb/clearlogo/banner URLs for artist MBIDs.
 
-    Prefers Fanart.tv over AudioDB for each type.
+    Prefers Fanart.tv over AudioDB for each type. `artwork` as for `read_cached_fanart`.
     """
-    from lib.data.database import cache as db_cache
+    if artwork is None:
+        artwork = read_artist_artwork(mbids)
 
     result: Dict[str, str] = {}
 
     for art_type in ('thumb', 'clearlogo', 'banner'):
         for mbid in mbids:
-            for source in ('fanarttv', 'theaudiodb'):
-                cached = db_cache.get_cached_artwork('artist', mbid, source, art_type)
+            for source in _ARTIST_ART_SOURCES:
+                cached = artwork.get(mbid, source, art_type)
                 if cached:
                     url = cached[0].get('url', '')
                     if url:
@@ -312,7 +320,8 @@ def fetch_artist_online_data(
         if existing:
             cache_artist(SOURCE_AUDIODB, existing, mbid=primary_mbid, name=primary_name)
 
-    fanart_urls = read_cached_fanart(resolved_mbids)
+    artwork = read_artist_artwork(resolved_mbids)
+    fanart_urls = read_cached_fanart(resolved_mbids, artwork)
 
     if not fanart_urls:
         artist_data = fetch_and_cache_artist_artwork(
@@ -320,7 +329,8 @@ def fetch_artist_online_data(
         )
         if abort_flag and abort_flag.is_requested():
             return None
-        fanart_urls = read_cached_fanart(resolved_mbids)
+        artwork = read_artist_artwork(resolved_mbids)
+        fanart_urls = read_cached_fanart(resolved_mbids, artwork)
 
     # Try cached bio first, fetch if missing
     bio = get_best_artist_bio(mbid=primary_mbid, name=primary_name)
@@ -329,7 +339,7 @@ def fetch_artist_online_data(
             primary_mbid, primary_name, abort_flag=abort_flag
         )
 
-    artist_art = read_cached_artist_art(resolved_mbids)
+    artist_art = read_cached_artist_art(resolved_mbids, artwork)
 
     return MusicOnlineResult(bio=bio, fanart_urls=fanart_urls, artist_art=artist_art)
 
@@ -1,4 +1,4 @@
-"""Online data service: coordinator thread composing focus/player/music/updater handlers."""
+"""Online data service: coordinator thread composing focus/player/music/updater/warm-up handlers."""
 from __future__ import annotations
 
 import threading
@@ -12,6 +12,7 @@ from lib.service.online.player import PlayerHandler
 from lib.service.online.musicplayer import MusicPlayerHandler
 from lib.service.online.musicvideo import MusicVideoFocusHandler
 from lib.service.online.updater import UpdaterHandler
+from lib.service.online.warmup import MusicWarmupHandler
 
 
 ONLINE_POLL_INTERVAL = 0.10
@@ -83,6 +84,7 @@ class OnlineServiceMain(threading.Thread):
         self.music = MusicPlayerHandler(self)
         self.musicvideo = MusicVideoFocusHandler(self)
         self.updater = UpdaterHandler(self)
+        self.warmup = MusicWarmupHandler(self)
 
     def new_cancel_token(self) -> CancelToken:
         """A fresh per-item cancel token tied to the capped abort flag."""
@@ -118,3 +120,4 @@ class OnlineServiceMain(threading.Thread):
         self.music.process_video()
         self.music.rotate_fanart()
         self.musicvideo.process()
+        self.warmup.process()
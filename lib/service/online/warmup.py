@@ -0,0 +1,262 @@
+"""Idle-time warm-up of artist and album online data for the music library.
+
+Walks the library's albums in pages, ranks artists and albums by play count and recency,
+and fetches only entries whose cache rows are missing or expired, so the first play of an
+artist doesn't wait on AudioDB, Last.fm, Fanart.tv and Wikipedia. Progress lives in the
+caches themselves: a run that stops early (activity, playback, budget) resumes where it
+left off on the next run, including after a restart.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import xbmc
+
+from lib.kodi.client import log
+from lib.kodi.utilities import MULTI_VALUE_SEP
+
+if TYPE_CHECKING:
+    from lib.service.online.main import OnlineServiceMain, ServiceAbortFlag
+
+
+WARMUP_IDLE_S = 300
+WARMUP_START_DELAY_S = 300
+WARMUP_INTERVAL_S = 86400  # after a run reached the end of the library
+WARMUP_RETRY_S = 1800      # after a run stopped early
+
+# Upper bounds on provider calls per title, charged before it's fetched. A run stops once any
+# provider's allowance is spent, leaving the providers' rate limits to foreground lookups.
+ARTIST_COST = {'fanarttv': 1, 'theaudiodb': 1, 'lastfm': 1}
+ALBUM_COST = {'lastfm': 1, 'wikipedia': 2, 'theaudiodb': 1}
+RUN_BUDGET = {'fanarttv': 150, 'theaudiodb': 120, 'lastfm': 120, 'wikipedia': 150}
+
+# AudioDB allows 30 requests a minute; one title every 4s stays well under it.
+ITEM_INTERVAL_S = 4.0
+
+# A play 30 days ago counts half as much toward the rank as one today.
+_RECENCY_WEIGHT = 10.0
+_RECENCY_HALF_LIFE_DAYS = 30.0
+
+_ALBUM_PROPERTIES = ['title', 'artist', 'displayartist', 'musicbrainzalbumartistid',
+                     'playcount', 'lastplayed']
+
+_ABORT_POLL_INTERVAL = 1.0
+
+
+def _recency_score(lastplayed: str, now: datetime) -> float:
+    if not lastplayed:
+        return 0.0
+    try:
+        played = datetime.strptime(lastplayed, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return 0.0
+    age_days = max(0.0, (now - played).total_seconds() / 86400)
+    return _RECENCY_WEIGHT * 0.5 ** (age_days / _RECENCY_HALF_LIFE_DAYS)
+
+
+def rank_library_music(albums: List[dict]) -> List[Tuple[float, str, Tuple[str, str]]]:
+    """Warm-up work, highest score first: `(score, 'artist', (mbid, name))` and
+    `(score, 'album', (artist, title))`.
+
+    An album scores its play count plus a recency bonus; an artist sums its albums. Artists
+    without a MusicBrainz ID are left to the on-play name search.
+    """
+    now = datetime.now()
+    artists: Dict[str, float] = {}
+    artist_names: Dict[str, str] = {}
+    album_scores: Dict[Tuple[str, str], float] = {}
+
+    for album in albums:
+        score = (album.get('playcount') or 0) + _recency_score(album.get('lastplayed') or '', now)
+        names = album.get('artist') or []
+        mbids = album.get('musicbrainzalbumartistid') or []
+        if isinstance(names, list) and isinstance(mbids, list) and len(names) == len(mbids):
+            for mbid, name in zip(mbids, names):
+                if mbid and name:
+                    artists[mbid] = artists.get(mbid, 0.0) + score
+                    artist_names.setdefault(mbid, name)
+
+        display = album.get('displayartist') or MULTI_VALUE_SEP.join(names)
+        title = album.get('title') or ''
+        if display and title:
+            key = (display, title)
+            album_scores[key] = max(album_scores.get(key, 0.0), score)
+
+    work = [(score, 'artist', (mbid, artist_names[mbid])) for mbid, score in artists.items()]
+    work.extend((score, 'album', key) for key, score in album_scores.items())
+    work.sort(key=lambda entry: entry[0], reverse=True)
+    return work
+
+
+def _warm_entries(work: List[Tuple[float, str, Tuple[str, str]]]) -> set:
+    """The `(kind, key)` entries in `work` whose caches are all present and unexpired."""
+    from lib.data.database.cache import get_cached_artwork_for_ids
+    from lib.data.database import music as db_music
+    from lib.kodi.settings import KodiSettings
+
+    lang = KodiSettings.online_metadata_language()
+    artists = [key for _, kind, key in work if kind == 'artist']
+    albums = [key for _, kind, key in work if kind == 'album']
+
+    marked = get_cached_artwork_for_ids('artist', [mbid for mbid, _ in artists],
+                                        ['_full_fetch_complete'])
+    audiodb = db_music.get_fresh_artist_keys(db_music.SOURCE_AUDIODB,
+                                             [mbid for mbid, _ in artists])
+    lastfm = db_music.get_fresh_artist_keys(
+        db_music.SOURCE_LASTFM,
+        [db_music.artist_lookup_key(name=name, lang=lang) for _, name in artists])
+
+    warm = {('artist', (mbid, name)) for mbid, name in artists
+            if ('system', mbid) in marked and mbid in audiodb
+            and db_music.artist_lookup_key(name=name, lang=lang) in lastfm}
+
+    lang_keys = {key: db_music.album_lookup_key(artist=key[0], album=key[1], lang=lang)
+                 for key in albums}
+    plain_keys = {key: db_music.album_lookup_key(artist=key[0], album=key[1]) for key in albums}
+    album_lastfm = db_music.get_fresh_album_keys(db_music.SOURCE_LASTFM, lang_keys.values())
+    album_wiki = db_music.get_fresh_album_keys(db_music.SOURCE_WIKIPEDIA, lang_keys.values())
+    album_audiodb = db_music.get_fresh_album_keys(db_music.SOURCE_AUDIODB, plain_keys.values())
+
+    warm.update(('album', key) for key in albums
+                if lang_keys[key] in album_lastfm and lang_keys[key] in album_wiki
+                and plain_keys[key] in album_audiodb)
+    return warm
+
+
+def _coverage(work: List[Tuple[float, str, Tuple[str, str]]], warm: set) -> Dict[str, int]:
+    coverage = {'artists_total': 0, 'artists_warm': 0, 'albums_total': 0, 'albums_warm': 0}
+    for _, kind, key in work:
+        coverage[f'{kind}s_total'] += 1
+        if (kind, key) in warm:
+            coverage[f'{kind}s_warm'] += 1
+    return coverage
+
+
+def warm_music_library(abort_flag) -> Optional[bool]:
+    """Fetch missing/expired artist and album data, best-ranked first.
+
+    Returns True when every title was visited, False when the run stopped early, None when
+    the library couldn't be read. Records coverage in the music cache database.
+    """
+    from lib.data.database import music as db_music
+    from lib.kodi.client import get_library_items, LibraryScanAborted
+    from lib.service.music import (
+        fetch_album_online_data, fetch_artist_online_data, get_similar_artist_names,
+    )
+
+    try:
+        albums = get_library_items(['album'], _ALBUM_PROPERTIES,
+                                   abort_check=abort_flag.is_requested)
+    except LibraryScanAborted:
+        return None
+
+    work = rank_library_music(albums)
+    warm = _warm_entries(work)
+    budget = dict(RUN_BUDGET)
+    monitor = xbmc.Monitor()
+    fetched = 0
+    completed = True
+
+    for _, kind, key in work:
+        if (kind, key) in warm:
+            continue
+        cost = ARTIST_COST if kind == 'artist' else ALBUM_COST
+        if abort_flag.is_requested() or any(budget[p] < n for p, n in cost.items()):
+            completed = False
+            break
+        for provider, calls in cost.items():
+            budget[provider] -= calls
+
+        try:
+            if kind == 'artist':
+                mbid, name = key
+                fetch_artist_online_data(name, mbids=[mbid], abort_flag=abort_flag)
+                get_similar_artist_names(name)
+            else:
+                fetch_album_online_data(key[0], key[1], abort_flag=abort_flag)
+        except Exception as e:
+            log("Service", f"Music warm-up fetch error for {key}: {e}", xbmc.LOGDEBUG)
+        fetched += 1
+
+        if monitor.waitForAbort(ITEM_INTERVAL_S):
+            completed = False
+            break
+
+    coverage = _coverage(work, _warm_entries(work) if fetched else warm)
+    db_music.save_warmup_state(coverage, completed)
+    log("Service",
+        f"Music warm-up: {fetched} fetched, artists {coverage['artists_warm']}/"
+        f"{coverage['artists_total']}, albums {coverage['albums_warm']}/"
+        f"{coverage['albums_total']} cached{'' if completed else ' (stopped early)'}",
+        xbmc.LOGINFO)
+    return completed
+
+
+class _IdleAbortFlag:
+    """Abort flag for warm-up fetches: service stop, user activity or playback."""
+
+    def __init__(self, service_flag: 'ServiceAbortFlag'):
+        self._service_flag = service_flag
+        self._last_poll = 0.0
+        self._cached = False
+
+    def is_requested(self) -> bool:
+        if self._service_flag.is_requested():
+            return True
+        # Polled from the API layer between reads; the idle/player checks don't need to be exact
+        now = time.monotonic()
+        if now - self._last_poll >= _ABORT_POLL_INTERVAL:
+            self._last_poll = now
+            self._cached = (xbmc.getGlobalIdleTime() < WARMUP_IDLE_S
+                            or xbmc.Player().isPlaying())
+        return self._cached
+
+
+class MusicWarmupHandler:
+    """Starts `warm_music_library` on a background thread while Kodi is idle."""
+
+    def __init__(self, service: 'OnlineServiceMain'):
+        self._service = service
+        self._thread: Optional[threading.Thread] = None
+        self._due: Optional[float] = None
+
+    def _initial_due(self, now: float) -> float:
+        """Honor the last completed run's interval across restarts."""
+        from lib.data.database.music import get_warmup_state
+
+        due = now + WARMUP_START_DELAY_S
+        try:
+            state = get_warmup_state()
+            if state and state.get('completed_at'):
+                completed = datetime.fromisoformat(state['completed_at']).timestamp()
+                due = max(due, completed + WARMUP_INTERVAL_S)
+        except Exception as e:
+            log("Service", f"Music warm-up state read failed: {e}", xbmc.LOGDEBUG)
+        return due
+
+    def process(self) -> None:
+        """Start a run if one is due, Kodi has been idle long enough and nothing is playing."""
+        now = time.time()
+        if self._due is None:
+            self._due = self._initial_due(now)
+        if now < self._due:
+            return
+        if xbmc.getGlobalIdleTime() < WARMUP_IDLE_S or xbmc.Player().isPlaying():
+            return
+        if self._thread and self._thread.is_alive():
+            return
+        self._due = now + WARMUP_RETRY_S
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            completed = warm_music_library(_IdleAbortFlag(self._service.abort_flag))
+        except Exception as e:
+            log("Service", f"Music warm-up error: {e}", xbmc.LOGWARNING)
+            return
+        if completed:
+            self._due = time.time() + WARMUP_INTERVAL_S
@@ -0,0 +1,171 @@
+"""Dominant, average and contrast color extraction for artwork.
+
+Palettes are extracted from the already-decoded, downscaled image in the blur pass and stored
+in the `artwork_palette` table keyed by the md5 of the source URL, so a repeat visit is one
+indexed lookup. `precompute_library_palettes` fills the table for library fanart at idle.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Callable, Dict, Optional, Tuple
+
+import xbmc
+
+from lib.kodi.client import log
+
+# Quantizing a 64x64 sample is enough to find the main color masses of a fanart.
+_SAMPLE_SIZE = 64
+_QUANTIZE_COLORS = 8
+
+# Near-black/near-white clusters (letterboxing, sky) are skipped when picking the dominant
+# color unless nothing else is left.
+_MIN_CHANNEL_SPREAD = 24
+_DARK_LUMA = 24
+_LIGHT_LUMA = 232
+
+# WCAG crossover where black and white text have equal contrast against a background.
+_CONTRAST_LUMINANCE = 0.179
+
+
+def url_hash(source_path: str) -> str:
+    """Stable palette key for a source URL/path."""
+    return hashlib.md5(source_path.encode("utf-8")).hexdigest()
+
+
+def _pack(rgb: Tuple[int, int, int]) -> int:
+    r, g, b = (max(0, min(255, int(round(c)))) for c in rgb)
+    return (r << 16) | (g << 8) | b
+
+
+def _luma(rgb: Tuple[int, int, int]) -> float:
+    r, g, b = rgb
+    return 0.299 * r + 0.587 * g + 0.114 * b
+
+
+def _relative_luminance(rgb: Tuple[int, int, int]) -> float:
+    def channel(c: int) -> float:
+        c = c / 255.0
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    r, g, b = rgb
+    return 0.2126 * channel(r) + 0.7152 * channel(g) + 0.0722 * channel(b)
+
+
+def _is_neutral_extreme(rgb: Tuple[int, int, int]) -> bool:
+    luma = _luma(rgb)
+    if luma < _DARK_LUMA or luma > _LIGHT_LUMA:
+        return True
+    return max(rgb) - min(rgb) < _MIN_CHANNEL_SPREAD and (luma < 64 or luma > 200)
+
+
+def extract_palette(img) -> Tuple[int, int, int]:
+    """Return `(dominant, average, contrast)` as 0xRRGGBB ints for a PIL image."""
+    from PIL import ImageStat
+    from lib.service.blur import _get_resize_filter
+
+    sample = img.convert("RGB") if img.mode != "RGB" else img
+    sample = sample.resize((_SAMPLE_SIZE, _SAMPLE_SIZE), _get_resize_filter('BILINEAR'))
+
+    mean = ImageStat.Stat(sample).mean
+    average = (int(mean[0]), int(mean[1]), int(mean[2]))
+
+    quantized = sample.quantize(colors=_QUANTIZE_COLORS)
+    flat = quantized.getpalette() or []
+    counts = sorted(quantized.getcolors() or [], reverse=True)
+    clusters = [tuple(flat[index * 3:index * 3 + 3]) for _, index in counts]
+    clusters = [c for c in clusters if len(c) == 3]
+
+    dominant = next((c for c in clusters if not _is_neutral_extreme(c)), None)
+    if dominant is None:
+        dominant = clusters[0] if clusters else average
+
+    contrast = (0, 0, 0) if _relative_luminance(dominant) > _CONTRAST_LUMINANCE else (255, 255, 255)
+
+    return _pack(dominant), _pack(average), _pack(contrast)
+
+
+def store_palette(source_path: str, img) -> None:
+    """Extract and persist the palette of an already-decoded image. Never raises."""
+    try:
+        from lib.data.database import palette as db_palette
+        dominant, average, contrast = extract_palette(img)
+        db_palette.save_palette(url_hash(source_path), dominant, average, contrast)
+    except Exception as e:
+        log("Blur", f"Palette extraction failed for {source_path}: {e}", xbmc.LOGDEBUG)
+
+
+def compute_palette(source_path: str) -> bool:
+    """Decode `source_path` at sample size and store its palette. True on success."""
+    from lib.service.blur import _check_pil, read_source_bytes
+
+    if not _check_pil():
+        return False
+
+    img_data = read_source_bytes(source_path)
+    if not img_data:
+        return False
+
+    try:
+        from PIL import Image
+        import io
+
+        with Image.open(io.BytesIO(img_data)) as img:
+            if img.format == 'JPEG':
+                img.draft('RGB', (_SAMPLE_SIZE, _SAMPLE_SIZE))
+            from lib.data.database import palette as db_palette
+            dominant, average, contrast = extract_palette(img)
+            db_palette.save_palette(url_hash(source_path), dominant, average, contrast)
+        return True
+    except Exception as e:
+        log("Blur", f"Palette extraction failed for {source_path}: {e}", xbmc.LOGDEBUG)
+        return False
+
+
+def get_palette(source_path: str) -> Optional[Dict[str, str]]:
+    """Return `{dominant, average, contrast}` as `AARRGGBB` strings, computing on a cache miss."""
+    if not source_path:
+        return None
+
+    from lib.data.database import palette as db_palette
+
+    key = url_hash(source_path)
+    cached = db_palette.get_palette(key)
+    if cached is not None:
+        return cached
+    if not compute_palette(source_path):
+        return None
+    return db_palette.get_palette(key)
+
+
+def precompute_library_palettes(abort_check: Callable[[], bool]) -> int:
+    """Fill the palette cache for every movie/TV show fanart not yet cached.
+
+    Returns the number of palettes computed. Stops early when `abort_check()` is True.
+    """
+    from lib.data.database import palette as db_palette
+    from lib.kodi.client import get_library_items, LibraryScanAborted
+
+    try:
+        items = get_library_items(['movie', 'tvshow'], ['art'], decode_urls=True,
+                                  abort_check=abort_check)
+    except LibraryScanAborted:
+        return 0
+
+    by_hash: Dict[str, str] = {}
+    for item in items:
+        fanart = (item.get('art') or {}).get('fanart')
+        if fanart:
+            by_hash.setdefault(url_hash(fanart), fanart)
+
+    cached = db_palette.get_cached_hashes(list(by_hash))
+    computed = 0
+    for key, source in by_hash.items():
+        if key in cached:
+            continue
+        if abort_check():
+            break
+        if compute_palette(source):
+            computed += 1
+
+    log("Blur", f"Palette precompute: {computed} computed, {len(cached)} already cached "
+        f"of {len(by_hash)} library fanarts")
+    return computed
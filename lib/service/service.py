@@ -21,10 +21,21 @@ class OrchestratorMonitor(xbmc.Monitor):
     def __init__(self) -> None:
         super().__init__()
         self.settings_dirty = True  # force initial evaluation
+        self.commands = None
+
+    def onNotification(self, sender: str, method: str, data: str) -> None:
+        from lib.service.commands import COMMAND_SENDER, parse_command
+        if sender != COMMAND_SENDER or self.commands is None:
+            return
+        args = parse_command(method, data)
+        if args:
+            self.commands.submit(args)
 
     def onSettingsChanged(self) -> None:
+        from lib.kodi.client import reset_trace_setting
         from lib.kodi.settings import KodiSettings
         KodiSettings.clear_cache()
+        reset_trace_setting()
         self.settings_dirty = True
 
 
@@ -51,6 +62,10 @@ class Orchestrator:
 
         self._start_housekeeping()
 
+        from lib.service.commands import SkinCommandServer
+        self.monitor.commands = SkinCommandServer()
+        self.monitor.commands.start()
+
         slideshow_monitor = SlideshowMonitor()
 
         version = ADDON.getAddonInfo("version")
@@ -63,20 +78,29 @@ class Orchestrator:
                 if self.monitor.waitForAbort(POLL_INTERVAL):
                     break
         finally:
+            self.monitor.commands.stop(wait=False)
+            self.monitor.commands = None
             self._stop_all()
             del slideshow_monitor
             log("Service", "Orchestrator stopped", xbmc.LOGINFO)
 
     def _start_housekeeping(self) -> None:
-        """Expired cache cleanup in a daemon thread after startup."""
+        """Incremental cache GC in a daemon thread after startup."""
         def _run() -> None:
             # Delay so services get DB access first; avoids competing for locks during startup
             if self.monitor.waitForAbort(30):
                 return
-            from lib.data.database.cache import clear_expired_cache
+            from lib.data.database.cache_gc import collect_garbage
             from lib.data.database.music import clear_expired_music_cache
-            clear_expired_cache()
-            clear_expired_music_cache()
+            try:
+                collect_garbage(budget_mb=ADDON.getSettingInt('cache_size_budget_mb'),
+                                abort_check=self.monitor.abortRequested)
+            except Exception as e:
+                log("Service", f"Cache GC failed: {e}", xbmc.LOGWARNING)
+            try:
+                clear_expired_music_cache()
+            except Exception as e:
+                log("Service", f"Music cache cleanup failed: {e}", xbmc.LOGWARNING)
 
         threading.Thread(target=_run, daemon=True).start()
 
@@ -6,15 +6,17 @@ from __future__ import annotations
 
 import random
 import threading
+from array import array
 import time
 import xbmc
 import xbmcvfs
-from collections import deque
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict, deque
+from typing import Optional, Dict, Any, Iterable, List
 
 from lib.data.database import slideshow as db_slideshow
 from lib.kodi.utilities import set_prop, clear_prop, get_prop
 from lib.kodi.client import log, request, get_item_details
+from lib.infrastructure.workers import VFS_WORKER_COUNT, WorkerQueue
 
 MIN_SLIDESHOW_INTERVAL = 5
 MAX_SLIDESHOW_INTERVAL = 3600
@@ -308,6 +310,17 @@ _PLAYLIST_REFETCH_MIN_S = 60
 
 LOOKAHEAD_DEPTH = 2
 
+# A lookahead image still not cached after this long is dropped and its URL marked failed.
+WARM_TIMEOUT_S = 10.0
+# Failed or timed-out URLs are not retried for this long.
+WARM_NEGATIVE_TTL_S = 600
+# Warm results remembered (LRU); a known-good URL skips the xbmcvfs read next time round.
+WARM_RESULT_LIMIT = 512
+# Per-slot warm-up latency is logged after this many completed warms.
+WARM_REPORT_EVERY = 25
+# On a fresh build, how long a refresh waits for each cursor's first image.
+WARM_FIRST_FRAME_S = 2.0
+
 
 def _detail_fanart(detail: Dict[str, Any]) -> str:
     return (detail.get('art', {}).get('fanart', '') or detail.get('fanart', '')).strip()
@@ -353,18 +366,119 @@ def _fetch_pool(path: str) -> list:
     return [f for f in files if f.get('type') in _PLAYLIST_TYPES and f.get('id')]
 
 
+class ImageWarmer(WorkerQueue):
+    """Force-caches lookahead fanart on a small pool so one slow share can't stall a tick.
+
+    `status(url)` is True once cached, False on failure or after `WARM_TIMEOUT_S` (a negative
+    entry, not retried for `WARM_NEGATIVE_TTL_S`), None while still pending. A timed-out read
+    can't be interrupted; it finishes in the background and its real result replaces the
+    negative entry. Warm-up latency is tracked per slot label and logged periodically.
+    """
+
+    def __init__(self):
+        super().__init__(num_workers=VFS_WORKER_COUNT, result_retention='none')
+        self._lock = threading.Lock()
+        self._known: OrderedDict = OrderedDict()  # url -> (ok, monotonic time)
+        self._pending: Dict[str, tuple] = {}  # url -> (label, submitted)
+        self._latency: Dict[str, Dict[str, float]] = {}
+        self._since_report = 0
+
+    def submit(self, url: str, label: str) -> None:
+        """Queue `url` for caching unless it is pending, cached, or recently failed."""
+        now = time.monotonic()
+        with self._lock:
+            if url in self._pending:
+                return
+            known = self._known.get(url)
+            if known and (known[0] or now - known[1] < WARM_NEGATIVE_TTL_S):
+                return
+            self._pending[url] = (label, now)
+
+        if not self.running:
+            self.start()
+        if not self.add_item(url):
+            with self._lock:
+                self._pending.pop(url, None)
+
+    def status(self, url: str) -> Optional[bool]:
+        """True if warm, False if failed or timed out, None while pending (or never submitted)."""
+        now = time.monotonic()
+        with self._lock:
+            known = self._known.get(url)
+            if known is not None:
+                self._known.move_to_end(url)
+                return known[0]
+            pending = self._pending.get(url)
+            if pending is None or now - pending[1] < WARM_TIMEOUT_S:
+                return None
+            del self._pending[url]
+            self._remember(url, False, now)
+            self._stats(pending[0])['timeouts'] += 1
+        log("Service", f"Slideshow: Warm-up timed out after {WARM_TIMEOUT_S:.0f}s for {url}",
+            xbmc.LOGDEBUG)
+        return False
+
+    def _process_item(self, url: str, worker_id: int) -> Optional[Dict]:
+        ok = _cache_image_url(url)
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending.pop(url, None)
+            self._remember(url, ok, now)
+            if pending is None:  # already reported as a timeout
+                return {'success': ok}
+            label, submitted = pending
+            stats = self._stats(label)
+            elapsed = now - submitted
+            stats['count'] += 1
+            stats['failed'] += not ok
+            stats['total_s'] += elapsed
+            stats['max_s'] = max(stats['max_s'], elapsed)
+            self._since_report += 1
+            report = self._take_report() if self._since_report >= WARM_REPORT_EVERY else None
+
+        if report:
+            log("Service", f"Slideshow: Warm-up latency by slot: {report}", xbmc.LOGDEBUG)
+        return {'success': ok}
+
+    def _remember(self, url: str, ok: bool, now: float) -> None:
+        self._known[url] = (ok, now)
+        self._known.move_to_end(url)
+        while len(self._known) > WARM_RESULT_LIMIT:
+            self._known.popitem(last=False)
+
+    def _stats(self, label: str) -> Dict[str, float]:
+        stats = self._latency.get(label)
+        if stats is None:
+            stats = self._latency[label] = {
+                'count': 0, 'failed': 0, 'timeouts': 0, 'total_s': 0.0, 'max_s': 0.0}
+        return stats
+
+    def _take_report(self) -> str:
+        """One-line per-label summary of the window since the last report; starts a new window."""
+        parts = []
+        for label, s in sorted(self._latency.items()):
+            avg = s['total_s'] / s['count'] * 1000 if s['count'] else 0.0
+            parts.append(f"{label} n={s['count']:.0f} avg={avg:.0f}ms "
+                         f"max={s['max_s'] * 1000:.0f}ms failed={s['failed']:.0f} "
+                         f"timeouts={s['timeouts']:.0f}")
+        self._latency = {}
+        self._since_report = 0
+        return "; ".join(parts)
+
+
 class _RotationCursor:
-    """Shuffled ref list with a fixed-depth lookahead of resolved entries.
+    """Shuffled ref sequence with a fixed-depth lookahead of resolved entries.
 
-    The owner resolves refs out-of-band (image caching blocks); `pop()` only returns an
-    already-cached entry.
+    The owner resolves refs and parks each entry while an `ImageWarmer` caches its fanart;
+    `settle()` promotes warmed entries, so `pop()` only returns an already-cached one.
     """
 
-    def __init__(self, refs: list, depth: int = LOOKAHEAD_DEPTH):
+    def __init__(self, refs, depth: int = LOOKAHEAD_DEPTH):
         self._refs = refs
         self._cursor = 0
         self._depth = depth
         self._ready: deque = deque()
+        self._warming: List[tuple] = []
 
     def __bool__(self) -> bool:
         return bool(self._refs)
@@ -372,18 +486,30 @@ class _RotationCursor:
     def wanted(self) -> list:
         """Refs to resolve to refill the lookahead to its depth, advancing the cursor."""
         out = []
-        need = self._depth - len(self._ready)
+        need = self._depth - len(self._ready) - len(self._warming)
         while need > 0 and self._refs:
             out.append(self._refs[self._cursor % len(self._refs)])
             self._cursor += 1
             need -= 1
         return out
 
-    def deliver(self, entries: list) -> None:
-        """Append resolved entries; None means unresolved/no-fanart and is skipped."""
-        for entry in entries:
-            if entry is not None:
+    def park(self, entry: Any, url: str) -> None:
+        """Hold a resolved entry until `url` is warm."""
+        self._warming.append((entry, url))
+
+    def settle(self, status) -> None:
+        """Promote parked entries whose image is warm; drop failed ones; keep pending ones."""
+        still = []
+        for entry, url in self._warming:
+            state = status(url)
+            if state is None:
+                still.append((entry, url))
+            elif state:
                 self._ready.append(entry)
+        self._warming = still
+
+    def is_warming(self) -> bool:
+        return bool(self._warming)
 
     def has_ready(self) -> bool:
         """True if a resolved entry is queued for display this tick."""
@@ -398,14 +524,33 @@ class _RotationCursor:
         return self._ready.popleft() if self._ready else None
 
 
+def _settle_cursors(cursors: Iterable[_RotationCursor], warmer: ImageWarmer,
+                    wait_s: float = 0.0) -> None:
+    """Promote warmed lookahead entries, waiting up to `wait_s` for a first image per cursor."""
+    cursors = list(cursors)
+    deadline = time.monotonic() + wait_s
+    monitor = None
+    while True:
+        for cursor in cursors:
+            cursor.settle(warmer.status)
+        if time.monotonic() >= deadline or all(
+                c.has_ready() or not c.is_warming() for c in cursors):
+            return
+        if monitor is None:
+            monitor = xbmc.Monitor()
+        if monitor.waitForAbort(0.05):
+            return
+
+
 class PlaylistRotator:
     """Rotates skin-registered playlist backgrounds by menu-item name.
 
-    Holds each slot's whole pool, re-fetched when it wraps; fanart is force-cached 2-ahead so a
-    fade lands on a cached image.
+    Holds each slot's whole pool, re-fetched when it wraps; fanart is warmed 2-ahead on the
+    shared `ImageWarmer` so a fade lands on a cached image.
     """
 
-    def __init__(self):
+    def __init__(self, warmer: Optional[ImageWarmer] = None):
+        self._warmer = warmer or ImageWarmer()
         self._slots: Dict[str, Dict[str, Any]] = {}
         self._known_names: set = set()
         self._invalidate = False
@@ -418,6 +563,10 @@ class PlaylistRotator:
         """Reconcile slots, publish current items, refill the lookahead. On the update thread."""
         if self._reconcile():
             self._refill()  # pre-fill (re)built slots so the first frame shows this tick
+            _settle_cursors((s['cursor'] for s in self._slots.values()), self._warmer,
+                            WARM_FIRST_FRAME_S)
+        else:
+            _settle_cursors((s['cursor'] for s in self._slots.values()), self._warmer)
         self._display()
         self._refill()
 
@@ -482,18 +631,21 @@ class PlaylistRotator:
                 self._publish_video(name, entry)
 
     def _refill(self) -> None:
-        """Force-cache each slot's next fanart and fill the lookaheads."""
-        for slot in self._slots.values():
+        """Queue each slot's next fanart for warming and park the entries in the lookaheads."""
+        for name, slot in self._slots.items():
             cursor = slot['cursor']
             for item in cursor.wanted():
-                cursor.deliver([self._resolve(item)])
+                entry = self._resolve(item)
+                if entry is not None:
+                    self._warmer.submit(entry['fanart'], f"Playlist.{name}")
+                    cursor.park(entry, entry['fanart'])
 
     @staticmethod
     def _resolve(item: Dict[str, Any]) -> Optional[dict]:
-        """Entry from a pool item; None if it has no fanart or caching fails."""
+        """Entry from a pool item; None if it has no fanart."""
         media_type = item.get('type', '')
         fanart = _item_fanart(item)
-        if not fanart or not _cache_image_url(fanart):
+        if not fanart:
             return None
         if media_type in _PLAYLIST_MUSIC_TYPES and not item.get('description'):
             item['description'] = _artist_description(item.get('artistid'))
@@ -568,11 +720,13 @@ class LibrarySlideshow:
     """Rotates the library-wide `SkinInfo.Slideshow.*` backgrounds from the DB pool.
 
     Independent shuffled cursor per type per category (so categories never sync); mixed
-    Video/Global pick a type weighted by `count ** alpha`. 2-ahead lookahead; cursors rebuild
-    on pool-generation change.
+    Video/Global pick a type weighted by `count ** alpha`. 2-ahead lookahead warmed on the
+    shared `ImageWarmer`; cursors rebuild on pool-generation change. Cursors hold only pool
+    dbids (8 bytes each); full rows are read from the DB for the lookahead alone.
     """
 
-    def __init__(self):
+    def __init__(self, warmer: Optional[ImageWarmer] = None):
+        self._warmer = warmer or ImageWarmer()
         self._generation = -1
         self._categories: Dict[str, Dict[str, _RotationCursor]] = {}
         self._weights: Dict[str, Dict[str, float]] = {}
@@ -584,8 +738,12 @@ class LibrarySlideshow:
             self._rebuild()
         if not self._categories:
             return
+        cursors = [c for by_type in self._categories.values() for c in by_type.values()]
         if rebuilt:
             self._refill()  # pre-fill new cursors so the first frame shows this tick
+            _settle_cursors(cursors, self._warmer, WARM_FIRST_FRAME_S)
+        else:
+            _settle_cursors(cursors, self._warmer)
         self._display()
         self._refill()
 
@@ -598,17 +756,14 @@ class LibrarySlideshow:
 
     def _rebuild(self) -> None:
         self._generation = db_slideshow.pool_generation()
-        pool: Dict[str, list] = {}
-        for row in db_slideshow.get_all_pool_rows():
-            pool.setdefault(row['media_type'], []).append(dict(row))
+        pool = db_slideshow.get_pool_dbids()
 
         previous = set(self._categories)
         self._categories = {}
         self._weights = {}
         for category, spec in _LIBRARY_CATEGORIES.items():
             types = spec[1]
-            cursors = {t: _RotationCursor(random.sample(pool[t], len(pool[t])))
-                       for t in types if pool.get(t)}
+            cursors = {t: _RotationCursor(self._shuffled(pool[t])) for t in types if pool.get(t)}
             if cursors:
                 self._categories[category] = cursors
                 self._weights[category] = {t: len(pool[t]) ** _WEIGHT_ALPHA for t in cursors}
@@ -616,6 +771,12 @@ class LibrarySlideshow:
         for category in previous - set(self._categories):
             _clear_category_properties(category)
 
+    @staticmethod
+    def _shuffled(dbids: array) -> array:
+        refs = array('q', dbids)
+        random.shuffle(refs)
+        return refs
+
     def _pick_type(self, category: str, cursors: Dict[str, _RotationCursor]) -> Optional[str]:
         ready = [t for t in cursors if cursors[t].has_ready()]
         if not ready:
@@ -635,10 +796,21 @@ class LibrarySlideshow:
                 _publish_library(category, entry)
 
     def _refill(self) -> None:
-        for cursors in self._categories.values():
-            for cursor in cursors.values():
-                for row in cursor.wanted():
-                    cursor.deliver([row if _cache_image_url(row.get('fanart', '')) else None])
+        """Resolve every cursor's wanted dbids with one pool read, then queue fanart warming."""
+        wanted = [(media_type, f"{category}.{media_type}", cursor, cursor.wanted())
+                  for category, cursors in self._categories.items()
+                  for media_type, cursor in cursors.items()]
+        keys = {(media_type, dbid) for media_type, _, _, refs in wanted for dbid in refs}
+        if not keys:
+            return
+        rows = db_slideshow.get_pool_rows(list(keys))
+        for media_type, label, cursor, refs in wanted:
+            for dbid in refs:
+                row = rows.get((media_type, dbid))
+                fanart = row.get('fanart', '') if row else ''
+                if fanart:
+                    self._warmer.submit(fanart, label)
+                    cursor.park(row, fanart)
 
 
 class SlideshowMonitor(xbmc.Monitor):
@@ -1,14 +1,18 @@
 """Stinger (post-credits scene) detection for movies.
 
 Detects and notifies about post-credits scenes during movie playback.
-Uses TMDB keywords as primary source, Trakt as fallback.
+Uses TMDB keywords as primary source, Trakt as fallback. Library movies are resolved ahead
+of time into the stinger index while Kodi is idle, so playback only reads the index.
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Dict, Any, Tuple
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 
 import xbmc
 import xbmcgui
@@ -59,6 +63,21 @@ class StingerInfo:
 TMDB_KEYWORD_DURING = "duringcreditsstinger"
 TMDB_KEYWORD_AFTER = "aftercreditsstinger"
 
+# Negative index answers are looked up again after these intervals.
+NEGATIVE_RECHECK_S = 30 * 86400
+UNRESOLVED_RECHECK_S = 86400
+
+# Service wake interval when nothing is due; also bounds how quickly it notices a stop request.
+IDLE_WAIT_S = 5
+# Re-check interval once inside the credits window (paused, or chapters not at the end yet).
+CREDITS_RECHECK_S = 5
+
+# Idle index pass: at most once per interval, only after Kodi has been idle for a while.
+PRECOMPUTE_INTERVAL_S = 86400
+PRECOMPUTE_IDLE_S = 300
+PRECOMPUTE_START_DELAY_S = 120
+PRECOMPUTE_RETRY_S = 600
+
 # Kodi's fullscreen video window. Stinger properties live here so they're
 # accessible during playback, surviving any focus changes in other windows.
 FULLSCREEN_VIDEO_WINDOW_ID = 12901
@@ -83,13 +102,17 @@ def get_settings() -> Dict[str, Any]:
     }
 
 
-def get_stinger_from_tmdb(ids: Dict[str, Optional[str]]) -> Optional[StingerInfo]:
-    """Fetch stinger info from TMDB via cached complete movie data.
+def _keyword_stinger(names: Set[str], source: str) -> Optional[StingerInfo]:
+    """StingerInfo from a set of lower-cased TMDB keyword / Kodi tag names, if any match."""
+    has_during = TMDB_KEYWORD_DURING in names
+    has_after = TMDB_KEYWORD_AFTER in names
+    if has_during or has_after:
+        return StingerInfo(has_during=has_during, has_after=has_after, source=source)
+    return None
 
-    Independent of the online service: fetches directly so stinger detection
-    works whether or not the main service is enabled. Uses cached `get_complete_data`,
-    so this hits the cache when the online service has already fetched.
-    """
+
+def _tmdb_keyword_names(ids: Dict[str, Optional[str]]) -> Optional[Set[str]]:
+    """Lower-cased TMDB keyword names, or None when TMDB gave no answer for the movie."""
     tmdb_id = ids.get("tmdb")
     if not tmdb_id:
         return None
@@ -107,17 +130,7 @@ def get_stinger_from_tmdb(ids: Dict[str, Optional[str]]) -> Optional[StingerInfo
 
     keywords = data.get("keywords") or {}
     keyword_list = keywords.get("keywords") or []
-    if not keyword_list:
-        return None
-
-    keyword_names = {kw.get("name", "").lower() for kw in keyword_list if isinstance(kw, dict)}
-    has_during = TMDB_KEYWORD_DURING in keyword_names
-    has_after = TMDB_KEYWORD_AFTER in keyword_names
-
-    if has_during or has_after:
-        return StingerInfo(has_during=has_during, has_after=has_after, source="tmdb")
-
-    return None
+    return {kw.get("name", "").lower() for kw in keyword_list if isinstance(kw, dict)}
 
 
 def get_stinger_from_trakt(ids: Dict[str, Optional[str]]) -> Optional[StingerInfo]:
@@ -150,40 +163,116 @@ def get_stinger_from_kodi_tags(movie_details: Dict[str, Any]) -> Optional[Stinge
     if not tags:
         return None
 
-    tag_names = {t.lower() for t in tags if isinstance(t, str)}
-
-    has_during = TMDB_KEYWORD_DURING in tag_names
-    has_after = TMDB_KEYWORD_AFTER in tag_names
+    return _keyword_stinger({t.lower() for t in tags if isinstance(t, str)}, "kodi_tags")
 
-    if has_during or has_after:
-        return StingerInfo(has_during=has_during, has_after=has_after, source="kodi_tags")
-
-    return None
 
-
-def get_stinger_info(ids: Optional[Dict[str, Optional[str]]] = None,
-                     movie_details: Optional[Dict[str, Any]] = None
-                     ) -> Optional[StingerInfo]:
-    """Check stinger sources in order: TMDB, Kodi library tags, Trakt."""
-    if ids:
-        info = get_stinger_from_tmdb(ids)
+def _resolve_stinger(ids: Optional[Dict[str, Optional[str]]],
+                     movie_details: Optional[Dict[str, Any]]
+                     ) -> Tuple[Optional[StingerInfo], bool]:
+    """`(info, tmdb_answered)` from TMDB, Kodi library tags, then Trakt."""
+    tmdb_names = _tmdb_keyword_names(ids) if ids else None
+    if tmdb_names:
+        info = _keyword_stinger(tmdb_names, "tmdb")
         if info:
             log("Service", f"Stinger info from TMDB: {info.stinger_type.value}", xbmc.LOGDEBUG)
-            return info
+            return info, True
 
     if movie_details:
         info = get_stinger_from_kodi_tags(movie_details)
         if info:
             log("Service", f"Stinger info from Kodi tags: {info.stinger_type.value}", xbmc.LOGDEBUG)
-            return info
+            return info, tmdb_names is not None
 
     if ids:
         info = get_stinger_from_trakt(ids)
         if info:
             log("Service", f"Stinger info from Trakt: {info.stinger_type.value}", xbmc.LOGDEBUG)
-            return info
+            return info, tmdb_names is not None
 
-    return None
+    return None, tmdb_names is not None
+
+
+def get_stinger_info(ids: Optional[Dict[str, Optional[str]]] = None,
+                     movie_details: Optional[Dict[str, Any]] = None
+                     ) -> Optional[StingerInfo]:
+    """Check stinger sources in order: TMDB, Kodi library tags, Trakt."""
+    return _resolve_stinger(ids, movie_details)[0]
+
+
+def stinger_inputs(movie_details: Dict[str, Any]) -> str:
+    """Digest of the library fields a stinger answer depends on: external ids and tags."""
+    ids = sorted((k, v) for k, v in extract_media_ids(movie_details).items() if v)
+    tags = sorted({t.lower() for t in movie_details.get("tag") or [] if isinstance(t, str)})
+    return hashlib.md5(json.dumps([ids, tags]).encode('utf-8')).hexdigest()
+
+
+def index_movie(dbid: int, movie_details: Dict[str, Any]) -> StingerInfo:
+    """Resolve a library movie from every source and store the answer in the stinger index.
+
+    A negative answer is rechecked after `NEGATIVE_RECHECK_S` when TMDB answered, or
+    `UNRESOLVED_RECHECK_S` when it didn't (no TMDB id, network down).
+    """
+    from lib.data.database import stinger as db_stinger
+
+    info, tmdb_answered = _resolve_stinger(extract_media_ids(movie_details), movie_details)
+    if info is None:
+        info = StingerInfo()
+    recheck = None
+    if not info.has_stinger:
+        recheck = NEGATIVE_RECHECK_S if tmdb_answered else UNRESOLVED_RECHECK_S
+    db_stinger.save_stinger(dbid, info.has_during, info.has_after, info.source, recheck,
+                            stinger_inputs(movie_details))
+    return info
+
+
+def get_indexed_stinger(dbid: int) -> Optional[StingerInfo]:
+    """Stinger info from the index, or None if the movie hasn't been indexed."""
+    from lib.data.database import stinger as db_stinger
+
+    row = db_stinger.get_stinger(dbid)
+    if row is None:
+        return None
+    return StingerInfo(has_during=row['has_during'], has_after=row['has_after'],
+                       source=row['source'])
+
+
+def precompute_stinger_index(abort_check: Callable[[], bool]) -> int:
+    """Index every library movie not yet indexed, due for a recheck, or whose ids or tags changed.
+
+    Returns the number of movies resolved. Stops early when `abort_check()` is True.
+    """
+    from lib.data.database import stinger as db_stinger
+    from lib.kodi.client import get_library_items, LibraryScanAborted
+
+    try:
+        movies = get_library_items(['movie'], ['uniqueid', 'tag'], abort_check=abort_check)
+    except LibraryScanAborted:
+        return 0
+
+    current = db_stinger.get_current_inputs()
+    resolved = found = 0
+    backfill = []
+    for movie in movies:
+        dbid = movie.get('dbid')
+        if not dbid:
+            continue
+        if dbid in current:
+            stored = current[dbid]
+            if stored is None:
+                backfill.append((dbid, stinger_inputs(movie)))
+                continue
+            if stored == stinger_inputs(movie):
+                continue
+        if abort_check():
+            break
+        if index_movie(dbid, movie).has_stinger:
+            found += 1
+        resolved += 1
+
+    db_stinger.set_inputs(backfill)
+    log("Service", f"Stinger index: {resolved} resolved ({found} with stingers), "
+        f"{len(current)} already indexed of {len(movies)} movies", xbmc.LOGDEBUG)
+    return resolved
 
 
 def set_stinger_properties(
@@ -375,9 +464,14 @@ class StingerMonitor:
         self,
         movie_id: str,
         ids: Optional[Dict[str, Optional[str]]] = None,
-        movie_details: Optional[Dict[str, Any]] = None
+        movie_details: Optional[Dict[str, Any]] = None,
+        info: Optional[StingerInfo] = None,
     ) -> None:
-        """Handle movie playback start. Resolves stinger info via TMDB/Kodi tags/Trakt."""
+        """Handle movie playback start.
+
+        Uses `info` when the caller already has it (stinger index hit), else resolves
+        via TMDB/Kodi tags/Trakt.
+        """
         if not self.settings["enabled"]:
             return
 
@@ -387,12 +481,15 @@ class StingerMonitor:
         self.reset()
         self.current_movie_id = movie_id
 
-        self.stinger_info = get_stinger_info(ids=ids, movie_details=movie_details)
+        if info is None:
+            info = get_stinger_info(ids=ids, movie_details=movie_details)
+        self.stinger_info = info
 
         if self.stinger_info and self.stinger_info.has_stinger:
             set_stinger_properties(self.stinger_info)
             log("Service",
-                f"Stinger detected (fallback): {self.stinger_info.stinger_type.value}",
+                f"Stinger detected ({self.stinger_info.source}): "
+                f"{self.stinger_info.stinger_type.value}",
                 xbmc.LOGDEBUG)
 
     def check_notification(self) -> None:
@@ -418,68 +515,219 @@ class StingerMonitor:
         self.reset()
 
 
+class StingerPlayer(xbmc.Player):
+    """Forwards playback callbacks to the stinger service (delivered on its thread)."""
+
+    def __init__(self, service: "StingerService"):
+        super().__init__()
+        self._service = service
+
+    def onAVStarted(self) -> None:
+        self._service.on_av_started()
+
+    def onPlayBackStopped(self) -> None:
+        self._service.on_playback_stopped()
+
+    def onPlayBackEnded(self) -> None:
+        self._service.on_playback_stopped()
+
+    def onPlayBackError(self) -> None:
+        self._service.on_playback_stopped()
+
+    def onPlayBackSeek(self, time: int, seekOffset: int) -> None:
+        self._service.on_position_changed()
+
+    def onPlayBackResumed(self) -> None:
+        self._service.on_position_changed()
+
+    def onPlayBackSpeedChanged(self, speed: int) -> None:
+        self._service.on_position_changed()
+
+
+class _LibraryEvents(xbmc.Monitor):
+    """Keeps the stinger index in step with library edits and scans."""
+
+    def __init__(self, service: "StingerService"):
+        super().__init__()
+        self._service = service
+
+    def onNotification(self, sender: str, method: str, data: str) -> None:
+        if method == 'VideoLibrary.OnScanFinished':
+            self._service.precompute_soon()
+            return
+        if method not in ('VideoLibrary.OnUpdate', 'VideoLibrary.OnRemove'):
+            return
+        try:
+            info = json.loads(data)
+        except ValueError:
+            return
+        if info.get('type') != 'movie' or not info.get('id') or 'playcount' in info:
+            return
+        if method == 'VideoLibrary.OnRemove':
+            from lib.data.database import stinger as db_stinger
+            db_stinger.forget_stinger(int(info['id']))
+        else:
+            # Most updates (ratings, artwork, NFO edits) leave ids and tags alone; the idle
+            # pass compares them and re-resolves only movies whose inputs changed.
+            self._service.precompute_soon()
+
+
 class StingerService(threading.Thread):
-    """Polls every 5s during movie playback to detect post-credits scenes."""
+    """Shows stinger notifications, driven by player callbacks and the stinger index.
+
+    Playback start costs one index lookup; the thread otherwise sleeps until the credits
+    window of the playing movie. While Kodi is idle it fills the index for library movies.
+    Movies missing from the index are resolved on first play and stored.
+    """
 
     def __init__(self):
         super().__init__(daemon=True)
         self.abort = threading.Event()
+        self._stinger = StingerMonitor()
+        self._player: Optional[StingerPlayer] = None
+        self._current_dbid: Optional[str] = None
+        self._pending_lookup: Optional[str] = None
+        self._deadline: Optional[float] = None
+        self._precompute_due = time.time() + PRECOMPUTE_START_DELAY_S
+        self._precompute_thread: Optional[threading.Thread] = None
 
     def run(self) -> None:
-        """Service thread entry. Polls every 5s for movie playback + stinger detection."""
-        monitor = xbmc.Monitor()
+        """Service thread entry. Waits for player callbacks and the credits deadline."""
+        monitor = _LibraryEvents(self)
+        self._player = StingerPlayer(self)
         log("Service", "Stinger service started", xbmc.LOGINFO)
 
-        stinger = StingerMonitor()
-        current_dbid: Optional[str] = None
-        fetched = False
+        # Service (re)started mid-movie: no onAVStarted will arrive for it
+        if self._player.isPlayingVideo():
+            self.on_av_started()
 
-        while not monitor.waitForAbort(5):
+        while not monitor.waitForAbort(self._wait_seconds()):
             if self.abort.is_set():
                 break
+            if self._pending_lookup:
+                self._resolve_pending()
+            elif self._deadline is not None and time.monotonic() >= self._deadline:
+                self._check_credits()
+            elif self._current_dbid is None:
+                self._precompute_if_idle(monitor)
+
+        self._stinger.reset()
+        self._player = None
+        log("Service", "Stinger service stopped", xbmc.LOGINFO)
 
-            movie_playing = (
-                get_settings()["enabled"]
-                and xbmc.getCondVisibility("Player.HasVideo")
-                and xbmc.getCondVisibility("VideoPlayer.Content(movies)")
-            )
-
-            if not movie_playing:
-                if current_dbid:
-                    stinger.on_playback_stop()
-                    current_dbid = None
-                    fetched = False
-                continue
-
-            dbid = xbmc.getInfoLabel("VideoPlayer.DBID") or ""
-            if not dbid or dbid == "-1":
-                continue
-
-            if dbid != current_dbid:
-                if current_dbid:
-                    stinger.reset()
-                current_dbid = dbid
-                fetched = False
-                continue
-
-            if not fetched:
-                self._fetch_stinger_info(stinger, dbid)
-                fetched = True
+    def _wait_seconds(self) -> float:
+        if self._pending_lookup:
+            return 0.1
+        if self._deadline is None:
+            return IDLE_WAIT_S
+        return max(0.1, min(IDLE_WAIT_S, self._deadline - time.monotonic()))
+
+    def on_av_started(self) -> None:
+        """New stream: look the movie up in the index and schedule the credits check."""
+        movie_playing = (
+            get_settings()["enabled"]
+            and xbmc.getCondVisibility("Player.HasVideo")
+            and xbmc.getCondVisibility("VideoPlayer.Content(movies)")
+        )
+        dbid = (xbmc.getInfoLabel("VideoPlayer.DBID") or "") if movie_playing else ""
+        if not dbid or dbid == "-1":
+            self.on_playback_stopped()
+            return
 
-            stinger.check_notification()
+        if dbid == self._current_dbid:
+            self._schedule()
+            return
 
-        stinger.reset()
-        log("Service", "Stinger service stopped", xbmc.LOGINFO)
+        self.on_playback_stopped()
+        self._current_dbid = dbid
+        info = get_indexed_stinger(int(dbid))
+        if info is None:
+            # Not indexed yet: resolve on the next wake, outside the callback
+            self._pending_lookup = dbid
+            return
 
-    def _fetch_stinger_info(self, stinger: StingerMonitor, dbid: str) -> None:
+        self._stinger.on_playback_start(movie_id=dbid, info=info)
+        if info.has_stinger:
+            self._schedule()
+
+    def on_playback_stopped(self) -> None:
+        if self._current_dbid:
+            self._stinger.on_playback_stop()
+        self._current_dbid = None
+        self._pending_lookup = None
+        self._deadline = None
+
+    def on_position_changed(self) -> None:
+        """Seek, resume or speed change: recompute when the credits window starts."""
+        if self._deadline is not None:
+            self._schedule()
+
+    def precompute_soon(self) -> None:
+        """Run the idle index pass at the next idle opportunity."""
+        self._precompute_due = 0.0
+
+    def _schedule(self, min_delay: float = 0.0) -> None:
+        """Set the wake deadline to the start of the credits window."""
+        try:
+            remaining = self._player.getTotalTime() - self._player.getTime()
+        except (RuntimeError, AttributeError):
+            self._deadline = None
+            return
+        lead = self._stinger.settings["minutes_before_end"] * 60
+        self._deadline = time.monotonic() + max(min_delay, remaining - lead)
+
+    def _check_credits(self) -> None:
+        self._stinger.check_notification()
+        info = self._stinger.stinger_info
+        if self._stinger.notified or not info or not info.has_stinger:
+            self._deadline = None
+        else:
+            # Paused, or chapters say the credits haven't started yet
+            self._schedule(min_delay=CREDITS_RECHECK_S)
+
+    def _resolve_pending(self) -> None:
+        dbid = self._pending_lookup
+        self._pending_lookup = None
         details = get_item_details(
             'movie',
             int(dbid),
             KODI_MOVIE_PROPERTIES,
             cache_key=f"player:movie:{dbid}:details",
         )
-        if not isinstance(details, dict):
+        if not isinstance(details, dict) or dbid != self._current_dbid:
             return
 
-        ids = extract_media_ids(details)
-        stinger.on_playback_start(movie_id=dbid, ids=ids, movie_details=details)
+        info = index_movie(int(dbid), details)
+        self._stinger.on_playback_start(movie_id=dbid, info=info)
+        if info.has_stinger:
+            self._schedule()
+
+    def _precompute_if_idle(self, monitor: xbmc.Monitor) -> None:
+        if time.time() < self._precompute_due:
+            return
+        if xbmc.getGlobalIdleTime() < PRECOMPUTE_IDLE_S or self._player.isPlayingVideo():
+            return
+        if self._precompute_thread and self._precompute_thread.is_alive():
+            return
+        self._precompute_due = time.time() + PRECOMPUTE_INTERVAL_S
+        self._precompute_thread = threading.Thread(
+            target=self._run_precompute, args=(monitor,), daemon=True)
+        self._precompute_thread.start()
+
+    def _run_precompute(self, monitor: xbmc.Monitor) -> None:
+        interrupted = False
+
+        def should_stop() -> bool:
+            nonlocal interrupted
+            interrupted = (self.abort.is_set() or monitor.abortRequested()
+                           or xbmc.getGlobalIdleTime() < PRECOMPUTE_IDLE_S
+                           or xbmc.Player().isPlayingVideo())
+            return interrupted
+
+        try:
+            precompute_stinger_index(should_stop)
+        except Exception as e:
+            log("Service", f"Stinger index precompute error: {e}", xbmc.LOGERROR)
+            interrupted = True
+        if interrupted:
+            self._precompute_due = min(self._precompute_due, time.time() + PRECOMPUTE_RETRY_S)
@@ -1,6 +1,7 @@
 """Container manipulation utilities for skin integration."""
 from __future__ import annotations
 
+import json
 from typing import Optional
 import unicodedata
 from urllib.parse import quote
@@ -265,33 +266,140 @@ def _container_too_large(target: str) -> bool:
     return False
 
 
-def _available_sort_letters(target: str) -> set[str]:
-    """Folded jump letters (A-Z plus '#') present in the target container.
+# Letter -> first absolute position, per target container, in one home-window property so it
+# outlives the plugin process. The service clears it on library changes.
+_LETTER_INDEX_PROP = 'SkinInfo.LetterIndex'
+_MAX_INDEXED_CONTAINERS = 8
+# Letters spot-checked when reusing an index; fixed choices keep the label strings (and their
+# GUIInfo entries) the same from one check to the next.
+_VERIFY_LETTERS = 3
 
-    Reads the live container, so active filters and the current sort are honoured.
+
+def _container_signature(target: str) -> list[str]:
+    """What the index depends on: folder, sort, direction and (filtered) item counts."""
+    return [xbmc.getInfoLabel(f'Container({target}).{label}')
+            for label in ('FolderPath', 'SortMethod', 'SortOrder', 'NumAllItems', 'NumItems')]
+
+
+def _scan_letter_positions(target: str) -> Optional[dict[str, int]]:
+    """First absolute position of each folded jump letter (A-Z plus '#') in the target.
+
+    Reads the live container, so active filters and the current sort are honoured. None when
+    a label request fails, since a partial scan can't say a letter is absent.
     """
     try:
         all_count = int(xbmc.getInfoLabel(f'Container({target}).NumAllItems') or 0)
         count = int(xbmc.getInfoLabel(f'Container({target}).NumItems') or 0)
     except ValueError:
-        return set()
+        return None
 
     start_index = max(0, all_count - count)  # 1 when a ".." parent item leads the list
 
-    found: set[str] = set()
+    positions: dict[str, int] = {}
     for start in range(start_index, all_count, _SCAN_CHUNK):
         labels = [
             f'Container({target}).ListItemAbsolute({i}).SortLetter'
             for i in range(start, min(start + _SCAN_CHUNK, all_count))
         ]
         response = request('XBMC.GetInfoLabels', {'labels': labels})
-        for value in (response.get('result', {}) if response else {}).values():
-            letter = _fold_letter(value)
-            if letter:
-                found.add(letter)
-        if len(found) >= 27:
+        if not response or 'result' not in response:
+            return None
+        values = response['result']
+        for position, label in enumerate(labels, start):
+            letter = _fold_letter(values.get(label, ''))
+            if letter and letter not in positions:
+                positions[letter] = position
+        if len(positions) >= 27:
             break
-    return found
+    return positions
+
+
+def _read_letter_indexes() -> dict:
+    raw = xbmcgui.Window(10000).getProperty(_LETTER_INDEX_PROP)
+    if not raw:
+        return {}
+    try:
+        indexes = json.loads(raw)
+    except ValueError:
+        return {}
+    return indexes if isinstance(indexes, dict) else {}
+
+
+def _cached_letter_positions(target: str, signature: list[str]) -> Optional[dict[str, int]]:
+    """The stored index for `target` if it was built for the same content and sort."""
+    entry = _read_letter_indexes().get(target)
+    if not isinstance(entry, dict) or entry.get('signature') != signature:
+        return None
+    positions = entry.get('positions')
+    return positions if isinstance(positions, dict) else None
+
+
+def _store_letter_positions(target: str, signature: list[str],
+                            positions: dict[str, int]) -> None:
+    indexes = _read_letter_indexes()
+    indexes.pop(target, None)
+    indexes[target] = {'signature': signature, 'positions': positions}
+    while len(indexes) > _MAX_INDEXED_CONTAINERS:
+        indexes.pop(next(iter(indexes)))
+    xbmcgui.Window(10000).setProperty(_LETTER_INDEX_PROP, json.dumps(indexes))
+
+
+def _forget_letter_positions(target: str) -> None:
+    indexes = _read_letter_indexes()
+    if indexes.pop(target, None) is not None:
+        xbmcgui.Window(10000).setProperty(_LETTER_INDEX_PROP, json.dumps(indexes))
+
+
+def clear_letter_index() -> None:
+    """Drop every stored letter index (library content changed)."""
+    xbmcgui.Window(10000).clearProperty(_LETTER_INDEX_PROP)
+
+
+def _verify_letter_positions(target: str, positions: dict[str, int], first: int) -> bool:
+    """Spot-check a few letters: each still starts at its recorded position.
+
+    `first` is the position of the first real item (past any ".." parent item).
+    """
+    ordered = sorted(positions.items(), key=lambda item: item[1])
+    step = max(1, len(ordered) // _VERIFY_LETTERS)
+
+    # (label, letter, whether the item should fold to that letter)
+    checks: list[tuple[str, str, bool]] = []
+    for letter, position in ordered[step - 1::step][:_VERIFY_LETTERS]:
+        checks.append((f'Container({target}).ListItemAbsolute({position}).SortLetter',
+                       letter, True))
+        if position > first:
+            # The item before must not share the letter, or the recorded start is too late.
+            checks.append((f'Container({target}).ListItemAbsolute({position - 1}).SortLetter',
+                           letter, False))
+    if not checks:
+        return True
+
+    response = request('XBMC.GetInfoLabels', {'labels': [label for label, _, _ in checks]})
+    if not response or 'result' not in response:
+        return False
+    values = response['result']
+    return all((_fold_letter(values.get(label, '')) == letter) == expected
+               for label, letter, expected in checks)
+
+
+def _letter_positions(target: str) -> dict[str, int]:
+    """Letter -> first position for the target, from the stored index when it still holds."""
+    signature = _container_signature(target)
+    positions = _cached_letter_positions(target, signature)
+    if positions is not None:
+        try:
+            first = max(0, int(signature[3] or 0) - int(signature[4] or 0))
+        except ValueError:
+            first = 0
+        if _verify_letter_positions(target, positions, first):
+            return positions
+
+    positions = _scan_letter_positions(target)
+    if positions is None:
+        return {}
+    _store_letter_positions(target, signature, positions)
+    return positions
 
 
 def handle_letter_jump_list(handle: int, params: dict) -> None:
@@ -309,8 +417,9 @@ def handle_letter_jump_list(handle: int, params: dict) -> None:
 
     letters = 'ZYXWVUTSRQPONMLKJIHGFEDCBA#' if is_descending else 'ABCDEFGHIJKLMNOPQRSTUVWXYZ#'
 
-    available = _available_sort_letters(target) if want_available else set()
+    available = set(_letter_positions(target)) if want_available else set()
 
+    items = []
     for letter in letters:
         is_available = letter in available
         if not showall and not is_available:
@@ -325,12 +434,33 @@ def handle_letter_jump_list(handle: int, params: dict) -> None:
             url = (f'plugin://script.skin.info.service/?action=jump_letter_exec'
                    f'&letter={quote(letter, safe="")}&target={target}')
 
-        xbmcplugin.addDirectoryItem(handle, url, listitem, False)
+        items.append((url, listitem, False))
 
+    xbmcplugin.addDirectoryItems(handle, items, len(items))
     xbmcplugin.setContent(handle, '')
     xbmcplugin.endOfDirectory(handle)
 
 
+def _seek_letter(letter: str, target: str) -> bool:
+    """Focus the first item under `letter` straight from the stored index.
+
+    False when there's no usable index entry or the item landed on doesn't match, in which
+    case the index is dropped and the caller falls back to the SMS jump.
+    """
+    if letter == '#':
+        return False
+    positions = _cached_letter_positions(target, _container_signature(target))
+    if not positions or letter not in positions:
+        return False
+
+    xbmc.executebuiltin(f'SetFocus({target})', True)
+    xbmc.executebuiltin(f'Control.SetFocus({target},{positions[letter]},absolute)', True)
+    if _fold_letter(xbmc.getInfoLabel(f'Container({target}).ListItem.SortLetter')) == letter:
+        return True
+    _forget_letter_positions(target)
+    return False
+
+
 def handle_letter_jump_exec(handle: int, params: dict) -> None:
     """Execute letter jump from `?action=jump_letter_exec&letter=X&target=N`."""
     try:
@@ -348,4 +478,6 @@ def handle_letter_jump_exec(handle: int, params: dict) -> None:
     if letter.upper() == _fold_letter(current):
         return
 
+    if target and _seek_letter(letter.upper(), target):
+        return
     jump_letter(letter, target)
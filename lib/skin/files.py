@@ -1,6 +1,11 @@
 """File system utilities for skin integration."""
 import xbmc
-import xbmcvfs
+
+from lib.infrastructure.paths import PathExistence
+
+# Lives as long as the interpreter: the service's resident command server reuses it across
+# focus changes, so repeat probes into the same folders cost no I/O until the TTL lapses.
+_existence = PathExistence()
 
 
 def _set_not_found(prop_base: str, window: str) -> None:
@@ -18,7 +23,7 @@ def check_file_exists(paths, separator='|', prefix='', window='home'):
         return
 
     for path in (p.strip() for p in paths.split(separator) if p.strip()):
-        if xbmcvfs.exists(path):
+        if _existence.exists(path):
             xbmc.executebuiltin(f'SetProperty({prop_base}.Exists,true,{window})')
             xbmc.executebuiltin(f'SetProperty({prop_base}.Path,{path},{window})')
             return
@@ -0,0 +1,138 @@
+"""Disk usage of Kodi's thumbnail cache, rescanning only folders that changed.
+
+Adding or removing a file updates its folder's mtime, so a folder whose mtime matches the
+stored snapshot still holds the same files and keeps its totals without being listed. Changed
+folders are listed with `os.scandir`, whose entries carry the stat data a size sum needs.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import xbmc
+
+from lib.kodi.client import log
+
+# FAT-formatted SD cards keep mtimes to 2s, so a folder written to within that window of the
+# scan could change again without its mtime moving; such folders are rescanned next time.
+_RACY_WINDOW_NS = 2_000_000_000
+
+# The hashed 0-f folders and Video/ are independent subtrees; a few threads overlap their
+# stat latency on slow storage.
+DISK_USAGE_WORKERS = 4
+
+Snapshot = Dict[str, Tuple[int, int, int]]
+
+
+def _children(snapshot: Snapshot) -> Dict[str, List[str]]:
+    children: Dict[str, List[str]] = {}
+    for directory in snapshot:
+        if directory:
+            children.setdefault(os.path.dirname(directory), []).append(directory)
+    return children
+
+
+def _scan_folder(path: str, rel: str, subdirs: List[str]) -> Tuple[int, int]:
+    """Size and count of the files directly in `path`; appends its subfolders to `subdirs`."""
+    size = count = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(os.path.join(rel, entry.name))
+                elif entry.is_file(follow_symlinks=False):
+                    size += entry.stat(follow_symlinks=False).st_size
+                    count += 1
+            except OSError:
+                pass
+    return size, count
+
+
+def _visit(root: str, rel: str, snapshot: Snapshot, children: Dict[str, List[str]],
+           racy_after_ns: int, pending: List[str]) -> Tuple[Tuple[int, int, int], bool]:
+    """Snapshot row for one folder and whether it had to be listed; queues its subfolders.
+
+    Raises OSError when the folder can't be read.
+    """
+    path = os.path.join(root, rel) if rel else root
+    mtime_ns = os.stat(path).st_mtime_ns
+    known = snapshot.get(rel)
+    if known is not None and known[0] == mtime_ns:
+        pending.extend(children.get(rel, ()))
+        size, count, listed = known[1], known[2], False
+    else:
+        size, count = _scan_folder(path, rel, pending)
+        listed = True
+    return (-1 if mtime_ns >= racy_after_ns else mtime_ns, size, count), listed
+
+
+def _scan_tree(root: str, start: str, snapshot: Snapshot, children: Dict[str, List[str]],
+               racy_after_ns: int) -> Tuple[Snapshot, int]:
+    """Walk the subtree at `start`: `(fresh snapshot rows, folders listed)`."""
+    fresh: Snapshot = {}
+    listed = 0
+    pending = [start]
+    while pending:
+        rel = pending.pop()
+        try:
+            fresh[rel], was_listed = _visit(root, rel, snapshot, children, racy_after_ns,
+                                            pending)
+        except OSError:
+            continue
+        listed += was_listed
+    return fresh, listed
+
+
+def calculate_disk_usage(thumbnails_path: str, workers: int = DISK_USAGE_WORKERS) -> int:
+    """Total bytes under `thumbnails_path`, refreshing the stored snapshot.
+
+    `workers > 1` scans the top-level subfolders in parallel. Returns 0 on error.
+    """
+    from lib.data.database import texture_usage
+
+    try:
+        snapshot = texture_usage.get_snapshot()
+    except Exception as e:
+        log("Texture", f"Disk usage snapshot unavailable: {e}", xbmc.LOGDEBUG)
+        snapshot = {}
+
+    try:
+        started = time.perf_counter()
+        racy_after_ns = time.time_ns() - _RACY_WINDOW_NS
+        children = _children(snapshot)
+
+        # The root alone first: its own files are few and it yields the subtrees to fan out.
+        subtrees: List[str] = []
+        root_row, listed = _visit(thumbnails_path, '', snapshot, children, racy_after_ns,
+                                  subtrees)
+        fresh: Snapshot = {'': root_row}
+
+        def scan(start: str) -> Tuple[Snapshot, int]:
+            return _scan_tree(thumbnails_path, start, snapshot, children, racy_after_ns)
+
+        if workers > 1 and len(subtrees) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(subtrees))) as executor:
+                results = list(executor.map(scan, subtrees))
+        else:
+            results = [scan(start) for start in subtrees]
+
+        for subtree_rows, subtree_listed in results:
+            fresh.update(subtree_rows)
+            listed += subtree_listed
+        total = sum(row[1] for row in fresh.values())
+
+        log("Texture", f"Disk usage: {total} bytes, listed {listed} of {len(fresh)} folders "
+            f"in {(time.perf_counter() - started) * 1000:.0f} ms", xbmc.LOGDEBUG)
+    except Exception as e:
+        log("Texture", f"SkinInfo TextureCache: Disk usage calculation failed: {str(e)}",
+            xbmc.LOGWARNING)
+        return 0
+
+    if fresh != snapshot:
+        try:
+            texture_usage.save_snapshot(fresh)
+        except Exception as e:
+            log("Texture", f"Disk usage snapshot save failed: {e}", xbmc.LOGDEBUG)
+    return total
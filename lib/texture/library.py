@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import threading
-from typing import Optional, List, Dict, Set, Any, Callable
+from typing import Optional, List, Dict, Set, Any, Callable, Iterable
 
 import xbmc
 
 from lib.kodi.client import request, get_library_items, log, decode_image_url
 from lib.infrastructure.dialogs import ProgressDialog
+from lib.texture.textures_db import TextureReader, read_textures, open_reader
 
 
 DEFAULT_TEXTURE_MEDIA_TYPES = [
@@ -20,7 +21,14 @@ _cached_urls_set: Optional[Set[str]] = None
 
 
 def get_cached_textures(url_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Return cached textures from `Textures13.db`. `url_filter` does a partial-match filter."""
+    """Return cached textures from `Textures13.db`. `url_filter` does a partial-match filter.
+
+    Reads the database file directly when it can, else via `Textures.GetTextures`.
+    """
+    textures = read_textures(url_filter)
+    if textures is not None:
+        return textures
+
     params: Dict[str, Any] = {
         "properties": ["url", "cachedurl", "lasthashcheck", "imagehash", "sizes"]
     }
@@ -106,22 +114,99 @@ def get_all_library_artwork_urls(media_types: Optional[List[str]] = None,
     return all_urls
 
 
+class _TextureUrlSnapshot:
+    """Decoded texture URLs by texture id, brought up to date from `Textures13.db` in place.
+
+    Kodi only appends rows, deletes them, or (after deleting the highest ids) hands those ids
+    out again. New rows are those above the last seen id; a count mismatch means deletions or
+    reused ids and is settled by diffing ids; a changed URL on the highest id kept from the
+    last refresh means reuse the count didn't reveal, and forces a full reload.
+    """
+
+    def __init__(self):
+        self._urls: Dict[int, str] = {}
+        self._max_id = 0
+        self._set: Optional[Set[str]] = None
+
+    def _add(self, rows: Dict[int, str]) -> None:
+        self._urls.update({texture_id: decode_image_url(url) if url else ''
+                           for texture_id, url in rows.items()})
+        if rows:
+            self._set = None
+
+    def _drop(self, ids: Iterable[int]) -> None:
+        for texture_id in ids:
+            del self._urls[texture_id]
+        self._set = None
+
+    def _reset(self) -> None:
+        self._urls.clear()
+        self._max_id = 0
+        self._set = None
+
+    def refresh(self) -> Optional[Set[str]]:
+        """Current decoded URL set, or None when the texture database can't be read."""
+        reader = open_reader()
+        if reader is None:
+            self._reset()
+            return None
+        try:
+            max_id, count = reader.bounds()
+            if self._urls:
+                self._update(reader, count)
+            if not self._urls and count:
+                self._add(reader.urls())
+            self._max_id = max_id
+        except Exception as e:
+            log("Texture", f"Texture URL snapshot refresh failed, using JSON-RPC: {e}",
+                xbmc.LOGDEBUG)
+            self._reset()
+            return None
+        finally:
+            reader.close()
+
+        if self._set is None:
+            self._set = {url for url in self._urls.values() if url}
+        return self._set
+
+    def _update(self, reader: TextureReader, count: int) -> None:
+        """Apply changes since the last refresh; empties the snapshot when it can't."""
+        added = reader.urls(after_id=self._max_id)
+        if len(self._urls) + len(added) != count:
+            current = reader.ids()
+            self._drop([texture_id for texture_id in self._urls if texture_id not in current])
+            self._add(reader.urls(ids=[texture_id for texture_id in current
+                                       if texture_id <= self._max_id
+                                       and texture_id not in self._urls]))
+
+        if self._urls:
+            top = max(self._urls)
+            url = reader.urls(ids=[top]).get(top)
+            if url is None or (decode_image_url(url) if url else '') != self._urls[top]:
+                self._reset()
+                return
+        self._add(added)
+
+
+_url_snapshot = _TextureUrlSnapshot()
+
+
 def load_cached_urls_once() -> Set[str]:
-    """Cache all texture URLs in memory for O(1) lookups during one operation."""
+    """Cache all texture URLs in memory for O(1) lookups during one operation.
+
+    The first call of each operation refreshes a snapshot kept for the life of the process,
+    so operations run back to back from the texture menu read only what changed in between.
+    """
     global _cached_urls_set
 
     with _cache_lock:
         if _cached_urls_set is not None:
             return _cached_urls_set
+        new_set = _url_snapshot.refresh()
 
-    textures = get_cached_textures()
-    new_set = set()
-
-    for texture in textures:
-        url = texture.get('url', '')
-        if url:
-            decoded = decode_image_url(url)
-            new_set.add(decoded)
+    if new_set is None:
+        new_set = {decode_image_url(texture['url'])
+                   for texture in get_cached_textures() if texture.get('url')}
 
     with _cache_lock:
         if _cached_urls_set is None:
@@ -130,7 +215,7 @@ def load_cached_urls_once() -> Set[str]:
 
 
 def clear_cached_urls_cache() -> None:
-    """Clear the in-memory cached URLs set to force reload on next operation."""
+    """Mark the cached URLs stale so the next operation refreshes them."""
     global _cached_urls_set
     with _cache_lock:
         _cached_urls_set = None
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import threading
+import time
+from queue import Queue
 from typing import Optional, List, Dict, Set, Any, Callable
 
 import xbmc
@@ -10,9 +12,15 @@ import xbmcvfs
 from lib.kodi.client import (
     request, log, extract_result, encode_image_url, is_inherited_art, ADDON
 )
-from lib.infrastructure.workers import WorkerQueue, VFS_WORKER_COUNT
+from lib.infrastructure.workers import WorkerQueue, HostQueue, VFS_WORKER_COUNT
 from lib.infrastructure.paths import PathBuilder, use_basename_for
 from lib.download.artwork import DownloadArtwork
+from lib.texture.textures_db import read_texture_urls
+
+
+# `_cache_url_via_xbmcvfs` error when Kodi answered but had nothing to cache: a stale URL,
+# not a struggling host.
+_NOT_FOUND = "file not found or empty"
 
 
 def _cache_url_via_xbmcvfs(url: str) -> tuple[bool, Optional[str]]:
@@ -27,7 +35,7 @@ def _cache_url_via_xbmcvfs(url: str) -> tuple[bool, Optional[str]]:
         f.close()
         if cached:
             return True, None
-        return False, "file not found or empty"
+        return False, _NOT_FOUND
     except Exception as e:
         return False, str(e)
 
@@ -72,11 +80,21 @@ class TextureCache(WorkerQueue):
             return False
         return True
 
+    def _make_queue(self) -> Queue:
+        return HostQueue(lambda url: url, self.num_workers)
+
+    def stop(self, wait: bool = True) -> None:
+        super().stop(wait=wait)
+        log("Cache", f"TextureCache host limits: {self.queue.describe()}", xbmc.LOGDEBUG)
+
     def _process_item(self, item: str, worker_id: int) -> Dict:
         """`WorkerQueue` entry point: cache one URL via `xbmcvfs.File` read."""
         url = item
+        started = time.monotonic()
         success, error = _cache_url_via_xbmcvfs(url)
-        if not success and error and error != "file not found or empty":
+        host_fault = not success and error != _NOT_FOUND
+        self.queue.finish(url, time.monotonic() - started, success, host_fault)
+        if host_fault and error:
             log("Texture", f"Worker {worker_id} failed to cache URL: {error}", xbmc.LOGWARNING)
         return (
             {'url': url, 'success': success, 'error': error} if not success
@@ -93,10 +111,14 @@ class TextureCache(WorkerQueue):
 
     def _load_cached_urls(self) -> None:
         try:
-            response = request('Textures.GetTextures', {'properties': ['url']})
-            if response and 'result' in response:
-                textures = extract_result(response, 'textures', [])
-                self.cached_urls_set = {t['url'] for t in textures if 'url' in t}
+            urls = read_texture_urls()
+            if urls is None:
+                response = request('Textures.GetTextures', {'properties': ['url']})
+                if response and 'result' in response:
+                    textures = extract_result(response, 'textures', [])
+                    urls = {t['url'] for t in textures if 'url' in t}
+            if urls is not None:
+                self.cached_urls_set = urls
                 log(
                     "Cache",
                     f"TextureCache loaded {len(self.cached_urls_set)} cached URLs for "
@@ -157,12 +179,17 @@ class TextureCacheDownload(WorkerQueue):
         item = (url, media_type, media_file, artwork_type, title, season, episode, mbid)
         return self.add_item(item, dedupe_key=url)
 
+    def _make_queue(self) -> Queue:
+        return HostQueue(lambda item: item[0], self.num_workers)
+
     def stop(self, wait: bool = True) -> None:
         """Stop workers, then release each worker's pooled connections."""
         super().stop(wait=wait)
         for downloader in list(self.artworks.values()):
             downloader.close()
         self.artworks.clear()
+        log("Cache", f"TextureCacheDownload host limits: {self.queue.describe()}",
+            xbmc.LOGDEBUG)
 
     def get_stats(self) -> Dict:
         base_stats = super().get_stats()
@@ -184,10 +211,24 @@ class TextureCacheDownload(WorkerQueue):
             self.stats_activity += 1
 
     def _process_item(self, item: Any, worker_id: int) -> Dict:
+        """`WorkerQueue` entry point; the whole item counts toward its host's latency."""
+        started = time.monotonic()
+        cache_success = False
+        host_fault = True
+        try:
+            result = self._cache_and_download(item, worker_id)
+            cache_success = result['cache_success']
+            host_fault = result['host_fault']
+            return result
+        finally:
+            self.queue.finish(item, time.monotonic() - started, cache_success, host_fault)
+
+    def _cache_and_download(self, item: Any, worker_id: int) -> Dict:
         url, media_type, media_file, artwork_type, title, season, _episode, mbid = item
 
         download_success = False
         download_error = None
+        error_category = None
         bytes_downloaded = 0
 
         cache_success, cache_error = _cache_url_via_xbmcvfs(url)
@@ -197,7 +238,7 @@ class TextureCacheDownload(WorkerQueue):
         else:
             with self._stats_lock:
                 self.stats_cache_failed += 1
-            if cache_error and cache_error != "file not found or empty":
+            if cache_error and cache_error != _NOT_FOUND:
                 log("Texture",
                     f"SkinInfo: TextureCacheDownload worker {worker_id} failed to cache URL: "
                     f"{cache_error}",
@@ -271,5 +312,7 @@ class TextureCacheDownload(WorkerQueue):
             'cache_error': cache_error,
             'download_success': download_success,
             'download_error': download_error,
-            'bytes_downloaded': bytes_downloaded
+            'bytes_downloaded': bytes_downloaded,
+            'host_fault': ((not cache_success and cache_error != _NOT_FOUND)
+                           or error_category == DownloadArtwork.ERROR_NETWORK),
         }
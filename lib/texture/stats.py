@@ -1,7 +1,6 @@
 """Texture cache statistics calculation and formatting."""
 from __future__ import annotations
 
-import os
 import xbmc
 import xbmcgui
 import xbmcvfs
@@ -9,6 +8,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 
 from lib.kodi.client import log, ADDON
+from lib.texture.disk_usage import calculate_disk_usage
 from lib.texture.utilities import is_library_artwork_url
 
 # Age and usage bucket boundaries (inclusive upper bound per bucket).
@@ -78,23 +78,6 @@ def _bucket_size_record(size: dict, now: datetime, age_buckets: Dict[str, int],
     usage_buckets[_bucket_usage(usecount)] += 1
 
 
-def _calculate_disk_usage(thumbnails_path: str) -> int:
-    """Sum the on-disk size of every file under `thumbnails_path`. Returns 0 on walk error."""
-    disk_usage = 0
-    try:
-        for root, _dirs, files in os.walk(thumbnails_path):
-            for filename in files:
-                filepath = os.path.join(root, filename)
-                try:
-                    disk_usage += os.path.getsize(filepath)
-                except Exception:
-                    pass
-    except Exception as e:
-        log("Texture", f"SkinInfo TextureCache: Disk usage calculation failed: {str(e)}",
-            xbmc.LOGWARNING)
-    return disk_usage
-
-
 def calculate_texture_statistics(textures: list[Dict[str, Any]],
                                  progress: xbmcgui.DialogProgress) -> Optional[Dict[str, Any]]:
     """Compute texture-cache stats: counts, age/usage buckets, type breakdown, disk usage."""
@@ -124,7 +107,7 @@ def calculate_texture_statistics(textures: list[Dict[str, Any]],
                 _bucket_size_record(size, now, age_buckets, usage_buckets)
 
         progress.update(80, ADDON.getLocalizedString(32425))
-        disk_usage = _calculate_disk_usage(xbmcvfs.translatePath("special://thumbnails"))
+        disk_usage = calculate_disk_usage(xbmcvfs.translatePath("special://thumbnails"))
         progress.update(100, ADDON.getLocalizedString(32426))
 
         return {
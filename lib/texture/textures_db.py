@@ -0,0 +1,185 @@
+"""Read-only access to Kodi's texture cache database (`Textures13.db`).
+
+`Textures.GetTextures` returns the whole cache as one JSON-RPC response that Kodi serializes
+and this process parses in full. Reading the SQLite file directly streams rows instead.
+Every reader returns None when the database is missing, locked or has a schema this module
+doesn't know, so callers fall back to JSON-RPC.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import urllib.parse
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import xbmc
+import xbmcvfs
+
+from lib.kodi.client import log
+
+_TEXTURES_DB_PATTERN = re.compile(r'^Textures(\d+)\.db$')
+
+_REQUIRED_COLUMNS = {
+    'texture': {'id', 'url', 'cachedurl', 'imagehash', 'lasthashcheck'},
+    'sizes': {'idtexture', 'size', 'width', 'height', 'usecount', 'lastusetime'},
+}
+
+# Kodi holds write locks only briefly; past this, the JSON-RPC path is the better wait.
+_BUSY_TIMEOUT_S = 2.0
+
+
+def _find_database() -> Optional[str]:
+    """Path of the newest `TexturesNN.db` in Kodi's database folder."""
+    folder = xbmcvfs.translatePath('special://database/')
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return None
+    newest = None
+    for name in names:
+        match = _TEXTURES_DB_PATTERN.match(name)
+        if match and (newest is None or int(match.group(1)) > newest[0]):
+            newest = (int(match.group(1)), name)
+    return os.path.join(folder, newest[1]) if newest else None
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    """Read-only connection with a verified schema, or None."""
+    path = _find_database()
+    if not path:
+        return None
+    try:
+        uri = f"file:{urllib.parse.quote(path)}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, timeout=_BUSY_TIMEOUT_S)
+    except sqlite3.Error as e:
+        log("Texture", f"Texture database not readable, using JSON-RPC: {e}", xbmc.LOGDEBUG)
+        return None
+    try:
+        for table, required in _REQUIRED_COLUMNS.items():
+            columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+            if not required <= columns:
+                log("Texture", f"Unrecognized texture database schema ({table}), "
+                    f"using JSON-RPC", xbmc.LOGINFO)
+                conn.close()
+                return None
+    except sqlite3.Error as e:
+        log("Texture", f"Texture database not readable, using JSON-RPC: {e}", xbmc.LOGDEBUG)
+        conn.close()
+        return None
+    return conn
+
+
+def _contains_pattern(text: str) -> str:
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def read_textures(url_filter: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Textures shaped like `Textures.GetTextures` output, or None to fall back.
+
+    Each entry carries `textureid`, `url`, `cachedurl`, `lasthashcheck`, `imagehash` and
+    `sizes` (`size`, `width`, `height`, `usecount`, `lastused`). `url_filter` matches like
+    the JSON-RPC `contains` operator.
+    """
+    conn = _connect()
+    if conn is None:
+        return None
+
+    sql = ('SELECT t.id, t.url, t.cachedurl, t.lasthashcheck, t.imagehash, '
+           's.size, s.width, s.height, s.usecount, s.lastusetime '
+           'FROM texture t LEFT JOIN sizes s ON s.idtexture = t.id')
+    params: tuple = ()
+    if url_filter:
+        sql += " WHERE t.url LIKE ? ESCAPE '\\'"
+        params = (_contains_pattern(url_filter),)
+    sql += ' ORDER BY t.id'
+
+    textures: List[Dict[str, Any]] = []
+    last_id = None
+    sizes: List[Dict[str, Any]] = []
+    try:
+        # One row per size, ordered by texture: start a new entry whenever the id changes.
+        for (texture_id, url, cachedurl, lasthashcheck, imagehash,
+             size, width, height, usecount, lastused) in conn.execute(sql, params):
+            if texture_id != last_id:
+                last_id = texture_id
+                sizes = []
+                textures.append({
+                    'textureid': texture_id,
+                    'url': url or '',
+                    'cachedurl': cachedurl or '',
+                    'lasthashcheck': lasthashcheck or '',
+                    'imagehash': imagehash or '',
+                    'sizes': sizes,
+                })
+            if size is not None:
+                sizes.append({
+                    'size': size,
+                    'width': width or 0,
+                    'height': height or 0,
+                    'usecount': usecount or 0,
+                    'lastused': lastused or '',
+                })
+    except sqlite3.Error as e:
+        log("Texture", f"Texture database read failed, using JSON-RPC: {e}", xbmc.LOGDEBUG)
+        return None
+    finally:
+        conn.close()
+    return textures
+
+
+def read_texture_urls() -> Optional[Set[str]]:
+    """Every cached texture URL, or None to fall back."""
+    conn = _connect()
+    if conn is None:
+        return None
+    try:
+        return {url for (url,) in conn.execute('SELECT url FROM texture') if url}
+    except sqlite3.Error as e:
+        log("Texture", f"Texture database read failed, using JSON-RPC: {e}", xbmc.LOGDEBUG)
+        return None
+    finally:
+        conn.close()
+
+
+# Kodi's bundled SQLite allows 999 parameters per statement.
+_ID_CHUNK = 900
+
+
+class TextureReader:
+    """One read-only connection for a series of small queries; raises `sqlite3.Error`."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def bounds(self) -> Tuple[int, int]:
+        """`(highest texture id, texture count)`."""
+        max_id, count = self._conn.execute('SELECT MAX(id), COUNT(*) FROM texture').fetchone()
+        return max_id or 0, count
+
+    def ids(self) -> Set[int]:
+        return {texture_id for (texture_id,) in self._conn.execute('SELECT id FROM texture')}
+
+    def urls(self, after_id: int = 0, ids: Optional[Iterable[int]] = None) -> Dict[int, str]:
+        """`{id: url}` for textures above `after_id`, or for exactly `ids` when given."""
+        if ids is None:
+            return dict(self._conn.execute('SELECT id, url FROM texture WHERE id > ?',
+                                           (after_id,)))
+        ids = list(ids)
+        found: Dict[int, str] = {}
+        for start in range(0, len(ids), _ID_CHUNK):
+            chunk = ids[start:start + _ID_CHUNK]
+            found.update(self._conn.execute(
+                f"SELECT id, url FROM texture WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk))
+        return found
+
+
+def open_reader() -> Optional[TextureReader]:
+    """A `TextureReader` on the texture database, or None to fall back to JSON-RPC."""
+    conn = _connect()
+    return TextureReader(conn) if conn is not None else None